@@ -0,0 +1,139 @@
+"""폐기된 토큰(jti) 목록 (auth/gateway 공용)
+
+각 서비스의 src/revocation_list.py는 이 파일을 가리키는 심볼릭 링크이며,
+Docker 이미지에는 빌드 시 복사된다. 목록을 채우는 로더와 인스턴스는 서비스마다 정의.
+"""
+
+import asyncio
+import hashlib
+import logging
+import math
+import time
+from datetime import datetime
+from typing import Awaitable, Callable
+
+logger = logging.getLogger(__name__)
+
+# (version, jti, expires_at) 목록을 version 오름차순으로 최대 LOAD_BATCH_SIZE개 반환하는 로더
+RevocationLoader = Callable[[int], Awaitable[list[tuple[int, str, datetime]]]]
+
+LOAD_BATCH_SIZE = 1000
+
+
+class BloomFilter:
+    """고정 크기 Bloom Filter (blake2b 기반 double hashing)"""
+
+    def __init__(self, capacity: int, error_rate: float):
+        self._size = max(8, math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self._hash_count = max(1, round(self._size / capacity * math.log(2)))
+        self._bits = bytearray((self._size + 7) // 8)
+
+    def _positions(self, item: str):
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "big")
+        h2 = int.from_bytes(digest[8:], "big") | 1
+        for i in range(self._hash_count):
+            yield (h1 + i * h2) % self._size
+
+    def add(self, item: str) -> None:
+        for pos in self._positions(item):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, item: str) -> bool:
+        return all(self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item))
+
+
+class RevocationList:
+    """폐기된 토큰(jti) 목록 (Bloom Filter + 정확한 집합)
+
+    - 대부분의 토큰은 폐기되지 않았으므로 Bloom Filter에서 즉시 음성 판정
+    - Bloom Filter 양성일 때만 정확한 집합으로 확인 (오탐 제거)
+    - version 커서로 증분 동기화, 주기적으로 전체 재구성하여 만료 항목 제거
+      (Auth가 폐기 INSERT를 직렬화하므로 version은 커밋 순서대로 보임)
+    """
+
+    def __init__(
+        self,
+        loader: RevocationLoader,
+        capacity: int,
+        error_rate: float,
+        refresh_interval: float,
+        full_reload_interval: float,
+    ):
+        self._loader = loader
+        self._capacity = capacity
+        self._error_rate = error_rate
+        self._refresh_interval = refresh_interval
+        self._full_reload_interval = full_reload_interval
+
+        self._bloom = BloomFilter(capacity, error_rate)
+        self._revoked: dict[str, datetime] = {}
+        self._version = 0
+        self._refreshed_at = 0.0
+        self._reloaded_at = 0.0
+        self._lock = asyncio.Lock()
+        # 전체 재구성 중 add()된 항목 (교체할 목록에도 반영)
+        self._added_during_reload: dict[str, datetime] | None = None
+
+    def add(self, jti: str, expires_at: datetime) -> None:
+        self._bloom.add(jti)
+        self._revoked[jti] = expires_at
+        if self._added_during_reload is not None:
+            self._added_during_reload[jti] = expires_at
+
+    def is_revoked(self, jti: str | None) -> bool:
+        if jti is None:
+            return False
+        if jti not in self._bloom:
+            return False
+        return jti in self._revoked
+
+    async def refresh(self) -> None:
+        now = time.monotonic()
+        if now - self._refreshed_at < self._refresh_interval:
+            return
+
+        async with self._lock:
+            now = time.monotonic()
+            if now - self._refreshed_at < self._refresh_interval:
+                return
+
+            try:
+                if now - self._reloaded_at >= self._full_reload_interval:
+                    await self._reload()
+                    self._reloaded_at = now
+                else:
+                    self._version = await self._load_since(
+                        self._version, self._bloom, self._revoked
+                    )
+            except Exception as e:
+                # 동기화 실패 시 기존 목록으로 계속 판정
+                logger.warning(f"Revocation list refresh failed: {e}")
+            self._refreshed_at = now
+
+    async def _reload(self) -> None:
+        # Bloom Filter는 삭제가 불가능하므로 새로 만든 뒤 교체
+        # 적재가 끝날 때까지 is_revoked는 기존 목록으로 판정
+        bloom = BloomFilter(self._capacity, self._error_rate)
+        revoked: dict[str, datetime] = {}
+        self._added_during_reload = {}
+        try:
+            version = await self._load_since(0, bloom, revoked)
+            for jti, expires_at in self._added_during_reload.items():
+                bloom.add(jti)
+                revoked[jti] = expires_at
+        finally:
+            self._added_during_reload = None
+        self._bloom, self._revoked, self._version = bloom, revoked, version
+
+    async def _load_since(
+        self, version: int, bloom: BloomFilter, revoked: dict[str, datetime]
+    ) -> int:
+        while True:
+            rows = await self._loader(version)
+            for row_version, jti, expires_at in rows:
+                bloom.add(jti)
+                revoked[jti] = expires_at
+                version = row_version
+            if len(rows) < LOAD_BATCH_SIZE:
+                return version
@@ -0,0 +1,3 @@
+-- Auth Service: revoked_tokens 테이블 삭제
+DROP INDEX IF EXISTS auth.idx_revoked_tokens_expires_at;
+DROP TABLE IF EXISTS auth.revoked_tokens;
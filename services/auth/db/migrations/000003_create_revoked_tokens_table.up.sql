@@ -0,0 +1,11 @@
+-- Auth Service: 폐기된 토큰(jti) 테이블 생성
+-- version은 검증 측이 증분 동기화할 때 사용하는 단조 증가 커서
+CREATE TABLE auth.revoked_tokens (
+    version BIGSERIAL PRIMARY KEY,
+    jti VARCHAR(64) NOT NULL UNIQUE,
+    expires_at TIMESTAMPTZ NOT NULL,
+    revoked_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+-- 만료된 항목 정리용 인덱스
+CREATE INDEX idx_revoked_tokens_expires_at ON auth.revoked_tokens(expires_at);
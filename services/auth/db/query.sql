@@ -3,6 +3,18 @@ INSERT INTO auth.users (email, password_hash, name)
 VALUES ($1, $2, $3)
 RETURNING id, email, name, created_at, updated_at;
 
+-- name: CreateUserIfNotExists :one
+INSERT INTO auth.users (email, password_hash, name)
+VALUES ($1, $2, $3)
+ON CONFLICT (email) DO NOTHING
+RETURNING id, email, name, created_at, updated_at;
+
+-- name: BulkCreateUsers :many
+INSERT INTO auth.users (email, password_hash, name)
+SELECT unnest(@emails::text[]), unnest(@password_hashes::text[]), unnest(@names::text[])
+ON CONFLICT (email) DO NOTHING
+RETURNING id, email;
+
 -- name: GetUserByID :one
 SELECT id, email, password_hash, name, created_at, updated_at
 FROM auth.users
@@ -27,3 +39,24 @@ RETURNING id, email, name, created_at, updated_at;
 -- name: DeleteUser :exec
 DELETE FROM auth.users
 WHERE id = $1;
+
+-- 트랜잭션 advisory lock으로 INSERT를 직렬화하여 version 할당 순서와 커밋 순서를 일치시킴
+-- (먼저 할당된 version이 늦게 커밋되면 version > 커서 증분 조회에서 누락됨)
+-- name: RevokeToken :exec
+WITH serialize AS (
+    SELECT pg_advisory_xact_lock(hashtext('auth.revoked_tokens'))
+)
+INSERT INTO auth.revoked_tokens (jti, expires_at)
+SELECT $1::varchar, $2::timestamptz FROM serialize
+ON CONFLICT (jti) DO NOTHING;
+
+-- name: ListRevokedTokensSince :many
+SELECT version, jti, expires_at
+FROM auth.revoked_tokens
+WHERE version > $1 AND expires_at > NOW()
+ORDER BY version
+LIMIT $2;
+
+-- name: DeleteExpiredRevokedTokens :exec
+DELETE FROM auth.revoked_tokens
+WHERE expires_at <= NOW();
@@ -11,3 +11,12 @@ CREATE TABLE auth.users (
 );
 
 CREATE INDEX idx_users_email ON auth.users(email);
+
+CREATE TABLE auth.revoked_tokens (
+    version BIGSERIAL PRIMARY KEY,
+    jti VARCHAR(64) NOT NULL UNIQUE,
+    expires_at TIMESTAMPTZ NOT NULL,
+    revoked_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE INDEX idx_revoked_tokens_expires_at ON auth.revoked_tokens(expires_at);
@@ -18,6 +18,42 @@ class Settings(BaseSettings):
     def database_url(self) -> str:
         return f"postgresql+asyncpg://{self.db_user}:{self.db_password}@{self.db_host}:{self.db_port}/{self.db_name}"
 
+    # Redis
+    redis_host: str = "localhost"
+    redis_port: int = 6379
+    redis_db: int = 0
+
+    @property
+    def redis_url(self) -> str:
+        return f"redis://{self.redis_host}:{self.redis_port}/{self.redis_db}"
+
+    # User Cache (in-process LRU + 선택적 Redis 2차 캐시)
+    enable_user_cache: bool = False
+    user_cache_ttl: int = 3600  # 액세스 토큰 만료 후 refresh 폭주를 흡수하도록 토큰 수명 이상
+    user_cache_max_size: int = 100_000
+    user_cache_redis: bool = False
+
+    # 로그인 시도 제한 (이메일별/IP별 sliding window + exponential backoff)
+    login_throttle_enabled: bool = True
+    login_throttle_redis: bool = False  # True면 Redis로 인스턴스 간 실패 기록 공유
+    login_throttle_window: int = 900  # 실패 집계 구간 (초)
+    login_throttle_max_email_failures: int = 5
+    # IP별 한도 (0이면 비활성화, NAT/부하 테스트처럼 한 IP에서 많은 로그인이 오는 환경 고려)
+    login_throttle_max_ip_failures: int = 0
+    login_throttle_backoff_base: float = 30.0  # 한도 도달 시 대기 시간 (초, 초과 1회마다 2배)
+    login_throttle_backoff_max: float = 300.0
+    login_throttle_max_keys: int = 100_000  # 메모리 모드 최대 추적 키 수
+
+    # 관리자 API (비어 있으면 비활성화, X-Admin-Key 헤더로 전달)
+    admin_api_key: str = ""
+    # 내부 서비스용 API (/auth/revocations, 비어 있으면 비활성화, X-Internal-Token 헤더로 전달)
+    internal_api_token: str = ""
+
+    # 사용자 일괄 등록
+    bulk_register_batch_size: int = 500  # 해시 + multi-row INSERT 단위
+    bulk_register_max_users: int = 100_000  # 요청당 최대 사용자 수
+    bulk_hash_workers: int = 0  # bcrypt 프로세스 풀 크기 (0이면 CPU 코어 수)
+
     # JWT
     jwt_secret_key: str = "your-secret-key-change-in-production"
     jwt_algorithm: str = "HS256"
@@ -25,6 +61,19 @@ class Settings(BaseSettings):
     jwt_refresh_token_expire_days: int = 7
     jwt_skip_verification: bool = False  # Kong JWT 플러그인 사용 시 True
 
+    # JWT 비대칭 서명 (jwt_algorithm=ES256)
+    # - 디렉터리의 {kid}.pem 개인키를 모두 로드하여 JWKS로 공개
+    # - 로테이션: 새 키 추가 → active kid 변경 → 토큰 만료 후 이전 키 제거
+    jwt_private_keys_dir: str = ""
+    jwt_active_kid: str = ""  # 비어 있으면 파일명 기준 가장 최신 키
+    jwks_cache_max_age: int = 300  # JWKS 응답 Cache-Control max-age (초)
+
+    # 토큰 폐기 (jti denylist)
+    revocation_refresh_interval: float = 5.0  # 증분 동기화 주기 (초)
+    revocation_full_reload_interval: float = 600.0  # 전체 재구성 주기 (초, 만료 항목 제거)
+    revocation_bloom_capacity: int = 100_000
+    revocation_bloom_error_rate: float = 0.001
+
     # OpenTelemetry
     otel_enabled: bool = False
     otel_service_name: str = "auth-service"
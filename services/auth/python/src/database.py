@@ -1,6 +1,7 @@
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
+from redis.asyncio import Redis
 from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, create_async_engine
 
 from src.config import settings
@@ -11,6 +12,23 @@ engine: AsyncEngine = create_async_engine(
     pool_pre_ping=True,
 )
 
+# Redis 연결 (사용자 캐시/로그인 시도 제한 Redis 모드에서만 사용)
+redis_client: Redis | None = None
+
+
+async def get_redis() -> Redis | None:
+    global redis_client
+    if (settings.user_cache_redis or settings.login_throttle_redis) and redis_client is None:
+        redis_client = Redis.from_url(settings.redis_url, decode_responses=True)
+    return redis_client
+
+
+async def close_redis():
+    global redis_client
+    if redis_client:
+        await redis_client.close()
+        redis_client = None
+
 
 @asynccontextmanager
 async def get_connection() -> AsyncGenerator[AsyncConnection, None]:
@@ -6,6 +6,14 @@ import datetime
 import uuid
 
 
+@dataclasses.dataclass()
+class AuthRevokedToken:
+    version: int
+    jti: str
+    expires_at: datetime.datetime
+    revoked_at: datetime.datetime
+
+
 @dataclasses.dataclass()
 class AuthUser:
     id: uuid.UUID
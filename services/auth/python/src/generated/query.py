@@ -4,7 +4,7 @@
 # source: query.sql
 import dataclasses
 import datetime
-from typing import Optional
+from typing import AsyncIterator, List, Optional
 import uuid
 
 import sqlalchemy
@@ -13,6 +13,20 @@ import sqlalchemy.ext.asyncio
 from src.generated import models
 
 
+BULK_CREATE_USERS = """-- name: bulk_create_users \\:many
+INSERT INTO auth.users (email, password_hash, name)
+SELECT unnest(:p1\\:\\:text[]), unnest(:p2\\:\\:text[]), unnest(:p3\\:\\:text[])
+ON CONFLICT (email) DO NOTHING
+RETURNING id, email
+"""
+
+
+@dataclasses.dataclass()
+class BulkCreateUsersRow:
+    id: uuid.UUID
+    email: str
+
+
 CREATE_USER = """-- name: create_user \\:one
 INSERT INTO auth.users (email, password_hash, name)
 VALUES (:p1, :p2, :p3)
@@ -29,6 +43,29 @@ class CreateUserRow:
     updated_at: datetime.datetime
 
 
+CREATE_USER_IF_NOT_EXISTS = """-- name: create_user_if_not_exists \\:one
+INSERT INTO auth.users (email, password_hash, name)
+VALUES (:p1, :p2, :p3)
+ON CONFLICT (email) DO NOTHING
+RETURNING id, email, name, created_at, updated_at
+"""
+
+
+@dataclasses.dataclass()
+class CreateUserIfNotExistsRow:
+    id: uuid.UUID
+    email: str
+    name: str
+    created_at: datetime.datetime
+    updated_at: datetime.datetime
+
+
+DELETE_EXPIRED_REVOKED_TOKENS = """-- name: delete_expired_revoked_tokens \\:exec
+DELETE FROM auth.revoked_tokens
+WHERE expires_at <= NOW()
+"""
+
+
 DELETE_USER = """-- name: delete_user \\:exec
 DELETE FROM auth.users
 WHERE id = :p1
@@ -56,6 +93,33 @@ WHERE id = :p1
 """
 
 
+LIST_REVOKED_TOKENS_SINCE = """-- name: list_revoked_tokens_since \\:many
+SELECT version, jti, expires_at
+FROM auth.revoked_tokens
+WHERE version > :p1 AND expires_at > NOW()
+ORDER BY version
+LIMIT :p2
+"""
+
+
+@dataclasses.dataclass()
+class ListRevokedTokensSinceRow:
+    version: int
+    jti: str
+    expires_at: datetime.datetime
+
+
+REVOKE_TOKEN = """-- name: revoke_token \\:exec
+
+WITH serialize AS (
+    SELECT pg_advisory_xact_lock(hashtext('auth.revoked_tokens'))
+)
+INSERT INTO auth.revoked_tokens (jti, expires_at)
+SELECT :p1\\:\\:varchar, :p2\\:\\:timestamptz FROM serialize
+ON CONFLICT (jti) DO NOTHING
+"""
+
+
 UPDATE_USER = """-- name: update_user \\:one
 UPDATE auth.users
 SET name = :p2, updated_at = NOW()
@@ -77,6 +141,14 @@ class AsyncQuerier:
     def __init__(self, conn: sqlalchemy.ext.asyncio.AsyncConnection):
         self._conn = conn
 
+    async def bulk_create_users(self, *, emails: List[str], password_hashes: List[str], names: List[str]) -> AsyncIterator[BulkCreateUsersRow]:
+        result = await self._conn.stream(sqlalchemy.text(BULK_CREATE_USERS), {"p1": emails, "p2": password_hashes, "p3": names})
+        async for row in result:
+            yield BulkCreateUsersRow(
+                id=row[0],
+                email=row[1],
+            )
+
     async def create_user(self, *, email: str, password_hash: str, name: str) -> Optional[CreateUserRow]:
         row = (await self._conn.execute(sqlalchemy.text(CREATE_USER), {"p1": email, "p2": password_hash, "p3": name})).first()
         if row is None:
@@ -89,6 +161,21 @@ class AsyncQuerier:
             updated_at=row[4],
         )
 
+    async def create_user_if_not_exists(self, *, email: str, password_hash: str, name: str) -> Optional[CreateUserIfNotExistsRow]:
+        row = (await self._conn.execute(sqlalchemy.text(CREATE_USER_IF_NOT_EXISTS), {"p1": email, "p2": password_hash, "p3": name})).first()
+        if row is None:
+            return None
+        return CreateUserIfNotExistsRow(
+            id=row[0],
+            email=row[1],
+            name=row[2],
+            created_at=row[3],
+            updated_at=row[4],
+        )
+
+    async def delete_expired_revoked_tokens(self) -> None:
+        await self._conn.execute(sqlalchemy.text(DELETE_EXPIRED_REVOKED_TOKENS))
+
     async def delete_user(self, *, id: uuid.UUID) -> None:
         await self._conn.execute(sqlalchemy.text(DELETE_USER), {"p1": id})
 
@@ -124,6 +211,18 @@ class AsyncQuerier:
             updated_at=row[5],
         )
 
+    async def list_revoked_tokens_since(self, *, version: int, limit: int) -> AsyncIterator[ListRevokedTokensSinceRow]:
+        result = await self._conn.stream(sqlalchemy.text(LIST_REVOKED_TOKENS_SINCE), {"p1": version, "p2": limit})
+        async for row in result:
+            yield ListRevokedTokensSinceRow(
+                version=row[0],
+                jti=row[1],
+                expires_at=row[2],
+            )
+
+    async def revoke_token(self, *, jti: str, expires_at: datetime.datetime) -> None:
+        await self._conn.execute(sqlalchemy.text(REVOKE_TOKEN), {"p1": jti, "p2": expires_at})
+
     async def update_user(self, *, id: uuid.UUID, name: str) -> Optional[UpdateUserRow]:
         row = (await self._conn.execute(sqlalchemy.text(UPDATE_USER), {"p1": id, "p2": name})).first()
         if row is None:
@@ -0,0 +1,124 @@
+import base64
+import json
+import logging
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+
+from src.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def _b64url_uint(value: int, length: int) -> str:
+    return base64.urlsafe_b64encode(value.to_bytes(length, "big")).rstrip(b"=").decode()
+
+
+@dataclass(frozen=True)
+class SigningKey:
+    kid: str
+    private_pem: str
+    public_pem: str
+    jwk: dict
+
+
+def _load_signing_key(kid: str, private_key: ec.EllipticCurvePrivateKey) -> SigningKey:
+    if not isinstance(private_key.curve, ec.SECP256R1):
+        raise ValueError(f"ES256 키는 P-256 곡선이어야 합니다: {kid}")
+
+    numbers = private_key.public_key().public_numbers()
+    private_pem = private_key.private_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PrivateFormat.PKCS8,
+        encryption_algorithm=serialization.NoEncryption(),
+    ).decode()
+    public_pem = private_key.public_key().public_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PublicFormat.SubjectPublicKeyInfo,
+    ).decode()
+
+    return SigningKey(
+        kid=kid,
+        private_pem=private_pem,
+        public_pem=public_pem,
+        jwk={
+            "kty": "EC",
+            "crv": "P-256",
+            "x": _b64url_uint(numbers.x, 32),
+            "y": _b64url_uint(numbers.y, 32),
+            "kid": kid,
+            "use": "sig",
+            "alg": "ES256",
+        },
+    )
+
+
+class KeyStore:
+    """ES256 서명 키 저장소 (kid 기반 키 로테이션)
+
+    - 서명은 active kid 하나로만 수행
+    - 검증/JWKS에는 로드된 모든 키를 공개 (로테이션 중 이전 토큰도 검증 가능)
+    """
+
+    def __init__(self, keys: list[SigningKey], active_kid: str):
+        self._keys = {key.kid: key for key in keys}
+        if active_kid not in self._keys:
+            raise ValueError(f"active kid를 찾을 수 없습니다: {active_kid}")
+        self._active_kid = active_kid
+
+        # JWKS 응답은 키 구성이 바뀌지 않는 한 동일하므로 한 번만 직렬화
+        self._jwks_json = json.dumps({"keys": [key.jwk for key in keys]}).encode()
+
+    @classmethod
+    def from_directory(cls, keys_dir: str, active_kid: str = "") -> "KeyStore":
+        """{kid}.pem 형식의 PKCS8 개인키 파일들을 로드"""
+        keys = []
+        for path in sorted(Path(keys_dir).glob("*.pem")):
+            private_key = serialization.load_pem_private_key(path.read_bytes(), password=None)
+            keys.append(_load_signing_key(path.stem, private_key))
+
+        if not keys:
+            raise ValueError(f"서명 키가 없습니다: {keys_dir}")
+
+        # active kid 미지정 시 파일명 기준 가장 최신 키 사용
+        return cls(keys, active_kid or keys[-1].kid)
+
+    @classmethod
+    def ephemeral(cls) -> "KeyStore":
+        """개발용 임시 키 생성 (프로세스 재시작 시 기존 토큰 무효화)"""
+        kid = f"ephemeral-{uuid.uuid4().hex[:8]}"
+        key = _load_signing_key(kid, ec.generate_private_key(ec.SECP256R1()))
+        logger.warning(f"JWT 서명 키 디렉터리가 없어 임시 키를 생성합니다: kid={kid}")
+        return cls([key], kid)
+
+    @property
+    def active(self) -> SigningKey:
+        return self._keys[self._active_kid]
+
+    def public_pem(self, kid: str | None) -> str | None:
+        if kid is None:
+            return None
+        key = self._keys.get(kid)
+        return key.public_pem if key else None
+
+    @property
+    def jwks_json(self) -> bytes:
+        return self._jwks_json
+
+
+_key_store: KeyStore | None = None
+
+
+def get_key_store() -> KeyStore:
+    global _key_store
+    if _key_store is None:
+        if settings.jwt_private_keys_dir:
+            _key_store = KeyStore.from_directory(
+                settings.jwt_private_keys_dir, settings.jwt_active_kid
+            )
+        else:
+            _key_store = KeyStore.ephemeral()
+    return _key_store
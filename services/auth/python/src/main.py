@@ -1,26 +1,73 @@
+import asyncio
+import secrets
+from contextlib import asynccontextmanager
+from typing import Any
 from uuid import UUID
 
-from fastapi import Depends, FastAPI, Header
-from fastapi.responses import JSONResponse
+from fastapi import Depends, FastAPI, Header, Query, Request
+from fastapi.responses import JSONResponse, Response
 
+from src.config import settings
+from src.keys import get_key_store
+from src.revocation import is_token_revoked
 from src.schemas import (
+    BulkRegisterResponse,
     ErrorResponse,
     HealthResponse,
     LoginRequest,
+    LogoutRequest,
     RefreshRequest,
     RegisterRequest,
+    RevokedTokensResponse,
     TokenResponse,
+    UpdateUserRequest,
     UserResponse,
     VerifyResponse,
 )
-from src.security import verify_access_token
-from src.service import AuthServiceError, get_user_by_id, login_user, refresh_tokens, register_user
+from src.security import get_token_claims
+from src.service import (
+    AuthServiceError,
+    bulk_register_users,
+    get_user_by_id,
+    list_revoked_tokens,
+    login_user,
+    logout_user,
+    refresh_tokens,
+    register_user,
+    update_user,
+)
 from src.telemetry import setup_telemetry
+from src.user_cache import get_user_cache
+
+# 사용자 캐시 무효화 구독 태스크
+_invalidation_task: asyncio.Task | None = None
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    global _invalidation_task
+
+    # Startup: 다른 인스턴스의 사용자 캐시 무효화 구독 (Redis 사용 시)
+    cache = await get_user_cache()
+    if cache is not None and cache.redis is not None:
+        _invalidation_task = asyncio.create_task(cache.listen_invalidations())
+
+    yield
+
+    # Shutdown: 백그라운드 태스크 중지
+    if _invalidation_task:
+        _invalidation_task.cancel()
+        try:
+            await _invalidation_task
+        except asyncio.CancelledError:
+            pass
+
 
 app = FastAPI(
     title="Auth Service",
     description="사용자 인증 및 JWT 토큰 관리 서비스",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 setup_telemetry(app)
@@ -31,6 +78,7 @@ async def auth_service_error_handler(request, exc: AuthServiceError):
     return JSONResponse(
         status_code=exc.status_code,
         content=ErrorResponse(error=exc.error, message=exc.message).model_dump(),
+        headers=exc.headers,
     )
 
 
@@ -42,13 +90,44 @@ def get_token_from_header(authorization: str | None = Header(default=None)) -> s
     return authorization[7:]
 
 
-def get_current_user_id(token: str | None = Depends(get_token_from_header)) -> UUID:
+def require_admin_key(x_admin_key: str | None = Header(default=None)) -> None:
+    if not settings.admin_api_key:
+        raise AuthServiceError("NOT_FOUND", "관리자 API가 비활성화되어 있습니다.", 404)
+    if x_admin_key is None or not secrets.compare_digest(x_admin_key, settings.admin_api_key):
+        raise AuthServiceError("FORBIDDEN", "관리자 권한이 필요합니다.", 403)
+
+
+def require_internal_token(x_internal_token: str | None = Header(default=None)) -> None:
+    if not settings.internal_api_token:
+        raise AuthServiceError("NOT_FOUND", "내부 API가 비활성화되어 있습니다.", 404)
+    if x_internal_token is None or not secrets.compare_digest(
+        x_internal_token, settings.internal_api_token
+    ):
+        raise AuthServiceError("FORBIDDEN", "내부 서비스 권한이 필요합니다.", 403)
+
+
+def get_client_ip(request: Request) -> str | None:
+    # Kong이 X-Forwarded-For 끝에 실제 접속 IP를 추가하므로 마지막 값을 사용
+    # (앞쪽 값은 클라이언트가 임의로 넣을 수 있음)
+    forwarded_for = request.headers.get("x-forwarded-for")
+    if forwarded_for:
+        return forwarded_for.rsplit(",", 1)[-1].strip()
+    return request.client.host if request.client else None
+
+
+async def get_current_claims(
+    token: str | None = Depends(get_token_from_header),
+) -> dict[str, Any]:
     if token is None:
         raise AuthServiceError("UNAUTHORIZED", "인증이 필요합니다.", 401)
-    user_id = verify_access_token(token)
-    if user_id is None:
+    claims = get_token_claims(token, "access")
+    if claims is None or await is_token_revoked(claims.get("jti")):
         raise AuthServiceError("INVALID_TOKEN", "유효하지 않은 토큰입니다.", 401)
-    return user_id
+    return claims
+
+
+def get_current_user_id(claims: dict[str, Any] = Depends(get_current_claims)) -> UUID:
+    return UUID(claims["sub"])
 
 
 @app.get("/health", response_model=HealthResponse)
@@ -57,6 +136,19 @@ async def health_check():
     return HealthResponse(status="healthy", service="auth-service")
 
 
+@app.get("/.well-known/jwks.json")
+@app.get("/auth/.well-known/jwks.json")
+async def jwks():
+    """토큰 검증용 공개키 목록 (ES256 모드에서만 제공)"""
+    if settings.jwt_algorithm != "ES256":
+        raise AuthServiceError("NOT_FOUND", "비대칭 서명이 비활성화되어 있습니다.", 404)
+    return Response(
+        content=get_key_store().jwks_json,
+        media_type="application/json",
+        headers={"Cache-Control": f"public, max-age={settings.jwks_cache_max_age}"},
+    )
+
+
 @app.post("/auth/register", response_model=UserResponse, status_code=201)
 async def register(request: RegisterRequest):
     return await register_user(
@@ -66,9 +158,23 @@ async def register(request: RegisterRequest):
     )
 
 
+@app.post(
+    "/auth/admin/users/bulk",
+    response_model=BulkRegisterResponse,
+    dependencies=[Depends(require_admin_key)],
+)
+async def bulk_register(request: Request):
+    """사용자 일괄 등록 (NDJSON 본문, 부하 테스트용 사용자 시딩)"""
+    return await bulk_register_users(request.stream())
+
+
 @app.post("/auth/login", response_model=TokenResponse)
-async def login(request: LoginRequest):
-    return await login_user(email=request.email, password=request.password)
+async def login(request: LoginRequest, http_request: Request):
+    return await login_user(
+        email=request.email,
+        password=request.password,
+        client_ip=get_client_ip(http_request),
+    )
 
 
 @app.post("/auth/refresh", response_model=TokenResponse)
@@ -76,6 +182,27 @@ async def refresh(request: RefreshRequest):
     return await refresh_tokens(refresh_token=request.refresh_token)
 
 
+@app.post("/auth/logout", status_code=204)
+async def logout(
+    request: LogoutRequest | None = None,
+    claims: dict[str, Any] = Depends(get_current_claims),
+):
+    await logout_user(claims, refresh_token=request.refresh_token if request else None)
+
+
+@app.get(
+    "/auth/revocations",
+    response_model=RevokedTokensResponse,
+    dependencies=[Depends(require_internal_token)],
+)
+async def revocations(
+    since: int = Query(default=0, ge=0),
+    limit: int = Query(default=1000, ge=1, le=1000),
+):
+    """폐기된 토큰 증분 조회 (로컬 검증을 수행하는 Gateway 등 내부 서비스용)"""
+    return await list_revoked_tokens(since=since, limit=limit)
+
+
 @app.get("/auth/verify", response_model=VerifyResponse)
 async def verify(user_id: UUID = Depends(get_current_user_id)):
     return VerifyResponse(valid=True, user_id=user_id)
@@ -84,3 +211,8 @@ async def verify(user_id: UUID = Depends(get_current_user_id)):
 @app.get("/auth/users/me", response_model=UserResponse)
 async def get_me(user_id: UUID = Depends(get_current_user_id)):
     return await get_user_by_id(user_id)
+
+
+@app.patch("/auth/users/me", response_model=UserResponse)
+async def update_me(request: UpdateUserRequest, user_id: UUID = Depends(get_current_user_id)):
+    return await update_user(user_id, name=request.name)
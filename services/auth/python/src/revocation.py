@@ -0,0 +1,48 @@
+from datetime import datetime, timezone
+
+from src.config import settings
+from src.database import get_connection
+from src.generated.query import AsyncQuerier
+from src.revocation_list import LOAD_BATCH_SIZE, RevocationList
+
+
+async def load_revoked_tokens_since(version: int) -> list[tuple[int, str, datetime]]:
+    async with get_connection() as conn:
+        querier = AsyncQuerier(conn)
+        if version == 0:
+            # 전체 재구성 시점에 만료된 항목 정리
+            await querier.delete_expired_revoked_tokens()
+            await conn.commit()
+        return [
+            (row.version, row.jti, row.expires_at)
+            async for row in querier.list_revoked_tokens_since(
+                version=version, limit=LOAD_BATCH_SIZE
+            )
+        ]
+
+
+revocation_list = RevocationList(
+    loader=load_revoked_tokens_since,
+    capacity=settings.revocation_bloom_capacity,
+    error_rate=settings.revocation_bloom_error_rate,
+    refresh_interval=settings.revocation_refresh_interval,
+    full_reload_interval=settings.revocation_full_reload_interval,
+)
+
+
+async def is_token_revoked(jti: str | None) -> bool:
+    await revocation_list.refresh()
+    return revocation_list.is_revoked(jti)
+
+
+async def revoke_token(jti: str, expires_at: datetime) -> None:
+    if expires_at <= datetime.now(timezone.utc):
+        return  # 이미 만료된 토큰은 기록할 필요 없음
+
+    async with get_connection() as conn:
+        querier = AsyncQuerier(conn)
+        await querier.revoke_token(jti=jti, expires_at=expires_at)
+        await conn.commit()
+
+    # 다음 동기화를 기다리지 않고 현재 인스턴스에 즉시 반영
+    revocation_list.add(jti, expires_at)
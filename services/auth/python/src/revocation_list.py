@@ -0,0 +1 @@
+../../../../libs/python/revocation_list.py
\ No newline at end of file
@@ -1,4 +1,5 @@
 from datetime import datetime
+from typing import Literal
 from uuid import UUID
 
 from pydantic import BaseModel, EmailStr, Field
@@ -19,6 +20,14 @@ class RefreshRequest(BaseModel):
     refresh_token: str
 
 
+class UpdateUserRequest(BaseModel):
+    name: str = Field(min_length=2, max_length=50)
+
+
+class LogoutRequest(BaseModel):
+    refresh_token: str | None = None
+
+
 class TokenResponse(BaseModel):
     access_token: str
     refresh_token: str
@@ -38,6 +47,32 @@ class UserResponse(BaseModel):
     created_at: datetime
 
 
+class RevokedTokenResponse(BaseModel):
+    version: int
+    jti: str
+    expires_at: datetime
+
+
+class RevokedTokensResponse(BaseModel):
+    items: list[RevokedTokenResponse]
+    version: int  # 다음 요청의 since 값
+
+
+class BulkRegisterResult(BaseModel):
+    line: int  # 요청 본문의 줄 번호 (1부터)
+    email: str | None = None
+    status: Literal["created", "duplicate", "invalid"]
+    id: UUID | None = None
+    message: str | None = None
+
+
+class BulkRegisterResponse(BaseModel):
+    created: int
+    duplicates: int
+    invalid: int
+    results: list[BulkRegisterResult]
+
+
 class ErrorResponse(BaseModel):
     error: str
     message: str
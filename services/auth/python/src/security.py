@@ -1,11 +1,17 @@
+import asyncio
+import math
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta, timezone
 from typing import Any
-from uuid import UUID
+from uuid import UUID, uuid4
 
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 
 from src.config import settings
+from src.keys import get_key_store
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
@@ -14,10 +20,65 @@ def hash_password(password: str) -> str:
     return pwd_context.hash(password)
 
 
+def hash_passwords(passwords: list[str]) -> list[str]:
+    """여러 비밀번호 일괄 해시 (프로세스 풀 작업 단위, IPC 횟수 절감)"""
+    return [pwd_context.hash(password) for password in passwords]
+
+
+# bcrypt 일괄 해시용 프로세스 풀 (lazy initialization)
+_hash_pool: ProcessPoolExecutor | None = None
+_hash_workers = settings.bulk_hash_workers or os.cpu_count() or 1
+
+
+def _get_hash_pool() -> ProcessPoolExecutor:
+    global _hash_pool
+    if _hash_pool is None:
+        # 이벤트 루프/DB 커넥션을 가진 프로세스를 fork하지 않도록 spawn 사용
+        _hash_pool = ProcessPoolExecutor(
+            max_workers=_hash_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _hash_pool
+
+
+async def hash_passwords_parallel(passwords: list[str]) -> list[str]:
+    """비밀번호 목록을 워커 수만큼 나누어 프로세스 풀에서 병렬 해시 (입력 순서 유지)"""
+    if not passwords:
+        return []
+    loop = asyncio.get_running_loop()
+    pool = _get_hash_pool()
+    size = math.ceil(len(passwords) / _hash_workers)
+    chunks = await asyncio.gather(
+        *(
+            loop.run_in_executor(pool, hash_passwords, passwords[i : i + size])
+            for i in range(0, len(passwords), size)
+        )
+    )
+    return [password_hash for chunk in chunks for password_hash in chunk]
+
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
+def _is_asymmetric() -> bool:
+    return settings.jwt_algorithm == "ES256"
+
+
+def _encode(claims: dict[str, Any]) -> str:
+    if _is_asymmetric():
+        key = get_key_store().active
+        return jwt.encode(claims, key.private_pem, algorithm="ES256", headers={"kid": key.kid})
+    return jwt.encode(claims, settings.jwt_secret_key, algorithm=settings.jwt_algorithm)
+
+
+def _verification_key(token: str) -> str | None:
+    if _is_asymmetric():
+        # kid로 공개키 선택 (로테이션 중 이전 키로 서명된 토큰도 검증)
+        return get_key_store().public_pem(jwt.get_unverified_header(token).get("kid"))
+    return settings.jwt_secret_key
+
+
 def create_access_token(user_id: UUID) -> str:
     expire = datetime.now(timezone.utc) + timedelta(minutes=settings.jwt_access_token_expire_minutes)
     to_encode: dict[str, Any] = {
@@ -25,8 +86,9 @@ def create_access_token(user_id: UUID) -> str:
         "exp": expire,
         "type": "access",
         "iss": "flash-deals",
+        "jti": uuid4().hex,
     }
-    return jwt.encode(to_encode, settings.jwt_secret_key, algorithm=settings.jwt_algorithm)
+    return _encode(to_encode)
 
 
 def create_refresh_token(user_id: UUID) -> str:
@@ -36,46 +98,51 @@ def create_refresh_token(user_id: UUID) -> str:
         "exp": expire,
         "type": "refresh",
         "iss": "flash-deals",
+        "jti": uuid4().hex,
     }
-    return jwt.encode(to_encode, settings.jwt_secret_key, algorithm=settings.jwt_algorithm)
+    return _encode(to_encode)
 
 
 def decode_token(token: str) -> dict[str, Any] | None:
     try:
+        key = _verification_key(token)
+        if key is None:
+            return None
         if settings.jwt_skip_verification:
             # Kong이 이미 검증했으므로 decode만 수행 (서명 검증 스킵)
             payload = jwt.decode(
                 token,
-                settings.jwt_secret_key,
+                key,
                 algorithms=[settings.jwt_algorithm],
                 options={"verify_signature": False},
             )
         else:
-            payload = jwt.decode(token, settings.jwt_secret_key, algorithms=[settings.jwt_algorithm])
+            payload = jwt.decode(token, key, algorithms=[settings.jwt_algorithm])
         return payload
     except JWTError:
         return None
 
 
-def verify_access_token(token: str) -> UUID | None:
+def get_token_claims(token: str, token_type: str) -> dict[str, Any] | None:
     payload = decode_token(token)
     if payload is None:
         return None
-    if payload.get("type") != "access":
+    if payload.get("type") != token_type:
         return None
-    user_id = payload.get("sub")
-    if user_id is None:
+    if payload.get("sub") is None:
         return None
-    return UUID(user_id)
+    return payload
 
 
-def verify_refresh_token(token: str) -> UUID | None:
-    payload = decode_token(token)
+def verify_access_token(token: str) -> UUID | None:
+    payload = get_token_claims(token, "access")
     if payload is None:
         return None
-    if payload.get("type") != "refresh":
-        return None
-    user_id = payload.get("sub")
-    if user_id is None:
+    return UUID(payload["sub"])
+
+
+def verify_refresh_token(token: str) -> UUID | None:
+    payload = get_token_claims(token, "refresh")
+    if payload is None:
         return None
-    return UUID(user_id)
+    return UUID(payload["sub"])
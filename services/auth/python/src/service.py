@@ -1,59 +1,228 @@
+import asyncio
+import math
+import tempfile
+from datetime import datetime, timezone
+from typing import IO, Any, AsyncIterator
 from uuid import UUID
 
+from pydantic import ValidationError
+
 from src.config import settings
 from src.database import get_connection
 from src.generated.query import AsyncQuerier
-from src.schemas import TokenResponse, UserResponse
+from src.revocation import is_token_revoked, revoke_token
+from src.schemas import (
+    BulkRegisterResponse,
+    BulkRegisterResult,
+    RegisterRequest,
+    RevokedTokenResponse,
+    RevokedTokensResponse,
+    TokenResponse,
+    UserResponse,
+)
 from src.security import (
     create_access_token,
     create_refresh_token,
+    get_token_claims,
     hash_password,
+    hash_passwords_parallel,
     verify_password,
-    verify_refresh_token,
 )
+from src.throttle import get_login_throttle
+from src.user_cache import get_user_cache
+
+# 일괄 등록 본문을 메모리에 두는 최대 크기 (초과분은 임시 파일)
+_BULK_SPOOL_MEMORY_SIZE = 8 * 1024 * 1024
 
 
 class AuthServiceError(Exception):
-    def __init__(self, error: str, message: str, status_code: int = 400):
+    def __init__(
+        self,
+        error: str,
+        message: str,
+        status_code: int = 400,
+        headers: dict[str, str] | None = None,
+    ):
         self.error = error
         self.message = message
         self.status_code = status_code
+        self.headers = headers
         super().__init__(message)
 
 
+def _to_user_response(user) -> UserResponse:
+    return UserResponse(
+        id=user.id,
+        email=user.email,
+        name=user.name,
+        created_at=user.created_at,
+    )
+
+
 async def register_user(email: str, password: str, name: str) -> UserResponse:
+    # bcrypt 해시는 이벤트 루프를 막지 않도록 스레드에서 수행 (GIL 해제)
+    password_hash = await asyncio.to_thread(hash_password, password)
+
     async with get_connection() as conn:
+        # 단일 INSERT만 수행하므로 BEGIN/COMMIT 왕복 생략
+        await conn.execution_options(isolation_level="AUTOCOMMIT")
         querier = AsyncQuerier(conn)
 
-        exists = await querier.exists_user_by_email(email=email)
-        if exists:
+        # 사전 존재 확인 없이 한 번의 왕복, 이미 존재하는 이메일이면 ON CONFLICT DO NOTHING으로 None
+        user = await querier.create_user_if_not_exists(
+            email=email, password_hash=password_hash, name=name
+        )
+        if user is None:
             raise AuthServiceError("EMAIL_EXISTS", "이미 존재하는 이메일입니다.", 409)
 
-        password_hash = hash_password(password)
-        user = await querier.create_user(email=email, password_hash=password_hash, name=name)
+        response = _to_user_response(user)
+
+    cache = await get_user_cache()
+    if cache is not None:
+        await cache.set(response, cache.generation())
+
+    return response
+
+
+async def _iter_lines(body: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    buffer = b""
+    async for chunk in body:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            yield line
+    if buffer:
+        yield buffer
+
+
+async def _insert_users(batch: list[tuple[BulkRegisterResult, RegisterRequest]]) -> None:
+    password_hashes = await hash_passwords_parallel([request.password for _, request in batch])
+
+    async with get_connection() as conn:
+        querier = AsyncQuerier(conn)
+        # ON CONFLICT DO NOTHING: 이미 존재하는 이메일은 RETURNING에 포함되지 않음
+        created = {
+            row.email: row.id
+            async for row in querier.bulk_create_users(
+                emails=[request.email for _, request in batch],
+                password_hashes=password_hashes,
+                names=[request.name for _, request in batch],
+            )
+        }
         await conn.commit()
 
-        if user is None:
-            raise AuthServiceError("CREATE_FAILED", "사용자 생성에 실패했습니다.", 500)
+    for result, request in batch:
+        if request.email in created:
+            result.status = "created"
+            result.id = created[request.email]
+        else:
+            result.message = "이미 존재하는 이메일입니다."
 
-        return UserResponse(
-            id=user.id,
-            email=user.email,
-            name=user.name,
-            created_at=user.created_at,
-        )
 
+async def _spool_lines(body: AsyncIterator[bytes]) -> IO[bytes]:
+    """본문을 임시 파일에 모으며 사용자 수 확인 (한도 초과 시 아무것도 등록하지 않고 413)"""
+    spool = tempfile.SpooledTemporaryFile(max_size=_BULK_SPOOL_MEMORY_SIZE)
+    count = 0
+    async for line in _iter_lines(body):
+        if line.strip():
+            count += 1
+            if count > settings.bulk_register_max_users:
+                spool.close()
+                raise AuthServiceError(
+                    "TOO_MANY_USERS",
+                    f"한 번에 최대 {settings.bulk_register_max_users}명까지 등록할 수 있습니다.",
+                    413,
+                )
+        spool.write(line + b"\n")
+    spool.seek(0)
+    return spool
+
+
+async def bulk_register_users(body: AsyncIterator[bytes]) -> BulkRegisterResponse:
+    """NDJSON 스트림(한 줄에 RegisterRequest 하나)으로 사용자 일괄 등록
+
+    - 본문을 먼저 끝까지 받아 사용자 수 한도를 확인 (초과 시 일부만 등록되지 않도록)
+    - batch 단위로 비밀번호를 병렬 해시하고 multi-row INSERT
+    - 요청 내 중복 이메일은 해시/INSERT 없이 duplicate 처리
+    """
+    results: list[BulkRegisterResult] = []
+    batch: list[tuple[BulkRegisterResult, RegisterRequest]] = []
+    seen: set[str] = set()
+
+    with await _spool_lines(body) as lines:
+        for line_no, line in enumerate(lines, start=1):
+            if not line.strip():
+                continue
+
+            try:
+                request = RegisterRequest.model_validate_json(line)
+            except ValidationError as e:
+                error = e.errors()[0]
+                field = ".".join(str(loc) for loc in error["loc"])
+                results.append(
+                    BulkRegisterResult(
+                        line=line_no,
+                        status="invalid",
+                        message=f"{field}: {error['msg']}" if field else error["msg"],
+                    )
+                )
+                continue
+
+            result = BulkRegisterResult(line=line_no, email=request.email, status="duplicate")
+            results.append(result)
+            if request.email in seen:
+                result.message = "요청 내에서 중복된 이메일입니다."
+                continue
+            seen.add(request.email)
+
+            batch.append((result, request))
+            if len(batch) >= settings.bulk_register_batch_size:
+                await _insert_users(batch)
+                batch = []
+
+    if batch:
+        await _insert_users(batch)
+
+    return BulkRegisterResponse(
+        created=sum(1 for result in results if result.status == "created"),
+        duplicates=sum(1 for result in results if result.status == "duplicate"),
+        invalid=sum(1 for result in results if result.status == "invalid"),
+        results=results,
+    )
+
+
+async def login_user(email: str, password: str, client_ip: str | None = None) -> TokenResponse:
+    # DB 조회/bcrypt 검증 전에 시도 제한부터 확인
+    throttle = await get_login_throttle()
+    if throttle is not None:
+        retry_after = await throttle.retry_after(email, client_ip)
+        if retry_after > 0:
+            raise AuthServiceError(
+                "TOO_MANY_ATTEMPTS",
+                "로그인 시도가 너무 많습니다. 잠시 후 다시 시도해주세요.",
+                429,
+                headers={"Retry-After": str(math.ceil(retry_after))},
+            )
+
+    # 조회 중 회원 정보가 수정되면 캐시에 이전 값을 넣지 않도록 조회 전 세대를 기록
+    cache = await get_user_cache()
+    generation = cache.generation() if cache is not None else 0
 
-async def login_user(email: str, password: str) -> TokenResponse:
     async with get_connection() as conn:
         querier = AsyncQuerier(conn)
 
         user = await querier.get_user_by_email(email=email)
-        if user is None:
+        if user is None or not verify_password(password, user.password_hash):
+            if throttle is not None:
+                await throttle.record_failure(email, client_ip)
             raise AuthServiceError("INVALID_CREDENTIALS", "이메일 또는 비밀번호가 올바르지 않습니다.", 401)
 
-        if not verify_password(password, user.password_hash):
-            raise AuthServiceError("INVALID_CREDENTIALS", "이메일 또는 비밀번호가 올바르지 않습니다.", 401)
+        if throttle is not None:
+            await throttle.record_success(email)
+
+        # 로그인 시점에 캐시를 채워 두어 토큰 만료 후 refresh가 DB를 거치지 않도록 함
+        if cache is not None:
+            await cache.set(_to_user_response(user), generation)
 
         access_token = create_access_token(user.id)
         refresh_token = create_refresh_token(user.id)
@@ -66,15 +235,14 @@ async def login_user(email: str, password: str) -> TokenResponse:
 
 
 async def refresh_tokens(refresh_token: str) -> TokenResponse:
-    user_id = verify_refresh_token(refresh_token)
-    if user_id is None:
+    claims = get_token_claims(refresh_token, "refresh")
+    if claims is None or await is_token_revoked(claims.get("jti")):
         raise AuthServiceError("INVALID_TOKEN", "유효하지 않은 리프레시 토큰입니다.", 401)
+    user_id = UUID(claims["sub"])
 
-    async with get_connection() as conn:
-        querier = AsyncQuerier(conn)
-        user = await querier.get_user_by_id(id=user_id)
-        if user is None:
-            raise AuthServiceError("USER_NOT_FOUND", "사용자를 찾을 수 없습니다.", 401)
+    user = await _find_user(user_id)
+    if user is None:
+        raise AuthServiceError("USER_NOT_FOUND", "사용자를 찾을 수 없습니다.", 401)
 
     new_access_token = create_access_token(user_id)
     new_refresh_token = create_refresh_token(user_id)
@@ -86,16 +254,71 @@ async def refresh_tokens(refresh_token: str) -> TokenResponse:
     )
 
 
-async def get_user_by_id(user_id: UUID) -> UserResponse:
+async def _load_user(user_id: UUID) -> UserResponse | None:
     async with get_connection() as conn:
         querier = AsyncQuerier(conn)
         user = await querier.get_user_by_id(id=user_id)
+        if user is None:
+            return None
+        return _to_user_response(user)
+
+
+async def _find_user(user_id: UUID) -> UserResponse | None:
+    cache = await get_user_cache()
+    if cache is None:
+        return await _load_user(user_id)
+    return await cache.get_or_load(user_id, lambda: _load_user(user_id))
+
+
+async def get_user_by_id(user_id: UUID) -> UserResponse:
+    user = await _find_user(user_id)
+    if user is None:
+        raise AuthServiceError("USER_NOT_FOUND", "사용자를 찾을 수 없습니다.", 404)
+    return user
+
+
+async def update_user(user_id: UUID, name: str) -> UserResponse:
+    async with get_connection() as conn:
+        querier = AsyncQuerier(conn)
+        user = await querier.update_user(id=user_id, name=name)
+        await conn.commit()
+
         if user is None:
             raise AuthServiceError("USER_NOT_FOUND", "사용자를 찾을 수 없습니다.", 404)
 
-        return UserResponse(
-            id=user.id,
-            email=user.email,
-            name=user.name,
-            created_at=user.created_at,
-        )
+    cache = await get_user_cache()
+    if cache is not None:
+        await cache.invalidate(user_id)
+
+    return _to_user_response(user)
+
+
+async def _revoke_claims(claims: dict[str, Any]) -> None:
+    jti = claims.get("jti")
+    if jti is None:
+        return  # jti 도입 이전에 발급된 토큰은 만료까지 유효
+    await revoke_token(jti, datetime.fromtimestamp(claims["exp"], timezone.utc))
+
+
+async def logout_user(access_claims: dict[str, Any], refresh_token: str | None = None) -> None:
+    refresh_claims = None
+    if refresh_token is not None:
+        refresh_claims = get_token_claims(refresh_token, "refresh")
+        if refresh_claims is None or refresh_claims["sub"] != access_claims["sub"]:
+            raise AuthServiceError("INVALID_TOKEN", "유효하지 않은 리프레시 토큰입니다.", 401)
+
+    await _revoke_claims(access_claims)
+    if refresh_claims is not None:
+        await _revoke_claims(refresh_claims)
+
+
+async def list_revoked_tokens(since: int, limit: int) -> RevokedTokensResponse:
+    async with get_connection() as conn:
+        querier = AsyncQuerier(conn)
+        items = [
+            RevokedTokenResponse(version=row.version, jti=row.jti, expires_at=row.expires_at)
+            async for row in querier.list_revoked_tokens_since(version=since, limit=limit)
+        ]
+
+    version = items[-1].version if items else since
+    return RevokedTokensResponse(items=items, version=version)
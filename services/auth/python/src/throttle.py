@@ -0,0 +1,164 @@
+import time
+from collections import OrderedDict, deque
+
+from opentelemetry import metrics
+from redis.asyncio import Redis
+
+from src.config import settings
+from src.database import get_redis
+
+meter = metrics.get_meter("auth-service")
+login_failures_counter = meter.create_counter(
+    "auth.login.failures",
+    description="로그인 실패 횟수",
+)
+login_throttled_counter = meter.create_counter(
+    "auth.login.throttled",
+    description="시도 제한으로 거부된 로그인 요청 수",
+)
+
+
+class MemoryThrottleStore:
+    """프로세스 메모리 실패 기록 (키 수 제한 LRU)"""
+
+    def __init__(self, window: int, max_keys: int):
+        self.window = window
+        self.max_keys = max_keys
+        self._failures: OrderedDict[str, deque[float]] = OrderedDict()
+
+    def _prune(self, key: str, now: float) -> deque[float] | None:
+        failures = self._failures.get(key)
+        if failures is None:
+            return None
+        while failures and failures[0] <= now - self.window:
+            failures.popleft()
+        if not failures:
+            del self._failures[key]
+            return None
+        return failures
+
+    async def get(self, key: str, now: float) -> tuple[int, float]:
+        failures = self._prune(key, now)
+        if failures is None:
+            return 0, 0.0
+        return len(failures), failures[-1]
+
+    async def add(self, key: str, now: float) -> None:
+        failures = self._prune(key, now)
+        if failures is None:
+            failures = self._failures[key] = deque()
+        failures.append(now)
+        self._failures.move_to_end(key)
+        while len(self._failures) > self.max_keys:
+            self._failures.popitem(last=False)
+
+    async def clear(self, key: str) -> None:
+        self._failures.pop(key, None)
+
+
+class RedisThrottleStore:
+    """Redis 실패 기록 (인스턴스 간 공유, sorted set에 실패 시각 저장)"""
+
+    def __init__(self, redis: Redis, window: int):
+        self.redis = redis
+        self.window = window
+
+    def _key(self, key: str) -> str:
+        return f"auth:throttle:{key}"
+
+    async def get(self, key: str, now: float) -> tuple[int, float]:
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.zremrangebyscore(self._key(key), "-inf", now - self.window)
+            pipe.zcard(self._key(key))
+            pipe.zrange(self._key(key), -1, -1, withscores=True)
+            _, count, last = await pipe.execute()
+        return count, last[0][1] if last else 0.0
+
+    async def add(self, key: str, now: float) -> None:
+        async with self.redis.pipeline(transaction=False) as pipe:
+            pipe.zadd(self._key(key), {repr(now): now})
+            pipe.expire(self._key(key), self.window)
+            await pipe.execute()
+
+    async def clear(self, key: str) -> None:
+        await self.redis.delete(self._key(key))
+
+
+class LoginThrottle:
+    """로그인 시도 제한 (sliding window + exponential backoff)
+
+    - 이메일별/IP별로 window 내 실패 횟수를 집계
+    - 한도에 도달하면 마지막 실패 시점부터 backoff_base * 2^(초과 횟수) 초 동안 거부
+      (최대 backoff_max, 한도가 0인 범위는 집계하지 않음)
+    - 거부 판정은 DB 조회/bcrypt 검증 전에 수행하여 공격 트래픽이 CPU를 소모하지 않도록 함
+    - 로그인 성공 시 이메일 기록만 초기화 (IP는 여러 계정을 시도할 수 있으므로 유지)
+    """
+
+    def __init__(
+        self,
+        store: MemoryThrottleStore | RedisThrottleStore,
+        max_email_failures: int,
+        max_ip_failures: int,
+        backoff_base: float,
+        backoff_max: float,
+    ):
+        self.store = store
+        self.limits = {"email": max_email_failures, "ip": max_ip_failures}
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+
+    def _keys(self, email: str, ip: str | None) -> list[tuple[str, str]]:
+        keys = [("email", f"email:{email.lower()}")]
+        if ip and self.limits["ip"] > 0:
+            keys.append(("ip", f"ip:{ip}"))
+        return keys
+
+    async def retry_after(self, email: str, ip: str | None) -> float:
+        """재시도 가능까지 남은 시간 (초), 0이면 허용"""
+        now = time.time()
+        retry_after = 0.0
+        for scope, key in self._keys(email, ip):
+            count, last_failure = await self.store.get(key, now)
+            excess = count - self.limits[scope]
+            if excess < 0:
+                continue
+            backoff = min(self.backoff_base * (2**excess), self.backoff_max)
+            remaining = last_failure + backoff - now
+            if remaining > retry_after:
+                retry_after = remaining
+                login_throttled_counter.add(1, {"scope": scope})
+        return retry_after
+
+    async def record_failure(self, email: str, ip: str | None) -> None:
+        now = time.time()
+        for _, key in self._keys(email, ip):
+            await self.store.add(key, now)
+        login_failures_counter.add(1)
+
+    async def record_success(self, email: str) -> None:
+        await self.store.clear(f"email:{email.lower()}")
+
+
+# LoginThrottle 인스턴스 (lazy initialization)
+_login_throttle: LoginThrottle | None = None
+
+
+async def get_login_throttle() -> LoginThrottle | None:
+    global _login_throttle
+    if settings.login_throttle_enabled and _login_throttle is None:
+        redis = await get_redis()
+        if redis is not None and settings.login_throttle_redis:
+            store = RedisThrottleStore(redis, window=settings.login_throttle_window)
+        else:
+            store = MemoryThrottleStore(
+                window=settings.login_throttle_window,
+                max_keys=settings.login_throttle_max_keys,
+            )
+        _login_throttle = LoginThrottle(
+            store=store,
+            max_email_failures=settings.login_throttle_max_email_failures,
+            max_ip_failures=settings.login_throttle_max_ip_failures,
+            backoff_base=settings.login_throttle_backoff_base,
+            backoff_max=settings.login_throttle_backoff_max,
+        )
+    return _login_throttle
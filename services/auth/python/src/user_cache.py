@@ -0,0 +1,181 @@
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable
+from uuid import UUID
+
+from redis.asyncio import Redis
+
+from src.config import settings
+from src.database import get_redis
+from src.schemas import UserResponse
+
+logger = logging.getLogger(__name__)
+
+INVALIDATION_CHANNEL = "auth:user:invalidate"
+
+# 무효화 시 키를 잠시 이 값으로 덮어 두어
+# 무효화 전에 시작된 조회가 이전 값을 다시 저장하지 못하게 함
+_TOMBSTONE = "invalidated"
+_TOMBSTONE_TTL = 10  # 초
+
+_SET_UNLESS_TOMBSTONE_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[2] then
+    return 0
+end
+redis.call('SET', KEYS[1], ARGV[1], 'EX', ARGV[3])
+return 1
+"""
+
+
+class UserCache:
+    """사용자 캐시 (in-process LRU + 선택적 Redis 2차 캐시)
+
+    - 1차: 프로세스 메모리 (TTL + 최대 크기 제한 LRU)
+    - 2차: Redis (인스턴스 간 공유, 재시작 직후 DB 폭주 방지)
+    - 동일 사용자에 대한 동시 miss는 하나의 DB 조회로 합침
+    - 무효화 시 Redis pub/sub으로 모든 인스턴스의 1차 캐시 항목을 제거 (Redis 사용 시)
+    - DB 조회 전에 받은 세대(generation())를 set()에 전달, 조회 중 무효화되었으면 저장하지 않음
+    """
+
+    def __init__(self, ttl: int, max_size: int, redis: Redis | None = None):
+        self.ttl = ttl
+        self.max_size = max_size
+        self.redis = redis
+        self._local: OrderedDict[UUID, tuple[float, UserResponse]] = OrderedDict()
+        self._inflight: dict[UUID, asyncio.Future] = {}
+        # 1차 캐시 무효화 횟수 (프로세스 단위, 증가하면 진행 중이던 조회 결과는 저장하지 않음)
+        self._generation = 0
+        self._set_unless_tombstone = (
+            redis.register_script(_SET_UNLESS_TOMBSTONE_SCRIPT) if redis is not None else None
+        )
+
+    def _key(self, user_id: UUID) -> str:
+        return f"auth:user:{user_id}"
+
+    def _get_local(self, user_id: UUID) -> UserResponse | None:
+        entry = self._local.get(user_id)
+        if entry is None:
+            return None
+        expires_at, user = entry
+        if expires_at <= time.monotonic():
+            del self._local[user_id]
+            return None
+        self._local.move_to_end(user_id)
+        return user
+
+    def _set_local(self, user: UserResponse) -> None:
+        self._local[user.id] = (time.monotonic() + self.ttl, user)
+        self._local.move_to_end(user.id)
+        while len(self._local) > self.max_size:
+            self._local.popitem(last=False)
+
+    async def get(self, user_id: UUID) -> UserResponse | None:
+        user = self._get_local(user_id)
+        if user is not None:
+            return user
+
+        if self.redis is not None:
+            cached = await self.redis.get(self._key(user_id))
+            if cached and cached != _TOMBSTONE:
+                user = UserResponse.model_validate_json(cached)
+                self._set_local(user)
+                return user
+
+        return None
+
+    def generation(self) -> int:
+        """DB 조회 직전에 호출, 결과를 set()에 그대로 전달"""
+        return self._generation
+
+    async def set(self, user: UserResponse, generation: int) -> None:
+        if generation != self._generation:
+            return  # 조회 중 무효화됨
+        self._set_local(user)
+        if self._set_unless_tombstone is not None:
+            await self._set_unless_tombstone(
+                keys=[self._key(user.id)],
+                args=[user.model_dump_json(), _TOMBSTONE, self.ttl],
+            )
+
+    def _evict(self, user_id: UUID) -> None:
+        self._local.pop(user_id, None)
+        self._generation += 1
+
+    async def invalidate(self, user_id: UUID) -> None:
+        self._evict(user_id)
+        if self.redis is not None:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                pipe.set(self._key(user_id), _TOMBSTONE, ex=_TOMBSTONE_TTL)
+                pipe.publish(INVALIDATION_CHANNEL, str(user_id))
+                await pipe.execute()
+
+    async def listen_invalidations(self) -> None:
+        """다른 인스턴스의 무효화 메시지 구독 (lifespan 백그라운드 태스크)"""
+        while True:
+            try:
+                async with self.redis.pubsub() as pubsub:
+                    await pubsub.subscribe(INVALIDATION_CHANNEL)
+                    # 구독 전/재연결 중 놓친 메시지가 있을 수 있으므로 1차 캐시 전체 폐기
+                    self._local.clear()
+                    self._generation += 1
+                    async for message in pubsub.listen():
+                        if message["type"] == "message":
+                            self._evict(UUID(message["data"]))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"User cache invalidation listener failed: {e}")
+                await asyncio.sleep(1.0)
+
+    async def get_or_load(
+        self, user_id: UUID, loader: Callable[[], Awaitable[UserResponse | None]]
+    ) -> UserResponse | None:
+        user = await self.get(user_id)
+        if user is not None:
+            return user
+
+        # 이미 조회 중인 요청이 있으면 그 결과를 공유
+        while (inflight := self._inflight.get(user_id)) is not None:
+            try:
+                return await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                if not inflight.cancelled():
+                    raise  # 대기자 자신이 취소됨
+                # 조회하던 요청이 취소되면 대기자 중 하나가 이어서 조회
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[user_id] = future
+        try:
+            generation = self.generation()
+            user = await loader()
+            if user is not None:
+                await self.set(user, generation)
+            future.set_result(user)
+            return user
+        except Exception as e:
+            future.set_exception(e)
+            # 대기자가 없어도 "exception was never retrieved" 경고가 나지 않도록 소비
+            future.exception()
+            raise
+        finally:
+            # 취소(클라이언트 연결 종료 등)로 결과 없이 끝나도 대기자가 멈추지 않도록 함
+            if not future.done():
+                future.cancel()
+            del self._inflight[user_id]
+
+
+# UserCache 인스턴스 (lazy initialization)
+_user_cache: UserCache | None = None
+
+
+async def get_user_cache() -> UserCache | None:
+    global _user_cache
+    if settings.enable_user_cache and _user_cache is None:
+        _user_cache = UserCache(
+            ttl=settings.user_cache_ttl,
+            max_size=settings.user_cache_max_size,
+            redis=await get_redis(),
+        )
+    return _user_cache
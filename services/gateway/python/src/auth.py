@@ -3,6 +3,7 @@ from starlette.routing import Match, Route, Router
 
 from src.config import settings
 from src.http_client import http_client
+from src.jwks import jwks_verifier
 
 
 class PublicRouteValidator:
@@ -20,6 +21,9 @@ class PublicRouteValidator:
                 Route("/auth/register", endpoint=lambda: None, methods=["POST"]),
                 Route("/auth/login", endpoint=lambda: None, methods=["POST"]),
                 Route("/auth/refresh", endpoint=lambda: None, methods=["POST"]),
+                Route("/auth/.well-known/jwks.json", endpoint=lambda: None, methods=["GET"]),
+                # Auth (admin, Auth 서비스에서 X-Admin-Key로 검증)
+                Route("/auth/admin/users/bulk", endpoint=lambda: None, methods=["POST"]),
                 # Products (public read)
                 Route("/products", endpoint=lambda: None, methods=["GET"]),
                 Route("/products/{product_id}", endpoint=lambda: None, methods=["GET"]),
@@ -54,6 +58,9 @@ def extract_token(request: Request) -> str | None:
 
 async def verify_token(token: str) -> dict | None:
     """Auth Service를 통해 토큰 검증"""
+    if settings.jwt_local_verification:
+        return await jwks_verifier.verify(token)
+
     try:
         response = await http_client.get(
             f"{settings.auth_service_url}/auth/verify",
@@ -12,6 +12,17 @@ class Settings(BaseSettings):
     product_service_url: str = "http://localhost:8002"
     order_service_url: str = "http://localhost:8003"
 
+    # JWT 로컬 검증 (Auth JWKS 공개키로 검증, /auth/verify 호출 생략)
+    jwt_local_verification: bool = False
+    jwks_refresh_interval: int = 300  # JWKS 재조회 주기 (초)
+
+    # 토큰 폐기 목록 (로컬 검증 시 Auth에서 증분 동기화)
+    auth_internal_token: str = ""  # Auth의 INTERNAL_API_TOKEN과 같은 값 (X-Internal-Token)
+    revocation_refresh_interval: float = 5.0
+    revocation_full_reload_interval: float = 600.0
+    revocation_bloom_capacity: int = 100_000
+    revocation_bloom_error_rate: float = 0.001
+
     # OpenTelemetry
     otel_enabled: bool = False
     otel_service_name: str = "gateway"
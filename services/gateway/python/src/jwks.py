@@ -0,0 +1,77 @@
+import asyncio
+import logging
+import time
+
+from jose import JWTError, jwt
+
+from src.config import settings
+from src.http_client import http_client
+from src.revocation import is_token_revoked
+
+logger = logging.getLogger(__name__)
+
+# 알 수 없는 kid로 인한 강제 재조회 최소 간격 (잘못된 토큰으로 Auth를 두드리지 않도록)
+_FORCE_REFRESH_MIN_INTERVAL = 10.0
+
+
+class JwksVerifier:
+    """Auth 서비스 JWKS 기반 JWT 로컬 검증
+
+    - 공개키만 보유하므로 토큰 발급(서명) 권한 없음
+    - 주기적으로 JWKS를 재조회하고, 처음 보는 kid는 즉시 재조회 (키 로테이션 대응)
+    - 폐기된 토큰(jti)은 로컬 폐기 목록으로 판정
+    """
+
+    def __init__(self, jwks_url: str, refresh_interval: int):
+        self._jwks_url = jwks_url
+        self._refresh_interval = refresh_interval
+        self._keys: dict[str, dict] = {}
+        self._fetched_at = 0.0
+        self._lock = asyncio.Lock()
+
+    async def _refresh(self, min_interval: float) -> None:
+        async with self._lock:
+            # 대기 중 다른 요청이 이미 갱신한 경우 생략
+            if time.monotonic() - self._fetched_at < min_interval:
+                return
+            try:
+                response = await http_client.get(self._jwks_url, timeout=5.0)
+                response.raise_for_status()
+                self._keys = {key["kid"]: key for key in response.json()["keys"]}
+            except Exception as e:
+                # 조회 실패 시 기존 키로 계속 검증
+                logger.warning(f"JWKS refresh failed: {e}")
+            self._fetched_at = time.monotonic()
+
+    async def verify(self, token: str) -> dict | None:
+        """토큰 검증 후 /auth/verify와 동일한 형태로 반환"""
+        try:
+            kid = jwt.get_unverified_header(token).get("kid")
+        except JWTError:
+            return None
+
+        if time.monotonic() - self._fetched_at >= self._refresh_interval:
+            await self._refresh(self._refresh_interval)
+        if kid not in self._keys:
+            await self._refresh(_FORCE_REFRESH_MIN_INTERVAL)
+
+        key = self._keys.get(kid)
+        if key is None:
+            return None
+
+        try:
+            payload = jwt.decode(token, key, algorithms=["ES256"], issuer="flash-deals")
+        except JWTError:
+            return None
+
+        if payload.get("type") != "access" or payload.get("sub") is None:
+            return None
+        if await is_token_revoked(payload.get("jti")):
+            return None
+        return {"valid": True, "user_id": payload["sub"]}
+
+
+jwks_verifier = JwksVerifier(
+    jwks_url=f"{settings.auth_service_url}/auth/.well-known/jwks.json",
+    refresh_interval=settings.jwks_refresh_interval,
+)
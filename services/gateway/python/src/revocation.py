@@ -0,0 +1,34 @@
+from datetime import datetime
+
+from src.config import settings
+from src.http_client import http_client
+from src.revocation_list import LOAD_BATCH_SIZE, RevocationList
+
+
+async def load_revoked_tokens_since(version: int) -> list[tuple[int, str, datetime]]:
+    """Auth 서비스에서 폐기된 토큰 증분 조회"""
+    response = await http_client.get(
+        f"{settings.auth_service_url}/auth/revocations",
+        params={"since": version, "limit": LOAD_BATCH_SIZE},
+        headers={"X-Internal-Token": settings.auth_internal_token},
+        timeout=5.0,
+    )
+    response.raise_for_status()
+    return [
+        (item["version"], item["jti"], datetime.fromisoformat(item["expires_at"]))
+        for item in response.json()["items"]
+    ]
+
+
+revocation_list = RevocationList(
+    loader=load_revoked_tokens_since,
+    capacity=settings.revocation_bloom_capacity,
+    error_rate=settings.revocation_bloom_error_rate,
+    refresh_interval=settings.revocation_refresh_interval,
+    full_reload_interval=settings.revocation_full_reload_interval,
+)
+
+
+async def is_token_revoked(jti: str | None) -> bool:
+    await revocation_list.refresh()
+    return revocation_list.is_revoked(jti)
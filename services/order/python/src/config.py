@@ -25,6 +25,11 @@ class Settings(BaseSettings):
     product_client_type: str = "http"  # "http", "http_pool", "grpc"
     product_grpc_host: str = "product"
     product_grpc_port: int = 50051
+    product_grpc_api_version: int = 1  # 1: 문자열 ID/ISO 시각, 2: 16바이트 UUID/Timestamp
+    # 재고 변경/예약 요청을 StockStream 연결 하나로 다중화 (grpc일 때만)
+    product_grpc_stock_stream: bool = False
+    # 재고 차감 대신 예약 → 확정 흐름 사용 (Python Product Service 전용, Go 서비스는 미지원)
+    stock_reservation_enabled: bool = False
 
     # OpenTelemetry
     otel_enabled: bool = False
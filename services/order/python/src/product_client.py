@@ -1,4 +1,6 @@
+import asyncio
 import logging
+from functools import partial
 from uuid import UUID
 
 import httpx
@@ -91,6 +93,108 @@ async def get_deal(deal_id: UUID) -> dict:
     return response.json()
 
 
+# 일괄 조회(?ids=, GetProducts/GetDeals)를 지원하지 않는 서버(Go)로 확인되면 건별 조회만 사용
+_batch_lookup_supported = True
+
+
+async def _get_by_ids(path: str, ids: list[UUID]) -> dict[str, dict] | None:
+    """?ids= 목록 조회 (없는 항목은 결과에서 빠짐), ?ids=를 지원하지 않는 서버면 None"""
+    params = {"ids": ",".join(str(i) for i in ids)}
+    if settings.product_client_type == "http_pool":
+        client = await get_http_client()
+        response = await client.get(path, params=params)
+    else:
+        async with httpx.AsyncClient() as client:
+            response = await client.get(
+                f"{settings.product_service_url}{path}",
+                params=params,
+                timeout=10.0,
+            )
+
+    # 잘못된 ID나 ID 수 초과는 요청 오류이므로 그대로 전달
+    if response.status_code == 400:
+        data = response.json()
+        if data.get("error") in ("INVALID_ID", "TOO_MANY_IDS"):
+            raise ProductClientError(data["error"], data.get("message", ""), 400)
+
+    # 그 외 4xx는 경로 자체가 없는 경우 (예: Go는 /products/deals를 상품 ID로 해석)
+    if 400 <= response.status_code < 500:
+        return None
+
+    if response.status_code != 200:
+        raise ProductClientError(
+            "PRODUCT_SERVICE_ERROR",
+            f"상품 서비스 오류: {response.status_code}",
+            502,
+        )
+
+    items = {item["id"]: item for item in response.json()["items"]}
+    # ids를 무시하고 일반 목록을 돌려주는 서버 (Go)
+    if not items.keys() <= {str(i) for i in ids}:
+        return None
+    return items
+
+
+async def _get_each(get_one, ids: list[UUID], not_found: str) -> dict[str, dict]:
+    """건별 조회를 동시에 실행 (없는 항목은 결과에서 빠짐)"""
+
+    async def get(id: UUID) -> dict | None:
+        try:
+            return await get_one(id)
+        except ProductClientError as e:
+            if e.error == not_found:
+                return None
+            raise
+
+    results = await asyncio.gather(*(get(i) for i in ids))
+    return {str(i): result for i, result in zip(ids, results) if result is not None}
+
+
+async def _get_many(batch_get, get_one, ids: list[UUID], not_found: str) -> dict[str, dict]:
+    """일괄 조회 후 빠진 항목만 건별 조회 (일괄 조회 미지원 서버면 전부 건별 조회)"""
+    global _batch_lookup_supported
+    found: dict[str, dict] = {}
+    if _batch_lookup_supported:
+        batch = await batch_get(ids)
+        if batch is None:
+            logger.info("Product Service does not support batch lookups, using per-id lookups")
+            _batch_lookup_supported = False
+        else:
+            found = batch
+
+    # 일괄 조회를 지원해도 빠진 항목은 건별 조회로 확인 (없는 항목 오류 경로에서만 추가 호출)
+    missing = [i for i in ids if str(i) not in found]
+    if missing:
+        found |= await _get_each(get_one, missing, not_found)
+    return found
+
+
+async def get_products(product_ids: list[UUID]) -> dict[str, dict]:
+    """Product Service에서 상품 여러 건 조회 (가능하면 한 번의 요청), 상품 ID 문자열 → 상품"""
+    if not product_ids:
+        return {}
+
+    if settings.product_client_type == "grpc":
+        from src.product_client_grpc import get_products as batch_get
+    else:
+        batch_get = partial(_get_by_ids, "/products")
+
+    return await _get_many(batch_get, get_product, product_ids, "PRODUCT_NOT_FOUND")
+
+
+async def get_deals(deal_ids: list[UUID]) -> dict[str, dict]:
+    """Product Service에서 핫딜 여러 건 조회 (가능하면 한 번의 요청), 핫딜 ID 문자열 → 핫딜"""
+    if not deal_ids:
+        return {}
+
+    if settings.product_client_type == "grpc":
+        from src.product_client_grpc import get_deals as batch_get
+    else:
+        batch_get = partial(_get_by_ids, "/products/deals")
+
+    return await _get_many(batch_get, get_deal, deal_ids, "DEAL_NOT_FOUND")
+
+
 async def decrease_stock(product_id: UUID, quantity: int) -> dict:
     """Product Service에서 재고 감소"""
     if settings.product_client_type == "grpc":
@@ -157,3 +261,85 @@ async def increase_stock(product_id: UUID, quantity: int) -> dict:
         )
 
     return response.json()
+
+
+async def reserve_stock(items: list[tuple[UUID, int]]) -> str:
+    """Product Service에 재고 예약 (확정/취소 전에 만료되면 자동 반환), 예약 ID 반환"""
+    if settings.product_client_type == "grpc":
+        from src.product_client_grpc import reserve_stock as grpc_reserve_stock
+        return await grpc_reserve_stock(items)
+
+    body = {
+        "items": [
+            {"product_id": str(product_id), "quantity": quantity} for product_id, quantity in items
+        ]
+    }
+    if settings.product_client_type == "http_pool":
+        client = await get_http_client()
+        response = await client.post("/products/reservations", json=body)
+    else:
+        async with httpx.AsyncClient() as client:
+            response = await client.post(
+                f"{settings.product_service_url}/products/reservations",
+                json=body,
+                timeout=10.0,
+            )
+
+    if response.status_code in (400, 404):
+        data = response.json()
+        raise ProductClientError(
+            data.get("error", "INSUFFICIENT_STOCK"),
+            data.get("message", "재고가 부족합니다."),
+            response.status_code,
+        )
+
+    if response.status_code != 201:
+        raise ProductClientError(
+            "PRODUCT_SERVICE_ERROR",
+            f"재고 예약 실패: {response.status_code}",
+            502,
+        )
+
+    return response.json()["reservation_id"]
+
+
+async def commit_reservation(reservation_id: str) -> None:
+    """재고 예약 확정 (만료되었으면 RESERVATION_NOT_FOUND)"""
+    await _finish_reservation(reservation_id, "commit")
+
+
+async def release_reservation(reservation_id: str) -> None:
+    """재고 예약 취소 (이미 확정/만료 처리된 예약은 무시)"""
+    try:
+        await _finish_reservation(reservation_id, "release")
+    except ProductClientError as e:
+        if e.error != "RESERVATION_NOT_FOUND":
+            raise
+
+
+async def _finish_reservation(reservation_id: str, action: str) -> None:
+    if settings.product_client_type == "grpc":
+        from src.product_client_grpc import finish_reservation as grpc_finish_reservation
+        return await grpc_finish_reservation(reservation_id, action)
+
+    if settings.product_client_type == "http_pool":
+        client = await get_http_client()
+        response = await client.post(f"/products/reservations/{reservation_id}/{action}")
+    else:
+        async with httpx.AsyncClient() as client:
+            response = await client.post(
+                f"{settings.product_service_url}/products/reservations/{reservation_id}/{action}",
+                timeout=10.0,
+            )
+
+    if response.status_code == 404:
+        raise ProductClientError(
+            "RESERVATION_NOT_FOUND", "재고 예약을 찾을 수 없거나 만료되었습니다.", 404
+        )
+
+    if response.status_code != 200:
+        raise ProductClientError(
+            "PRODUCT_SERVICE_ERROR",
+            f"재고 예약 처리 실패: {response.status_code}",
+            502,
+        )
@@ -1,31 +1,144 @@
+import asyncio
+import itertools
 import logging
-from datetime import datetime
+from datetime import datetime, timezone
 from uuid import UUID
 
 import grpc
 
 from src.config import settings
-from src.grpc_gen import product_pb2, product_pb2_grpc
+from src.grpc_gen import product_pb2, product_pb2_grpc, product_v2_pb2, product_v2_pb2_grpc
 from src.product_client import ProductClientError
 
 logger = logging.getLogger(__name__)
 
+# API 버전 (v2: 16바이트 UUID, Timestamp 시각), Product Service는 이전 기간 동안 둘 다 제공
+_V2 = settings.product_grpc_api_version == 2
+_pb2 = product_v2_pb2 if _V2 else product_pb2
+_pb2_grpc = product_v2_pb2_grpc if _V2 else product_pb2_grpc
+
 # gRPC 채널 재사용을 위한 전역 변수
 _channel: grpc.aio.Channel | None = None
-_stub: product_pb2_grpc.ProductServiceStub | None = None
+_stub: _pb2_grpc.ProductServiceStub | None = None
 
 
-async def get_stub() -> product_pb2_grpc.ProductServiceStub:
+async def get_stub() -> _pb2_grpc.ProductServiceStub:
     """gRPC stub을 반환 (싱글톤 패턴으로 채널 재사용)"""
     global _channel, _stub
     if _stub is None:
         target = f"{settings.product_grpc_host}:{settings.product_grpc_port}"
         _channel = grpc.aio.insecure_channel(target)
-        _stub = product_pb2_grpc.ProductServiceStub(_channel)
+        _stub = _pb2_grpc.ProductServiceStub(_channel)
         logger.info(f"gRPC channel created: {target}")
     return _stub
 
 
+_STATUS_CODES = {code.value[0]: code for code in grpc.StatusCode}
+
+
+def _rpc_error(code: grpc.StatusCode, details: str) -> grpc.aio.AioRpcError:
+    """스트림 응답의 요청별 오류를 unary 호출과 같은 예외로 변환 (같은 에러 매핑 재사용)"""
+    return grpc.aio.AioRpcError(code, grpc.aio.Metadata(), grpc.aio.Metadata(), details)
+
+
+class StockStreamClient:
+    """StockStream 양방향 스트림 하나로 재고 요청을 다중화
+
+    요청마다 request_id를 붙여 쓰고, 읽기 태스크가 응답의 request_id로 대기 중인
+    요청을 깨움. 스트림이 끊기면 대기 중인 요청은 실패하고 다음 요청에서 다시 연결
+    """
+
+    def __init__(self, stub: _pb2_grpc.ProductServiceStub):
+        self._stub = stub
+        self._call: grpc.aio.StreamStreamCall | None = None
+        self._pending: dict[str, asyncio.Future] = {}
+        self._write_lock = asyncio.Lock()
+        self._request_ids = itertools.count(1)
+        self._reader: asyncio.Task | None = None  # 태스크 참조 유지용
+
+    async def request(
+        self, request: _pb2.StockStreamRequest, timeout: float
+    ) -> _pb2.StockStreamResponse:
+        request.request_id = str(next(self._request_ids))
+        future = asyncio.get_running_loop().create_future()
+
+        async with self._write_lock:
+            if self._call is None:
+                self._open()
+            call, pending = self._call, self._pending
+            pending[request.request_id] = future
+            try:
+                await call.write(request)
+            except (grpc.aio.AioRpcError, asyncio.InvalidStateError) as e:
+                # 읽기 태스크가 종료를 감지하기 전에 끊긴 스트림에 쓴 경우
+                pending.pop(request.request_id, None)
+                self._reset(call)
+                if isinstance(e, grpc.aio.AioRpcError):
+                    raise
+                raise _rpc_error(grpc.StatusCode.UNAVAILABLE, "StockStream closed") from e
+
+        try:
+            response = await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            raise _rpc_error(grpc.StatusCode.DEADLINE_EXCEEDED, "StockStream request timed out")
+        finally:
+            pending.pop(request.request_id, None)
+
+        if response.code != grpc.StatusCode.OK.value[0]:
+            code = _STATUS_CODES.get(response.code, grpc.StatusCode.UNKNOWN)
+            raise _rpc_error(code, response.details)
+        return response
+
+    def _open(self) -> None:
+        self._call = self._stub.StockStream()
+        self._pending = {}
+        self._reader = asyncio.create_task(self._read(self._call, self._pending))
+        logger.info("gRPC StockStream opened")
+
+    def _reset(self, call: grpc.aio.StreamStreamCall) -> None:
+        if self._call is call:
+            self._call = None
+            call.cancel()
+
+    async def _read(
+        self, call: grpc.aio.StreamStreamCall, pending: dict[str, asyncio.Future]
+    ) -> None:
+        error = _rpc_error(grpc.StatusCode.UNAVAILABLE, "StockStream closed")
+        try:
+            async for response in call:
+                future = pending.get(response.request_id)
+                if future is not None and not future.done():
+                    future.set_result(response)
+        except grpc.aio.AioRpcError as e:
+            error = e
+            logger.warning(f"gRPC StockStream failed: {e.code()} - {e.details()}")
+        finally:
+            self._reset(call)
+            for future in pending.values():
+                if not future.done():
+                    future.set_exception(error)
+
+
+_stock_stream: StockStreamClient | None = None
+
+
+async def get_stock_stream() -> StockStreamClient:
+    """StockStream 클라이언트 반환 (싱글톤, 채널도 get_stub과 공유)"""
+    global _stock_stream
+    if _stock_stream is None:
+        _stock_stream = StockStreamClient(await get_stub())
+    return _stock_stream
+
+
+async def _adjust_stock(request: _pb2.UpdateStockRequest) -> _pb2.StockResult:
+    if settings.product_grpc_stock_stream:
+        stream = await get_stock_stream()
+        stream_request = _pb2.StockStreamRequest(adjust=request)
+        return (await stream.request(stream_request, timeout=10.0)).stock
+    stub = await get_stub()
+    return await stub.AdjustStock(request, timeout=10.0)
+
+
 def _parse_datetime(iso_string: str) -> datetime | None:
     """ISO 형식의 문자열을 datetime으로 변환"""
     if not iso_string:
@@ -33,63 +146,99 @@ def _parse_datetime(iso_string: str) -> datetime | None:
     return datetime.fromisoformat(iso_string.replace("Z", "+00:00"))
 
 
+def _encode_id(value: UUID | str) -> str | bytes:
+    if _V2:
+        return (value if isinstance(value, UUID) else UUID(value)).bytes
+    return str(value)
+
+
+def _decode_id(value: str | bytes) -> str:
+    """응답 ID를 문자열로 (결과 dict는 v1/HTTP 클라이언트와 같은 문자열 ID 사용)"""
+    if _V2:
+        return str(UUID(bytes=value)) if value else ""
+    return value
+
+
+def _decode_time(message, field: str) -> str | datetime | None:
+    """v1은 ISO 8601 문자열 그대로, v2는 파싱 없이 datetime으로 변환"""
+    if not _V2:
+        return getattr(message, field)
+    if not message.HasField(field):
+        return None
+    # Timestamp.ToDatetime(순수 Python)보다 빠름, float 오차는 µs 반올림에 흡수됨
+    timestamp = getattr(message, field)
+    return datetime.fromtimestamp(timestamp.seconds + timestamp.nanos / 1e9, timezone.utc)
+
+
+def _product_to_dict(product: _pb2.Product) -> dict:
+    return {
+        "id": _decode_id(product.id),
+        "name": product.name,
+        "description": product.description,
+        "price": product.price,
+        "stock": product.stock,
+        "created_at": _decode_time(product, "created_at"),
+        "updated_at": _decode_time(product, "updated_at"),
+    }
+
+
+def _deal_to_dict(deal: _pb2.Deal) -> dict:
+    return {
+        "id": _decode_id(deal.id),
+        "product_id": _decode_id(deal.product_id),
+        "deal_price": deal.deal_price,
+        "deal_stock": deal.stock_limit,
+        "starts_at": _decode_time(deal, "start_time"),
+        "ends_at": _decode_time(deal, "end_time"),
+        "status": deal.status,
+        "product": _product_to_dict(deal.product) if deal.product.id else None,
+    }
+
+
 async def get_product(product_id: UUID) -> dict:
     """Product Service에서 상품 정보 조회 (gRPC)"""
     try:
         stub = await get_stub()
-        request = product_pb2.GetProductRequest(product_id=str(product_id))
+        request = _pb2.GetProductRequest(product_id=_encode_id(product_id))
         response = await stub.GetProduct(request, timeout=10.0)
 
         if not response.id:
-            raise ProductClientError("PRODUCT_NOT_FOUND", f"상품을 찾을 수 없습니다: {product_id}", 404)
+            raise ProductClientError(
+                "PRODUCT_NOT_FOUND",
+                f"상품을 찾을 수 없습니다: {product_id}",
+                404,
+            )
 
-        return {
-            "id": response.id,
-            "name": response.name,
-            "description": response.description,
-            "price": response.price,
-            "stock": response.stock,
-            "created_at": response.created_at,
-            "updated_at": response.updated_at,
-        }
+        return _product_to_dict(response)
     except grpc.aio.AioRpcError as e:
         if e.code() == grpc.StatusCode.NOT_FOUND:
-            raise ProductClientError("PRODUCT_NOT_FOUND", f"상품을 찾을 수 없습니다: {product_id}", 404)
+            raise ProductClientError(
+                "PRODUCT_NOT_FOUND",
+                f"상품을 찾을 수 없습니다: {product_id}",
+                404,
+            )
         elif e.code() == grpc.StatusCode.INVALID_ARGUMENT:
             raise ProductClientError("INVALID_PRODUCT_ID", str(e.details()), 400)
         else:
             logger.error(f"gRPC error in get_product: {e.code()} - {e.details()}")
-            raise ProductClientError("PRODUCT_SERVICE_ERROR", f"상품 서비스 오류: {e.details()}", 502)
+            raise ProductClientError(
+                "PRODUCT_SERVICE_ERROR",
+                f"상품 서비스 오류: {e.details()}",
+                502,
+            )
 
 
 async def get_deal(deal_id: UUID) -> dict:
     """Product Service에서 핫딜 정보 조회 (gRPC)"""
     try:
         stub = await get_stub()
-        request = product_pb2.GetDealRequest(deal_id=str(deal_id))
+        request = _pb2.GetDealRequest(deal_id=_encode_id(deal_id))
         response = await stub.GetDeal(request, timeout=10.0)
 
         if not response.id:
             raise ProductClientError("DEAL_NOT_FOUND", f"핫딜을 찾을 수 없습니다: {deal_id}", 404)
 
-        return {
-            "id": response.id,
-            "product_id": response.product_id,
-            "deal_price": response.deal_price,
-            "deal_stock": response.stock_limit,
-            "starts_at": response.start_time,
-            "ends_at": response.end_time,
-            "status": response.status,
-            "product": {
-                "id": response.product.id,
-                "name": response.product.name,
-                "description": response.product.description,
-                "price": response.product.price,
-                "stock": response.product.stock,
-                "created_at": response.product.created_at,
-                "updated_at": response.product.updated_at,
-            } if response.product.id else None,
-        }
+        return _deal_to_dict(response)
     except grpc.aio.AioRpcError as e:
         if e.code() == grpc.StatusCode.NOT_FOUND:
             raise ProductClientError("DEAL_NOT_FOUND", f"핫딜을 찾을 수 없습니다: {deal_id}", 404)
@@ -97,26 +246,78 @@ async def get_deal(deal_id: UUID) -> dict:
             raise ProductClientError("INVALID_DEAL_ID", str(e.details()), 400)
         else:
             logger.error(f"gRPC error in get_deal: {e.code()} - {e.details()}")
-            raise ProductClientError("PRODUCT_SERVICE_ERROR", f"상품 서비스 오류: {e.details()}", 502)
+            raise ProductClientError(
+                "PRODUCT_SERVICE_ERROR",
+                f"상품 서비스 오류: {e.details()}",
+                502,
+            )
+
+
+async def get_products(product_ids: list[UUID]) -> dict[str, dict] | None:
+    """Product Service에서 상품 여러 건 조회 (gRPC, 한 번의 호출), 없는 상품은 결과에서 빠짐
+
+    GetProducts를 지원하지 않는 서버면 None
+    """
+    try:
+        stub = await get_stub()
+        request = _pb2.GetProductsRequest(product_ids=[_encode_id(p) for p in product_ids])
+        response = await stub.GetProducts(request, timeout=10.0)
+        products = (_product_to_dict(product) for product in response.products)
+        return {product["id"]: product for product in products}
+    except grpc.aio.AioRpcError as e:
+        if e.code() == grpc.StatusCode.UNIMPLEMENTED:
+            return None  # GetProduct만 지원하는 서버 (Go)
+        if e.code() == grpc.StatusCode.INVALID_ARGUMENT:
+            raise ProductClientError("INVALID_PRODUCT_ID", str(e.details()), 400)
+        logger.error(f"gRPC error in get_products: {e.code()} - {e.details()}")
+        raise ProductClientError("PRODUCT_SERVICE_ERROR", f"상품 서비스 오류: {e.details()}", 502)
+
+
+async def get_deals(deal_ids: list[UUID]) -> dict[str, dict] | None:
+    """Product Service에서 핫딜 여러 건 조회 (gRPC, 한 번의 호출), 없는 핫딜은 결과에서 빠짐
+
+    GetDeals를 지원하지 않는 서버면 None
+    """
+    try:
+        stub = await get_stub()
+        request = _pb2.GetDealsRequest(deal_ids=[_encode_id(d) for d in deal_ids])
+        response = await stub.GetDeals(request, timeout=10.0)
+        deals = (_deal_to_dict(deal) for deal in response.deals)
+        return {deal["id"]: deal for deal in deals}
+    except grpc.aio.AioRpcError as e:
+        if e.code() == grpc.StatusCode.UNIMPLEMENTED:
+            return None  # GetDeal만 지원하는 서버 (Go)
+        if e.code() == grpc.StatusCode.INVALID_ARGUMENT:
+            raise ProductClientError("INVALID_DEAL_ID", str(e.details()), 400)
+        logger.error(f"gRPC error in get_deals: {e.code()} - {e.details()}")
+        raise ProductClientError("PRODUCT_SERVICE_ERROR", f"상품 서비스 오류: {e.details()}", 502)
 
 
 async def decrease_stock(product_id: UUID, quantity: int) -> dict:
     """Product Service에서 재고 감소 (gRPC)"""
     try:
-        stub = await get_stub()
-        request = product_pb2.UpdateStockRequest(product_id=str(product_id), delta=-quantity)
-        response = await stub.UpdateStock(request, timeout=10.0)
+        request = _pb2.UpdateStockRequest(product_id=_encode_id(product_id), delta=-quantity)
+        response = await _adjust_stock(request)
 
-        if not response.id:
-            raise ProductClientError("PRODUCT_NOT_FOUND", f"상품을 찾을 수 없습니다: {product_id}", 404)
+        if not response.product_id:
+            raise ProductClientError(
+                "PRODUCT_NOT_FOUND",
+                f"상품을 찾을 수 없습니다: {product_id}",
+                404,
+            )
 
+        # 재고만 필요하므로 상품 정보 없는 StockResult 응답 사용
         return {
-            "product_id": response.id,
+            "product_id": _decode_id(response.product_id),
             "stock": response.stock,
         }
     except grpc.aio.AioRpcError as e:
         if e.code() == grpc.StatusCode.NOT_FOUND:
-            raise ProductClientError("PRODUCT_NOT_FOUND", f"상품을 찾을 수 없습니다: {product_id}", 404)
+            raise ProductClientError(
+                "PRODUCT_NOT_FOUND",
+                f"상품을 찾을 수 없습니다: {product_id}",
+                404,
+            )
         elif e.code() == grpc.StatusCode.FAILED_PRECONDITION:
             raise ProductClientError("INSUFFICIENT_STOCK", "재고가 부족합니다.", 400)
         elif e.code() == grpc.StatusCode.INVALID_ARGUMENT:
@@ -129,22 +330,85 @@ async def decrease_stock(product_id: UUID, quantity: int) -> dict:
 async def increase_stock(product_id: UUID, quantity: int) -> dict:
     """Product Service에서 재고 증가 (gRPC) - 취소 시 사용"""
     try:
-        stub = await get_stub()
-        request = product_pb2.UpdateStockRequest(product_id=str(product_id), delta=quantity)
-        response = await stub.UpdateStock(request, timeout=10.0)
+        request = _pb2.UpdateStockRequest(product_id=_encode_id(product_id), delta=quantity)
+        response = await _adjust_stock(request)
 
-        if not response.id:
-            raise ProductClientError("PRODUCT_NOT_FOUND", f"상품을 찾을 수 없습니다: {product_id}", 404)
+        if not response.product_id:
+            raise ProductClientError(
+                "PRODUCT_NOT_FOUND",
+                f"상품을 찾을 수 없습니다: {product_id}",
+                404,
+            )
 
         return {
-            "product_id": response.id,
+            "product_id": _decode_id(response.product_id),
             "stock": response.stock,
         }
     except grpc.aio.AioRpcError as e:
         if e.code() == grpc.StatusCode.NOT_FOUND:
-            raise ProductClientError("PRODUCT_NOT_FOUND", f"상품을 찾을 수 없습니다: {product_id}", 404)
+            raise ProductClientError(
+                "PRODUCT_NOT_FOUND",
+                f"상품을 찾을 수 없습니다: {product_id}",
+                404,
+            )
         elif e.code() == grpc.StatusCode.INVALID_ARGUMENT:
             raise ProductClientError("INVALID_PRODUCT_ID", str(e.details()), 400)
         else:
             logger.error(f"gRPC error in increase_stock: {e.code()} - {e.details()}")
             raise ProductClientError("PRODUCT_SERVICE_ERROR", f"재고 복구 실패: {e.details()}", 502)
+
+
+async def reserve_stock(items: list[tuple[UUID, int]]) -> str:
+    """Product Service에 재고 예약 (gRPC), 예약 ID 반환"""
+    try:
+        request = _pb2.ReserveStockRequest(
+            items=[
+                _pb2.StockItem(product_id=_encode_id(product_id), quantity=quantity)
+                for product_id, quantity in items
+            ]
+        )
+        if settings.product_grpc_stock_stream:
+            stream = await get_stock_stream()
+            stream_request = _pb2.StockStreamRequest(reserve=request)
+            response = (await stream.request(stream_request, timeout=10.0)).reservation
+            return _decode_id(response.reservation_id)
+
+        stub = await get_stub()
+        response = await stub.ReserveStock(request, timeout=10.0)
+        return _decode_id(response.reservation_id)
+    except grpc.aio.AioRpcError as e:
+        if e.code() == grpc.StatusCode.NOT_FOUND:
+            raise ProductClientError("PRODUCT_NOT_FOUND", str(e.details()), 404)
+        elif e.code() == grpc.StatusCode.FAILED_PRECONDITION:
+            raise ProductClientError("INSUFFICIENT_STOCK", "재고가 부족합니다.", 400)
+        elif e.code() == grpc.StatusCode.INVALID_ARGUMENT:
+            raise ProductClientError("INVALID_PRODUCT_ID", str(e.details()), 400)
+        else:
+            logger.error(f"gRPC error in reserve_stock: {e.code()} - {e.details()}")
+            raise ProductClientError("PRODUCT_SERVICE_ERROR", f"재고 예약 실패: {e.details()}", 502)
+
+
+async def finish_reservation(reservation_id: str, action: str) -> None:
+    """재고 예약 확정(commit)/취소(release) (gRPC)"""
+    try:
+        request = _pb2.ReservationRequest(reservation_id=_encode_id(reservation_id))
+        if settings.product_grpc_stock_stream:
+            stream = await get_stock_stream()
+            await stream.request(_pb2.StockStreamRequest(**{action: request}), timeout=10.0)
+            return
+
+        stub = await get_stub()
+        if action == "commit":
+            await stub.CommitReservation(request, timeout=10.0)
+        else:
+            await stub.ReleaseReservation(request, timeout=10.0)
+    except grpc.aio.AioRpcError as e:
+        if e.code() == grpc.StatusCode.NOT_FOUND:
+            raise ProductClientError(
+                "RESERVATION_NOT_FOUND", "재고 예약을 찾을 수 없거나 만료되었습니다.", 404
+            )
+        else:
+            logger.error(f"gRPC error in finish_reservation: {e.code()} - {e.details()}")
+            raise ProductClientError(
+                "PRODUCT_SERVICE_ERROR", f"재고 예약 처리 실패: {e.details()}", 502
+            )
@@ -1,5 +1,8 @@
+import asyncio
+import logging
 from uuid import UUID
 
+from src.config import settings
 from src.database import get_connection
 from src.generated.models import OrdersOrder, OrdersOrderItem
 from src.generated.query import (
@@ -9,7 +12,16 @@ from src.generated.query import (
     ListOrdersWithItemsByUserIDAndStatusRow,
     ListOrdersWithItemsByUserIDRow,
 )
-from src.product_client import ProductClientError, decrease_stock, get_deal, get_product, increase_stock
+from src.product_client import (
+    ProductClientError,
+    commit_reservation,
+    decrease_stock,
+    get_deals,
+    get_products,
+    increase_stock,
+    release_reservation,
+    reserve_stock,
+)
 from src.schemas import (
     OrderItemRequest,
     OrderItemResponse,
@@ -18,6 +30,8 @@ from src.schemas import (
     ShippingAddress,
 )
 
+logger = logging.getLogger(__name__)
+
 
 class OrderServiceError(Exception):
     def __init__(self, error: str, message: str, status_code: int = 400):
@@ -68,50 +82,123 @@ async def create_order(
     items: list[OrderItemRequest],
     shipping_address: ShippingAddress | None = None,
 ) -> OrderResponse:
-    # 1. 상품 정보 조회 및 가격 계산
+    # 1. 상품 정보 조회 및 가격 계산 (상품/핫딜을 각각 한 번의 호출로 일괄 조회)
     order_items_data: list[dict] = []
     total_amount = 0
 
+    deal_ids = [item.deal_id for item in items if item.deal_id]
+    product_ids = [item.product_id for item in items if not item.deal_id]
+    try:
+        deals, products = await asyncio.gather(get_deals(deal_ids), get_products(product_ids))
+    except ProductClientError as e:
+        raise OrderServiceError(e.error, e.message, e.status_code) from e
+
     for item in items:
-        try:
-            if item.deal_id:
-                # 핫딜 주문
-                deal = await get_deal(item.deal_id)
-                if deal["product_id"] != str(item.product_id):
-                    raise OrderServiceError(
-                        "INVALID_DEAL",
-                        "핫딜과 상품이 일치하지 않습니다.",
-                        400,
-                    )
-                if deal["status"] != "active":
-                    raise OrderServiceError(
-                        "DEAL_NOT_ACTIVE",
-                        "핫딜이 진행 중이 아닙니다.",
-                        400,
-                    )
-                unit_price = deal["deal_price"]
-                product_name = deal["product"]["name"]
-            else:
-                # 일반 주문
-                product = await get_product(item.product_id)
-                unit_price = product["price"]
-                product_name = product["name"]
-
-            subtotal = unit_price * item.quantity
-            total_amount += subtotal
-
-            order_items_data.append({
-                "product_id": item.product_id,
-                "deal_id": item.deal_id,
-                "product_name": product_name,
-                "quantity": item.quantity,
-                "unit_price": unit_price,
-                "subtotal": subtotal,
-            })
-        except ProductClientError as e:
-            raise OrderServiceError(e.error, e.message, e.status_code) from e
-
-    # 2. 재고 차감 (트랜잭션 외부에서 - 보상 트랜잭션 패턴)
+        if item.deal_id:
+            # 핫딜 주문
+            deal = deals.get(str(item.deal_id))
+            if deal is None:
+                raise OrderServiceError(
+                    "DEAL_NOT_FOUND", f"핫딜을 찾을 수 없습니다: {item.deal_id}", 404
+                )
+            if deal["product_id"] != str(item.product_id):
+                raise OrderServiceError(
+                    "INVALID_DEAL",
+                    "핫딜과 상품이 일치하지 않습니다.",
+                    400,
+                )
+            if deal["status"] != "active":
+                raise OrderServiceError(
+                    "DEAL_NOT_ACTIVE",
+                    "핫딜이 진행 중이 아닙니다.",
+                    400,
+                )
+            unit_price = deal["deal_price"]
+            product_name = deal["product"]["name"]
+        else:
+            # 일반 주문
+            product = products.get(str(item.product_id))
+            if product is None:
+                raise OrderServiceError(
+                    "PRODUCT_NOT_FOUND", f"상품을 찾을 수 없습니다: {item.product_id}", 404
+                )
+            unit_price = product["price"]
+            product_name = product["name"]
+
+        subtotal = unit_price * item.quantity
+        total_amount += subtotal
+
+        order_items_data.append({
+            "product_id": item.product_id,
+            "deal_id": item.deal_id,
+            "product_name": product_name,
+            "quantity": item.quantity,
+            "unit_price": unit_price,
+            "subtotal": subtotal,
+        })
+
+    # 2. 재고 차감 후 주문 생성
+    if settings.stock_reservation_enabled:
+        return await _create_order_with_reservation(
+            user_id, items, shipping_address, total_amount, order_items_data
+        )
+    return await _create_order_with_stock_decrease(
+        user_id, items, shipping_address, total_amount, order_items_data
+    )
+
+
+async def _insert_order(
+    querier: AsyncQuerier,
+    user_id: UUID,
+    status: str,
+    shipping_address: ShippingAddress | None,
+    total_amount: int,
+    order_items_data: list[dict],
+) -> tuple[OrdersOrder, list[OrdersOrderItem]]:
+    """주문과 주문 아이템 저장 (커밋은 호출자가)"""
+    order = await querier.create_order(
+        CreateOrderParams(
+            user_id=user_id,
+            total_amount=total_amount,
+            status=status,
+            recipient_name=shipping_address.recipient_name if shipping_address else None,
+            phone=shipping_address.phone if shipping_address else None,
+            address=shipping_address.address if shipping_address else None,
+            address_detail=shipping_address.address_detail if shipping_address else None,
+            postal_code=shipping_address.postal_code if shipping_address else None,
+        )
+    )
+
+    if order is None:
+        raise OrderServiceError("CREATE_FAILED", "주문 생성에 실패했습니다.", 500)
+
+    created_items: list[OrdersOrderItem] = []
+    for item_data in order_items_data:
+        order_item = await querier.create_order_item(
+            CreateOrderItemParams(
+                order_id=order.id,
+                product_id=item_data["product_id"],
+                deal_id=item_data["deal_id"],
+                product_name=item_data["product_name"],
+                quantity=item_data["quantity"],
+                unit_price=item_data["unit_price"],
+                subtotal=item_data["subtotal"],
+            )
+        )
+        if order_item:
+            created_items.append(order_item)
+
+    return order, created_items
+
+
+async def _create_order_with_stock_decrease(
+    user_id: UUID,
+    items: list[OrderItemRequest],
+    shipping_address: ShippingAddress | None,
+    total_amount: int,
+    order_items_data: list[dict],
+) -> OrderResponse:
+    """재고 차감 후 주문 생성, 실패 시 차감한 재고 복구 (보상 트랜잭션 패턴)"""
     decreased_items: list[tuple[UUID, int]] = []
     try:
         for item in items:
@@ -126,45 +213,12 @@ async def create_order(
                 pass  # 재고 복구 실패는 로깅만 (실제로는 알림 필요)
         raise OrderServiceError(e.error, e.message, e.status_code) from e
 
-    # 3. 주문 생성
     try:
         async with get_connection() as conn:
             querier = AsyncQuerier(conn)
-
-            # 주문 생성
-            order = await querier.create_order(
-                CreateOrderParams(
-                    user_id=user_id,
-                    total_amount=total_amount,
-                    status="confirmed",
-                    recipient_name=shipping_address.recipient_name if shipping_address else None,
-                    phone=shipping_address.phone if shipping_address else None,
-                    address=shipping_address.address if shipping_address else None,
-                    address_detail=shipping_address.address_detail if shipping_address else None,
-                    postal_code=shipping_address.postal_code if shipping_address else None,
-                )
+            order, created_items = await _insert_order(
+                querier, user_id, "confirmed", shipping_address, total_amount, order_items_data
             )
-
-            if order is None:
-                raise OrderServiceError("CREATE_FAILED", "주문 생성에 실패했습니다.", 500)
-
-            # 주문 아이템 생성
-            created_items: list[OrdersOrderItem] = []
-            for item_data in order_items_data:
-                order_item = await querier.create_order_item(
-                    CreateOrderItemParams(
-                        order_id=order.id,
-                        product_id=item_data["product_id"],
-                        deal_id=item_data["deal_id"],
-                        product_name=item_data["product_name"],
-                        quantity=item_data["quantity"],
-                        unit_price=item_data["unit_price"],
-                        subtotal=item_data["subtotal"],
-                    )
-                )
-                if order_item:
-                    created_items.append(order_item)
-
             await conn.commit()
             return _order_to_response(order, created_items)
 
@@ -178,6 +232,69 @@ async def create_order(
         raise
 
 
+async def _create_order_with_reservation(
+    user_id: UUID,
+    items: list[OrderItemRequest],
+    shipping_address: ShippingAddress | None,
+    total_amount: int,
+    order_items_data: list[dict],
+) -> OrderResponse:
+    """재고 예약 → pending 주문 저장 → 예약 확정 → 주문 확정 (재고 복구 보상 없음)
+
+    예약 확정 전에 실패하면 예약을 취소(취소도 실패하면 만료 시 반환)하고,
+    확정에 실패하면 pending 주문을 취소 상태로 남긴다.
+    """
+    # 재고 예약 (주문 저장 전에 중단되어도 예약 만료 시 Product Service가 재고 반환)
+    try:
+        reservation_id = await reserve_stock([(item.product_id, item.quantity) for item in items])
+    except ProductClientError as e:
+        raise OrderServiceError(e.error, e.message, e.status_code) from e
+
+    # 확정 전까지는 pending으로 저장
+    try:
+        async with get_connection() as conn:
+            querier = AsyncQuerier(conn)
+            order, created_items = await _insert_order(
+                querier, user_id, "pending", shipping_address, total_amount, order_items_data
+            )
+            await conn.commit()
+    except BaseException:
+        await _release_reservation(reservation_id)
+        raise
+
+    # 예약 확정 (만료되었으면 주문 취소)
+    try:
+        await commit_reservation(reservation_id)
+    except ProductClientError as e:
+        try:
+            async with get_connection() as conn:
+                querier = AsyncQuerier(conn)
+                await querier.cancel_order(id=order.id, cancel_reason="재고 예약 확정 실패")
+                await conn.commit()
+        except Exception:
+            logger.exception(f"Order cancel failed after reservation commit error ({order.id})")
+        await _release_reservation(reservation_id)
+        raise OrderServiceError(e.error, e.message, e.status_code) from e
+
+    # 재고는 이미 확정되었으므로 상태 변경이 실패해도 주문은 pending으로 유지
+    try:
+        async with get_connection() as conn:
+            confirmed = await AsyncQuerier(conn).confirm_order(id=order.id)
+            await conn.commit()
+    except Exception:
+        logger.exception(f"Order confirm failed after stock reservation commit ({order.id})")
+        confirmed = None
+
+    return _order_to_response(confirmed or order, created_items)
+
+
+async def _release_reservation(reservation_id: str) -> None:
+    # 취소 실패 시에도 예약 만료 시점에 재고 반환
+    try:
+        await release_reservation(reservation_id)
+    except ProductClientError as e:
+        logger.warning(f"Stock reservation release failed ({reservation_id}): {e.message}")
+
 async def get_order(order_id: UUID, user_id: UUID) -> OrderResponse:
     async with get_connection() as conn:
         querier = AsyncQuerier(conn)
@@ -0,0 +1,5 @@
+CREATE INDEX IF NOT EXISTS idx_products_category ON product.products(category);
+CREATE INDEX IF NOT EXISTS idx_products_created_at ON product.products(created_at DESC);
+
+DROP INDEX IF EXISTS product.idx_products_category_created_at_id;
+DROP INDEX IF EXISTS product.idx_products_created_at_id;
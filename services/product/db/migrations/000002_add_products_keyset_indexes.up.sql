@@ -0,0 +1,8 @@
+-- 커서(keyset) 페이지네이션 인덱스
+-- ORDER BY created_at DESC, id DESC와 같은 정렬로 (created_at, id) < (커서) 조건을 인덱스 범위 스캔으로 처리
+CREATE INDEX idx_products_created_at_id ON product.products(created_at DESC, id DESC);
+CREATE INDEX idx_products_category_created_at_id ON product.products(category, created_at DESC, id DESC);
+
+-- 새 인덱스의 선행 컬럼과 중복되는 인덱스 제거
+DROP INDEX IF EXISTS product.idx_products_created_at;
+DROP INDEX IF EXISTS product.idx_products_category;
@@ -0,0 +1,6 @@
+DROP TRIGGER IF EXISTS products_count_truncate ON product.products;
+DROP TRIGGER IF EXISTS products_count_update ON product.products;
+DROP TRIGGER IF EXISTS products_count_delete ON product.products;
+DROP TRIGGER IF EXISTS products_count_insert ON product.products;
+DROP FUNCTION IF EXISTS product.update_product_counts();
+DROP TABLE IF EXISTS product.product_counts;
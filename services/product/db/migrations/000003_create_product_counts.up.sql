@@ -0,0 +1,54 @@
+-- 카테고리별 상품 수 (목록 total counter 모드, 트리거로 유지)
+-- category가 NULL인 상품은 '' 키로 집계
+CREATE TABLE product.product_counts (
+    category VARCHAR(50) PRIMARY KEY,
+    count BIGINT NOT NULL DEFAULT 0
+);
+
+INSERT INTO product.product_counts (category, count)
+SELECT COALESCE(category, ''), COUNT(*) FROM product.products GROUP BY 1;
+
+-- INSERT/DELETE: 문장 단위로 전이 테이블을 카테고리별로 합산해 반영 (대량 적재 시 카운터 갱신 1회)
+-- UPDATE: 카테고리가 바뀐 행만 반영 (재고 변경에는 실행되지 않음)
+-- TRUNCATE: 초기화
+CREATE FUNCTION product.update_product_counts() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        INSERT INTO product.product_counts AS c (category, count)
+        SELECT COALESCE(category, ''), COUNT(*) FROM new_rows GROUP BY 1
+        ON CONFLICT (category) DO UPDATE SET count = c.count + EXCLUDED.count;
+    ELSIF TG_OP = 'DELETE' THEN
+        INSERT INTO product.product_counts AS c (category, count)
+        SELECT COALESCE(category, ''), -COUNT(*) FROM old_rows GROUP BY 1
+        ON CONFLICT (category) DO UPDATE SET count = c.count + EXCLUDED.count;
+    ELSIF TG_OP = 'UPDATE' THEN
+        UPDATE product.product_counts SET count = count - 1
+        WHERE category = COALESCE(OLD.category, '');
+        INSERT INTO product.product_counts AS c (category, count)
+        VALUES (COALESCE(NEW.category, ''), 1)
+        ON CONFLICT (category) DO UPDATE SET count = c.count + 1;
+    ELSIF TG_OP = 'TRUNCATE' THEN
+        DELETE FROM product.product_counts;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER products_count_insert
+    AFTER INSERT ON product.products
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION product.update_product_counts();
+
+CREATE TRIGGER products_count_delete
+    AFTER DELETE ON product.products
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION product.update_product_counts();
+
+CREATE TRIGGER products_count_update
+    AFTER UPDATE OF category ON product.products
+    FOR EACH ROW WHEN (OLD.category IS DISTINCT FROM NEW.category)
+    EXECUTE FUNCTION product.update_product_counts();
+
+CREATE TRIGGER products_count_truncate
+    AFTER TRUNCATE ON product.products
+    FOR EACH STATEMENT EXECUTE FUNCTION product.update_product_counts();
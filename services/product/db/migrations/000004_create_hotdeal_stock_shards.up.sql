@@ -0,0 +1,12 @@
+-- 핫딜 재고 분할 카운터 (HOTDEAL_STOCK_SHARDS > 0, Redis 없이 핫딜 재고 처리)
+-- 핫딜 시작 시 재고를 N개 행으로 나눠 적재하고, 주문은 임의의 shard 하나만 잠그고 증감
+-- ending: 종료 처리 중 (이후 주문은 products.stock 경로로 처리, 종료 반영 후 삭제)
+CREATE TABLE product.hotdeal_stock_shards (
+    product_id UUID NOT NULL REFERENCES product.products(id) ON DELETE CASCADE,
+    shard SMALLINT NOT NULL,
+    deal_id UUID REFERENCES product.deals(id) ON DELETE SET NULL,
+    loaded INTEGER NOT NULL,
+    remaining INTEGER NOT NULL CHECK (remaining >= 0),
+    ending BOOLEAN NOT NULL DEFAULT false,
+    PRIMARY KEY (product_id, shard)
+);
@@ -0,0 +1,12 @@
+-- 2단계 재고 예약 (ReserveStock → CommitReservation/ReleaseReservation)
+-- 예약 시 재고를 먼저 차감하고 항목을 저장, 확정/취소 전에 만료되면 sweeper가 재고를 반환
+CREATE TABLE product.stock_reservations (
+    reservation_id UUID NOT NULL,
+    product_id UUID NOT NULL REFERENCES product.products(id) ON DELETE CASCADE,
+    quantity INTEGER NOT NULL CHECK (quantity > 0),
+    expires_at TIMESTAMPTZ NOT NULL,
+    PRIMARY KEY (reservation_id, product_id)
+);
+
+-- 만료 예약 batch 조회 (오래된 순)
+CREATE INDEX idx_stock_reservations_expires_at ON product.stock_reservations(expires_at);
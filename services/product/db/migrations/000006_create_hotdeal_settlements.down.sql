@@ -0,0 +1 @@
+DROP TABLE IF EXISTS product.hotdeal_settlements;
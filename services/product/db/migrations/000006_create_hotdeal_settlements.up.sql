@@ -0,0 +1,8 @@
+-- 핫딜 종료 정산 기록 (HOTDEAL_STOCK_REDIS, 핫딜 시작마다 run_id 발급)
+-- 판매량 반영과 같은 트랜잭션에서 저장하여, 종료 처리를 재시도해도 판매량을 한 번만 반영
+CREATE TABLE product.hotdeal_settlements (
+    run_id UUID PRIMARY KEY,
+    product_id UUID NOT NULL REFERENCES product.products(id) ON DELETE CASCADE,
+    sold INTEGER NOT NULL,
+    settled_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
@@ -0,0 +1 @@
+DROP TABLE IF EXISTS product.import_jobs;
@@ -0,0 +1,10 @@
+-- 상품 대량 등록 작업 상태 (여러 워커 프로세스 중 어디로 조회가 가도 같은 상태를 반환)
+-- job: ProductImportJob JSON, 배치마다 갱신
+CREATE TABLE product.import_jobs (
+    id UUID PRIMARY KEY,
+    job JSONB NOT NULL,
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+-- 보관 기간이 지난 작업 정리
+CREATE INDEX idx_import_jobs_updated_at ON product.import_jobs(updated_at);
@@ -0,0 +1 @@
+ALTER TABLE product.stock_reservations DROP COLUMN IF EXISTS source;
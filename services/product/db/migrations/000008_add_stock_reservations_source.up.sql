@@ -0,0 +1,4 @@
+-- 예약 항목의 재고를 어디서 차감했는지 (반환 시 같은 곳으로, 차감과 같은 트랜잭션에서 기록)
+-- NULL: 아직 차감 전이거나 Redis 핫딜 재고에서 차감 (Redis 예약 토큰으로 판별)
+-- db: products.stock, shards: 핫딜 재고 분할 카운터
+ALTER TABLE product.stock_reservations ADD COLUMN source VARCHAR(10);
@@ -5,30 +5,77 @@ INSERT INTO product.products (name, description, price, stock, category, image_u
 VALUES ($1, $2, $3, $4, $5, $6)
 RETURNING id, name, description, price, stock, category, image_url, created_at, updated_at;
 
+-- 배열 인자로 multi-row INSERT (대량 등록)
+-- name: BulkCreateProducts :execrows
+INSERT INTO product.products (name, description, price, stock, category, image_url)
+SELECT unnest(sqlc.arg(names)::text[]), unnest(sqlc.arg(descriptions)::text[]),
+       unnest(sqlc.arg(prices)::integer[]), unnest(sqlc.arg(stocks)::integer[]),
+       unnest(sqlc.arg(categories)::text[]), unnest(sqlc.arg(image_urls)::text[]);
+
 -- name: GetProductByID :one
 SELECT id, name, description, price, stock, category, image_url, created_at, updated_at
 FROM product.products
 WHERE id = $1;
 
+-- 여러 상품을 한 번에 조회 (없는 ID는 결과에서 빠짐, 순서 보장 없음)
+-- name: GetProductsByIDs :many
+SELECT id, name, description, price, stock, category, image_url, created_at, updated_at
+FROM product.products
+WHERE id = ANY(sqlc.arg(ids)::uuid[]);
+
 -- name: ListProducts :many
 SELECT id, name, description, price, stock, category, image_url, created_at, updated_at
 FROM product.products
-ORDER BY created_at DESC
+ORDER BY created_at DESC, id DESC
 LIMIT $1 OFFSET $2;
 
+-- name: ListProductsAfter :many
+SELECT id, name, description, price, stock, category, image_url, created_at, updated_at
+FROM product.products
+WHERE (created_at, id) < (sqlc.arg(created_at)::timestamptz, sqlc.arg(id)::uuid)
+ORDER BY created_at DESC, id DESC
+LIMIT sqlc.arg('limit');
+
 -- name: ListProductsByCategory :many
 SELECT id, name, description, price, stock, category, image_url, created_at, updated_at
 FROM product.products
 WHERE category = $1
-ORDER BY created_at DESC
+ORDER BY created_at DESC, id DESC
 LIMIT $2 OFFSET $3;
 
+-- name: ListProductsByCategoryAfter :many
+SELECT id, name, description, price, stock, category, image_url, created_at, updated_at
+FROM product.products
+WHERE category = sqlc.arg(category)
+  AND (created_at, id) < (sqlc.arg(created_at)::timestamptz, sqlc.arg(id)::uuid)
+ORDER BY created_at DESC, id DESC
+LIMIT sqlc.arg('limit');
+
 -- name: CountProducts :one
 SELECT COUNT(*) FROM product.products;
 
 -- name: CountProductsByCategory :one
 SELECT COUNT(*) FROM product.products WHERE category = $1;
 
+-- name: GetProductCount :one
+SELECT COALESCE(SUM(count), 0)::bigint FROM product.product_counts;
+
+-- name: GetProductCountByCategory :one
+SELECT count FROM product.product_counts WHERE category = $1;
+
+-- name: EstimateProducts :one
+SELECT reltuples::bigint FROM pg_class WHERE oid = 'product.products'::regclass;
+
+-- 최빈값 통계에 없는 카테고리는 -1
+-- name: EstimateProductsByCategory :one
+SELECT COALESCE(
+    (c.reltuples * s.most_common_freqs[array_position(s.most_common_vals::text::text[], sqlc.arg(category)::text)])::bigint,
+    -1
+)::bigint
+FROM pg_class c
+JOIN pg_stats s ON s.schemaname = 'product' AND s.tablename = 'products' AND s.attname = 'category'
+WHERE c.oid = 'product.products'::regclass;
+
 -- name: UpdateProduct :one
 UPDATE product.products
 SET name = COALESCE($2, name),
@@ -41,7 +88,7 @@ WHERE id = $1
 RETURNING id, name, description, price, stock, category, image_url, created_at, updated_at;
 
 -- name: GetStockForUpdate :one
-SELECT id, stock FROM product.products WHERE id = $1 FOR UPDATE;
+SELECT id, stock, category FROM product.products WHERE id = $1 FOR UPDATE;
 
 -- name: UpdateStock :one
 UPDATE product.products
@@ -49,6 +96,34 @@ SET stock = $2, updated_at = NOW()
 WHERE id = $1
 RETURNING id, stock, updated_at;
 
+-- 재고 부족이면 0행 (진행 중인 핫딜이 있으면 remaining_stock도 함께 증감, 부족하면 deal_remaining_stock이 NULL)
+-- updated_at은 행 잠금 순서(커밋 순서)대로 증가하도록 이전 값보다 항상 크게 설정 (캐시 버전으로 사용)
+-- name: AdjustStock :one
+WITH updated AS (
+    UPDATE product.products
+    SET stock = stock + sqlc.arg(delta)::integer,
+        updated_at = GREATEST(NOW(), updated_at + INTERVAL '1 microsecond')
+    WHERE id = sqlc.arg(id) AND stock + sqlc.arg(delta)::integer >= 0
+    RETURNING id, name, description, price, stock, category, image_url, created_at, updated_at
+), active_deal AS (
+    SELECT id FROM product.deals
+    WHERE product_id = sqlc.arg(id) AND starts_at <= sqlc.arg(now) AND ends_at >= sqlc.arg(now)
+    ORDER BY starts_at
+    LIMIT 1
+), updated_deal AS (
+    UPDATE product.deals d
+    SET remaining_stock = LEAST(d.remaining_stock + sqlc.arg(delta)::integer, d.deal_stock)
+    FROM active_deal, updated
+    WHERE d.id = active_deal.id AND d.remaining_stock + sqlc.arg(delta)::integer >= 0
+    RETURNING d.remaining_stock
+)
+SELECT updated.id, updated.name, updated.description, updated.price, updated.stock,
+       updated.category, updated.image_url, updated.created_at, updated.updated_at,
+       active_deal.id AS deal_id, updated_deal.remaining_stock AS deal_remaining_stock
+FROM updated
+LEFT JOIN active_deal ON true
+LEFT JOIN updated_deal ON true;
+
 -- Deal queries
 
 -- name: CreateDeal :one
@@ -66,6 +141,17 @@ FROM product.deals d
 JOIN product.products p ON d.product_id = p.id
 WHERE d.id = $1;
 
+-- 여러 핫딜을 한 번에 조회 (없는 ID는 결과에서 빠짐, 순서 보장 없음)
+-- name: GetDealsByIDs :many
+SELECT d.id, d.product_id, d.deal_price, d.deal_stock, d.remaining_stock,
+       d.starts_at, d.ends_at, d.created_at,
+       p.id as p_id, p.name as p_name, p.description as p_description,
+       p.price as p_price, p.stock as p_stock, p.category as p_category,
+       p.image_url as p_image_url, p.created_at as p_created_at, p.updated_at as p_updated_at
+FROM product.deals d
+JOIN product.products p ON d.product_id = p.id
+WHERE d.id = ANY(sqlc.arg(ids)::uuid[]);
+
 -- name: ListActiveDeals :many
 SELECT d.id, d.product_id, d.deal_price, d.deal_stock, d.remaining_stock,
        d.starts_at, d.ends_at, d.created_at,
@@ -78,6 +164,165 @@ WHERE d.starts_at <= $1 AND d.ends_at >= $1 AND d.remaining_stock > 0
 ORDER BY d.starts_at DESC
 LIMIT $2 OFFSET $3;
 
+-- name: ListUpcomingDeals :many
+SELECT d.id, d.product_id, d.deal_price, d.deal_stock, d.remaining_stock,
+       d.starts_at, d.ends_at, d.created_at,
+       p.id as p_id, p.name as p_name, p.description as p_description,
+       p.price as p_price, p.stock as p_stock, p.category as p_category,
+       p.image_url as p_image_url, p.created_at as p_created_at, p.updated_at as p_updated_at
+FROM product.deals d
+JOIN product.products p ON d.product_id = p.id
+WHERE d.ends_at >= $1
+ORDER BY d.starts_at;
+
+-- name: GetCurrentDealByProduct :one
+SELECT id, deal_stock, remaining_stock FROM product.deals
+WHERE product_id = $1 AND ends_at >= $2
+ORDER BY starts_at
+LIMIT 1;
+
+-- name: SetDealRemainingStock :exec
+UPDATE product.deals
+SET remaining_stock = LEAST(sqlc.arg(remaining_stock)::integer, deal_stock)
+WHERE id = sqlc.arg(id);
+
 -- name: CountActiveDeals :one
 SELECT COUNT(*) FROM product.deals
 WHERE starts_at <= $1 AND ends_at >= $1 AND remaining_stock > 0;
+
+-- Hotdeal stock shard queries
+
+-- 재고를 shards개 행에 균등 분배 (이미 적재된 상품이면 0행)
+-- name: CreateHotdealStockShards :execrows
+INSERT INTO product.hotdeal_stock_shards (product_id, shard, deal_id, loaded, remaining)
+SELECT sqlc.arg(product_id), s.shard, sqlc.narg(deal_id), s.stock, s.stock
+FROM (
+    SELECT shard, sqlc.arg(stock)::integer / sqlc.arg(shards)::integer
+        + CASE WHEN shard < sqlc.arg(stock)::integer % sqlc.arg(shards)::integer THEN 1 ELSE 0 END AS stock
+    FROM generate_series(0, sqlc.arg(shards)::integer - 1) AS shard
+) s
+WHERE NOT EXISTS (
+    SELECT 1 FROM product.hotdeal_stock_shards WHERE product_id = sqlc.arg(product_id)
+)
+ON CONFLICT DO NOTHING;
+
+-- 증감 가능한 shard 하나를 임의로 골라 잠그고 반영 (잠금 대기 후 조건이 깨지면 다음 shard), 반영 후 전체 재고 반환
+-- 핫딜 상품이 아니면 0행, 어느 shard도 단독으로 증감할 수 없으면 adjusted = false (한 번의 왕복으로 구분)
+-- name: AdjustHotdealStockShard :one
+WITH picked AS (
+    SELECT product_id, shard FROM product.hotdeal_stock_shards
+    WHERE product_id = sqlc.arg(product_id) AND NOT ending
+      AND remaining + sqlc.arg(delta)::integer >= 0
+    ORDER BY random()
+    LIMIT 1
+    FOR UPDATE
+), updated AS (
+    UPDATE product.hotdeal_stock_shards s
+    SET remaining = s.remaining + sqlc.arg(delta)::integer
+    FROM picked
+    WHERE s.product_id = picked.product_id AND s.shard = picked.shard
+    RETURNING s.shard, s.remaining
+)
+SELECT EXISTS (SELECT 1 FROM updated) AS adjusted, COALESCE((
+    SELECT updated.remaining + (
+        SELECT COALESCE(SUM(o.remaining), 0) FROM product.hotdeal_stock_shards o
+        WHERE o.product_id = sqlc.arg(product_id) AND o.shard <> updated.shard
+    )
+    FROM updated
+), 0)::integer AS stock
+FROM (
+    SELECT 1 FROM product.hotdeal_stock_shards
+    WHERE product_id = sqlc.arg(product_id) AND NOT ending
+    LIMIT 1
+) hotdeal;
+
+-- name: LockHotdealStockShards :many
+SELECT shard, remaining FROM product.hotdeal_stock_shards
+WHERE product_id = $1 AND NOT ending
+ORDER BY shard
+FOR UPDATE;
+
+-- name: SetHotdealStockShard :exec
+UPDATE product.hotdeal_stock_shards
+SET remaining = $3
+WHERE product_id = $1 AND shard = $2;
+
+-- name: ListHotdealStockTotals :many
+SELECT product_id, deal_id, SUM(loaded)::integer AS loaded, SUM(remaining)::integer AS remaining
+FROM product.hotdeal_stock_shards
+WHERE NOT ending
+GROUP BY product_id, deal_id
+ORDER BY product_id;
+
+-- 종료 처리 시작: shard 행을 잠그고 증감 대상에서 제외한 뒤 합계 반환 (판매량 반영/삭제와 같은 트랜잭션에서 사용)
+-- name: BeginEndHotdealStockShards :one
+WITH ending AS (
+    UPDATE product.hotdeal_stock_shards
+    SET ending = true
+    WHERE product_id = $1
+    RETURNING deal_id, loaded, remaining
+)
+SELECT deal_id, SUM(loaded)::integer AS loaded, SUM(remaining)::integer AS remaining
+FROM ending
+GROUP BY deal_id;
+
+-- name: DeleteHotdealStockShards :exec
+DELETE FROM product.hotdeal_stock_shards WHERE product_id = $1;
+
+-- 정산 기록 저장 (이미 정산된 run_id면 0행)
+-- name: CreateHotdealSettlement :one
+INSERT INTO product.hotdeal_settlements (run_id, product_id, sold)
+VALUES ($1, $2, $3)
+ON CONFLICT DO NOTHING
+RETURNING run_id;
+
+-- Stock reservation queries
+
+-- 예약 항목 일괄 저장 (상품별 1행)
+-- name: CreateStockReservation :exec
+INSERT INTO product.stock_reservations (reservation_id, product_id, quantity, expires_at)
+SELECT sqlc.arg(reservation_id)::uuid, unnest(sqlc.arg(product_ids)::uuid[]),
+       unnest(sqlc.arg(quantities)::integer[]), sqlc.arg(expires_at)::timestamptz;
+
+-- 차감과 같은 트랜잭션에서 차감한 곳 기록 (0행이면 그 사이 만료되어 sweeper가 삭제함)
+-- name: SetStockReservationSource :execrows
+UPDATE product.stock_reservations
+SET source = $3
+WHERE reservation_id = $1 AND product_id = $2;
+
+-- 확정: 만료 전인 예약만 삭제 (0행이면 없거나 만료됨, 만료된 예약은 sweeper가 반환)
+-- name: CommitStockReservation :many
+DELETE FROM product.stock_reservations
+WHERE reservation_id = $1 AND expires_at > NOW()
+RETURNING product_id, quantity;
+
+-- 취소: 삭제한 항목만 재고 반환 (sweeper와 동시에 실행되어도 한쪽만 반환)
+-- name: ReleaseStockReservation :many
+DELETE FROM product.stock_reservations
+WHERE reservation_id = $1
+RETURNING product_id, quantity, source;
+
+-- 만료된 예약을 오래된 순으로 batch 삭제 (여러 인스턴스가 동시에 실행해도 겹치지 않음)
+-- name: DeleteExpiredStockReservations :many
+DELETE FROM product.stock_reservations
+WHERE (reservation_id, product_id) IN (
+    SELECT reservation_id, product_id FROM product.stock_reservations
+    WHERE expires_at <= NOW()
+    ORDER BY expires_at
+    LIMIT $1
+    FOR UPDATE SKIP LOCKED
+)
+RETURNING reservation_id, product_id, quantity, source;
+
+-- Product import job queries
+
+-- name: SaveImportJob :exec
+INSERT INTO product.import_jobs (id, job, updated_at)
+VALUES (sqlc.arg(id), sqlc.arg(job)::jsonb, NOW())
+ON CONFLICT (id) DO UPDATE SET job = EXCLUDED.job, updated_at = NOW();
+
+-- name: GetImportJob :one
+SELECT job::text FROM product.import_jobs WHERE id = $1;
+
+-- name: DeleteImportJobsBefore :exec
+DELETE FROM product.import_jobs WHERE updated_at < $1;
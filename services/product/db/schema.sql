@@ -26,6 +26,51 @@ CREATE TABLE product.deals (
     CONSTRAINT valid_remaining_stock CHECK (remaining_stock <= deal_stock)
 );
 
-CREATE INDEX idx_products_category ON product.products(category);
+-- 카테고리별 상품 수 (트리거는 migrations/000003 참고)
+CREATE TABLE product.product_counts (
+    category VARCHAR(50) PRIMARY KEY,
+    count BIGINT NOT NULL DEFAULT 0
+);
+
+-- 핫딜 재고 분할 카운터
+CREATE TABLE product.hotdeal_stock_shards (
+    product_id UUID NOT NULL REFERENCES product.products(id) ON DELETE CASCADE,
+    shard SMALLINT NOT NULL,
+    deal_id UUID REFERENCES product.deals(id) ON DELETE SET NULL,
+    loaded INTEGER NOT NULL,
+    remaining INTEGER NOT NULL CHECK (remaining >= 0),
+    ending BOOLEAN NOT NULL DEFAULT false,
+    PRIMARY KEY (product_id, shard)
+);
+
+-- 핫딜 종료 정산 기록 (run_id당 1행, 판매량 중복 반영 방지)
+CREATE TABLE product.hotdeal_settlements (
+    run_id UUID PRIMARY KEY,
+    product_id UUID NOT NULL REFERENCES product.products(id) ON DELETE CASCADE,
+    sold INTEGER NOT NULL,
+    settled_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+-- 2단계 재고 예약 (만료 시 sweeper가 재고 반환)
+CREATE TABLE product.stock_reservations (
+    reservation_id UUID NOT NULL,
+    product_id UUID NOT NULL REFERENCES product.products(id) ON DELETE CASCADE,
+    quantity INTEGER NOT NULL CHECK (quantity > 0),
+    expires_at TIMESTAMPTZ NOT NULL,
+    source VARCHAR(10),  -- 차감한 곳 (NULL: 차감 전 또는 Redis 핫딜 재고, db, shards)
+    PRIMARY KEY (reservation_id, product_id)
+);
+
+-- 상품 대량 등록 작업 상태 (job: ProductImportJob JSON)
+CREATE TABLE product.import_jobs (
+    id UUID PRIMARY KEY,
+    job JSONB NOT NULL,
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE INDEX idx_products_created_at_id ON product.products(created_at DESC, id DESC);
+CREATE INDEX idx_products_category_created_at_id ON product.products(category, created_at DESC, id DESC);
 CREATE INDEX idx_deals_product_id ON product.deals(product_id);
 CREATE INDEX idx_deals_active ON product.deals(starts_at, ends_at, remaining_stock);
+CREATE INDEX idx_stock_reservations_expires_at ON product.stock_reservations(expires_at);
+CREATE INDEX idx_import_jobs_updated_at ON product.import_jobs(updated_at);
@@ -19,6 +19,28 @@ type ProductDeal struct {
 	CreatedAt      pgtype.Timestamptz `json:"created_at"`
 }
 
+type ProductHotdealSettlement struct {
+	RunID     pgtype.UUID        `json:"run_id"`
+	ProductID pgtype.UUID        `json:"product_id"`
+	Sold      int32              `json:"sold"`
+	SettledAt pgtype.Timestamptz `json:"settled_at"`
+}
+
+type ProductHotdealStockShard struct {
+	ProductID pgtype.UUID `json:"product_id"`
+	Shard     int16       `json:"shard"`
+	DealID    pgtype.UUID `json:"deal_id"`
+	Loaded    int32       `json:"loaded"`
+	Remaining int32       `json:"remaining"`
+	Ending    bool        `json:"ending"`
+}
+
+type ProductImportJob struct {
+	ID        pgtype.UUID        `json:"id"`
+	Job       []byte             `json:"job"`
+	UpdatedAt pgtype.Timestamptz `json:"updated_at"`
+}
+
 type ProductProduct struct {
 	ID          pgtype.UUID        `json:"id"`
 	Name        string             `json:"name"`
@@ -30,3 +52,16 @@ type ProductProduct struct {
 	CreatedAt   pgtype.Timestamptz `json:"created_at"`
 	UpdatedAt   pgtype.Timestamptz `json:"updated_at"`
 }
+
+type ProductProductCount struct {
+	Category string `json:"category"`
+	Count    int64  `json:"count"`
+}
+
+type ProductStockReservation struct {
+	ReservationID pgtype.UUID        `json:"reservation_id"`
+	ProductID     pgtype.UUID        `json:"product_id"`
+	Quantity      int32              `json:"quantity"`
+	ExpiresAt     pgtype.Timestamptz `json:"expires_at"`
+	Source        pgtype.Text        `json:"source"`
+}
@@ -11,19 +11,66 @@ import (
 )
 
 type Querier interface {
+	// 증감 가능한 shard 하나를 임의로 골라 잠그고 반영 (잠금 대기 후 조건이 깨지면 다음 shard), 반영 후 전체 재고 반환
+	// 핫딜 상품이 아니면 0행, 어느 shard도 단독으로 증감할 수 없으면 adjusted = false (한 번의 왕복으로 구분)
+	AdjustHotdealStockShard(ctx context.Context, arg AdjustHotdealStockShardParams) (AdjustHotdealStockShardRow, error)
+	// 재고 부족이면 0행 (진행 중인 핫딜이 있으면 remaining_stock도 함께 증감, 부족하면 deal_remaining_stock이 NULL)
+	// updated_at은 행 잠금 순서(커밋 순서)대로 증가하도록 이전 값보다 항상 크게 설정 (캐시 버전으로 사용)
+	AdjustStock(ctx context.Context, arg AdjustStockParams) (AdjustStockRow, error)
+	// 종료 처리 시작: shard 행을 잠그고 증감 대상에서 제외한 뒤 합계 반환 (판매량 반영/삭제와 같은 트랜잭션에서 사용)
+	BeginEndHotdealStockShards(ctx context.Context, productID pgtype.UUID) (BeginEndHotdealStockShardsRow, error)
+	// 배열 인자로 multi-row INSERT (대량 등록)
+	BulkCreateProducts(ctx context.Context, arg BulkCreateProductsParams) (int64, error)
+	// 확정: 만료 전인 예약만 삭제 (0행이면 없거나 만료됨, 만료된 예약은 sweeper가 반환)
+	CommitStockReservation(ctx context.Context, reservationID pgtype.UUID) ([]CommitStockReservationRow, error)
 	CountActiveDeals(ctx context.Context, startsAt pgtype.Timestamptz) (int64, error)
 	CountProducts(ctx context.Context) (int64, error)
 	CountProductsByCategory(ctx context.Context, category pgtype.Text) (int64, error)
 	// Deal queries
 	CreateDeal(ctx context.Context, arg CreateDealParams) (ProductDeal, error)
+	// 정산 기록 저장 (이미 정산된 run_id면 0행)
+	CreateHotdealSettlement(ctx context.Context, arg CreateHotdealSettlementParams) (pgtype.UUID, error)
+	// Hotdeal stock shard queries
+	// 재고를 shards개 행에 균등 분배 (이미 적재된 상품이면 0행)
+	CreateHotdealStockShards(ctx context.Context, arg CreateHotdealStockShardsParams) (int64, error)
 	// Product queries
 	CreateProduct(ctx context.Context, arg CreateProductParams) (ProductProduct, error)
+	// Stock reservation queries
+	// 예약 항목 일괄 저장 (상품별 1행)
+	CreateStockReservation(ctx context.Context, arg CreateStockReservationParams) error
+	// 만료된 예약을 오래된 순으로 batch 삭제 (여러 인스턴스가 동시에 실행해도 겹치지 않음)
+	DeleteExpiredStockReservations(ctx context.Context, limit int32) ([]DeleteExpiredStockReservationsRow, error)
+	DeleteHotdealStockShards(ctx context.Context, productID pgtype.UUID) error
+	DeleteImportJobsBefore(ctx context.Context, updatedAt pgtype.Timestamptz) error
+	EstimateProducts(ctx context.Context) (int64, error)
+	// 최빈값 통계에 없는 카테고리는 -1
+	EstimateProductsByCategory(ctx context.Context, category string) (int64, error)
+	GetCurrentDealByProduct(ctx context.Context, arg GetCurrentDealByProductParams) (GetCurrentDealByProductRow, error)
 	GetDealByID(ctx context.Context, id pgtype.UUID) (GetDealByIDRow, error)
+	// 여러 핫딜을 한 번에 조회 (없는 ID는 결과에서 빠짐, 순서 보장 없음)
+	GetDealsByIDs(ctx context.Context, ids []pgtype.UUID) ([]GetDealsByIDsRow, error)
+	GetImportJob(ctx context.Context, id pgtype.UUID) (string, error)
 	GetProductByID(ctx context.Context, id pgtype.UUID) (ProductProduct, error)
+	GetProductCount(ctx context.Context) (int64, error)
+	GetProductCountByCategory(ctx context.Context, category string) (int64, error)
+	// 여러 상품을 한 번에 조회 (없는 ID는 결과에서 빠짐, 순서 보장 없음)
+	GetProductsByIDs(ctx context.Context, ids []pgtype.UUID) ([]ProductProduct, error)
 	GetStockForUpdate(ctx context.Context, id pgtype.UUID) (GetStockForUpdateRow, error)
 	ListActiveDeals(ctx context.Context, arg ListActiveDealsParams) ([]ListActiveDealsRow, error)
+	ListHotdealStockTotals(ctx context.Context) ([]ListHotdealStockTotalsRow, error)
 	ListProducts(ctx context.Context, arg ListProductsParams) ([]ProductProduct, error)
+	ListProductsAfter(ctx context.Context, arg ListProductsAfterParams) ([]ProductProduct, error)
 	ListProductsByCategory(ctx context.Context, arg ListProductsByCategoryParams) ([]ProductProduct, error)
+	ListProductsByCategoryAfter(ctx context.Context, arg ListProductsByCategoryAfterParams) ([]ProductProduct, error)
+	ListUpcomingDeals(ctx context.Context, endsAt pgtype.Timestamptz) ([]ListUpcomingDealsRow, error)
+	LockHotdealStockShards(ctx context.Context, productID pgtype.UUID) ([]LockHotdealStockShardsRow, error)
+	// 취소: 삭제한 항목만 재고 반환 (sweeper와 동시에 실행되어도 한쪽만 반환)
+	ReleaseStockReservation(ctx context.Context, reservationID pgtype.UUID) ([]ReleaseStockReservationRow, error)
+	SaveImportJob(ctx context.Context, arg SaveImportJobParams) error
+	SetDealRemainingStock(ctx context.Context, arg SetDealRemainingStockParams) error
+	SetHotdealStockShard(ctx context.Context, arg SetHotdealStockShardParams) error
+	// 차감과 같은 트랜잭션에서 차감한 곳 기록 (0행이면 그 사이 만료되어 sweeper가 삭제함)
+	SetStockReservationSource(ctx context.Context, arg SetStockReservationSourceParams) (int64, error)
 	UpdateProduct(ctx context.Context, arg UpdateProductParams) (ProductProduct, error)
 	UpdateStock(ctx context.Context, arg UpdateStockParams) (UpdateStockRow, error)
 }
@@ -11,6 +11,217 @@ import (
 	"github.com/jackc/pgx/v5/pgtype"
 )
 
+const adjustHotdealStockShard = `-- name: AdjustHotdealStockShard :one
+
+WITH picked AS (
+    SELECT product_id, shard FROM product.hotdeal_stock_shards
+    WHERE product_id = $1 AND NOT ending
+      AND remaining + $2::integer >= 0
+    ORDER BY random()
+    LIMIT 1
+    FOR UPDATE
+), updated AS (
+    UPDATE product.hotdeal_stock_shards s
+    SET remaining = s.remaining + $2::integer
+    FROM picked
+    WHERE s.product_id = picked.product_id AND s.shard = picked.shard
+    RETURNING s.shard, s.remaining
+)
+SELECT EXISTS (SELECT 1 FROM updated) AS adjusted, COALESCE((
+    SELECT updated.remaining + (
+        SELECT COALESCE(SUM(o.remaining), 0) FROM product.hotdeal_stock_shards o
+        WHERE o.product_id = $1 AND o.shard <> updated.shard
+    )
+    FROM updated
+), 0)::integer AS stock
+FROM (
+    SELECT 1 FROM product.hotdeal_stock_shards
+    WHERE product_id = $1 AND NOT ending
+    LIMIT 1
+) hotdeal
+`
+
+type AdjustHotdealStockShardParams struct {
+	ProductID pgtype.UUID `json:"product_id"`
+	Delta     int32       `json:"delta"`
+}
+
+type AdjustHotdealStockShardRow struct {
+	Adjusted bool  `json:"adjusted"`
+	Stock    int32 `json:"stock"`
+}
+
+// 증감 가능한 shard 하나를 임의로 골라 잠그고 반영 (잠금 대기 후 조건이 깨지면 다음 shard), 반영 후 전체 재고 반환
+// 핫딜 상품이 아니면 0행, 어느 shard도 단독으로 증감할 수 없으면 adjusted = false (한 번의 왕복으로 구분)
+func (q *Queries) AdjustHotdealStockShard(ctx context.Context, arg AdjustHotdealStockShardParams) (AdjustHotdealStockShardRow, error) {
+	row := q.db.QueryRow(ctx, adjustHotdealStockShard, arg.ProductID, arg.Delta)
+	var i AdjustHotdealStockShardRow
+	err := row.Scan(&i.Adjusted, &i.Stock)
+	return i, err
+}
+
+const adjustStock = `-- name: AdjustStock :one
+
+WITH updated AS (
+    UPDATE product.products
+    SET stock = stock + $1::integer,
+        updated_at = GREATEST(NOW(), updated_at + INTERVAL '1 microsecond')
+    WHERE id = $2 AND stock + $1::integer >= 0
+    RETURNING id, name, description, price, stock, category, image_url, created_at, updated_at
+), active_deal AS (
+    SELECT id FROM product.deals
+    WHERE product_id = $2 AND starts_at <= $3 AND ends_at >= $3
+    ORDER BY starts_at
+    LIMIT 1
+), updated_deal AS (
+    UPDATE product.deals d
+    SET remaining_stock = LEAST(d.remaining_stock + $1::integer, d.deal_stock)
+    FROM active_deal, updated
+    WHERE d.id = active_deal.id AND d.remaining_stock + $1::integer >= 0
+    RETURNING d.remaining_stock
+)
+SELECT updated.id, updated.name, updated.description, updated.price, updated.stock,
+       updated.category, updated.image_url, updated.created_at, updated.updated_at,
+       active_deal.id AS deal_id, updated_deal.remaining_stock AS deal_remaining_stock
+FROM updated
+LEFT JOIN active_deal ON true
+LEFT JOIN updated_deal ON true
+`
+
+type AdjustStockParams struct {
+	Delta int32              `json:"delta"`
+	ID    pgtype.UUID        `json:"id"`
+	Now   pgtype.Timestamptz `json:"now"`
+}
+
+type AdjustStockRow struct {
+	ID                 pgtype.UUID        `json:"id"`
+	Name               string             `json:"name"`
+	Description        pgtype.Text        `json:"description"`
+	Price              int32              `json:"price"`
+	Stock              int32              `json:"stock"`
+	Category           pgtype.Text        `json:"category"`
+	ImageUrl           pgtype.Text        `json:"image_url"`
+	CreatedAt          pgtype.Timestamptz `json:"created_at"`
+	UpdatedAt          pgtype.Timestamptz `json:"updated_at"`
+	DealID             pgtype.UUID        `json:"deal_id"`
+	DealRemainingStock pgtype.Int4        `json:"deal_remaining_stock"`
+}
+
+// 재고 부족이면 0행 (진행 중인 핫딜이 있으면 remaining_stock도 함께 증감, 부족하면 deal_remaining_stock이 NULL)
+// updated_at은 행 잠금 순서(커밋 순서)대로 증가하도록 이전 값보다 항상 크게 설정 (캐시 버전으로 사용)
+func (q *Queries) AdjustStock(ctx context.Context, arg AdjustStockParams) (AdjustStockRow, error) {
+	row := q.db.QueryRow(ctx, adjustStock, arg.Delta, arg.ID, arg.Now)
+	var i AdjustStockRow
+	err := row.Scan(
+		&i.ID,
+		&i.Name,
+		&i.Description,
+		&i.Price,
+		&i.Stock,
+		&i.Category,
+		&i.ImageUrl,
+		&i.CreatedAt,
+		&i.UpdatedAt,
+		&i.DealID,
+		&i.DealRemainingStock,
+	)
+	return i, err
+}
+
+const beginEndHotdealStockShards = `-- name: BeginEndHotdealStockShards :one
+
+WITH ending AS (
+    UPDATE product.hotdeal_stock_shards
+    SET ending = true
+    WHERE product_id = $1
+    RETURNING deal_id, loaded, remaining
+)
+SELECT deal_id, SUM(loaded)::integer AS loaded, SUM(remaining)::integer AS remaining
+FROM ending
+GROUP BY deal_id
+`
+
+type BeginEndHotdealStockShardsRow struct {
+	DealID    pgtype.UUID `json:"deal_id"`
+	Loaded    int32       `json:"loaded"`
+	Remaining int32       `json:"remaining"`
+}
+
+// 종료 처리 시작: shard 행을 잠그고 증감 대상에서 제외한 뒤 합계 반환 (판매량 반영/삭제와 같은 트랜잭션에서 사용)
+func (q *Queries) BeginEndHotdealStockShards(ctx context.Context, productID pgtype.UUID) (BeginEndHotdealStockShardsRow, error) {
+	row := q.db.QueryRow(ctx, beginEndHotdealStockShards, productID)
+	var i BeginEndHotdealStockShardsRow
+	err := row.Scan(&i.DealID, &i.Loaded, &i.Remaining)
+	return i, err
+}
+
+const bulkCreateProducts = `-- name: BulkCreateProducts :execrows
+
+INSERT INTO product.products (name, description, price, stock, category, image_url)
+SELECT unnest($1::text[]), unnest($2::text[]),
+       unnest($3::integer[]), unnest($4::integer[]),
+       unnest($5::text[]), unnest($6::text[])
+`
+
+type BulkCreateProductsParams struct {
+	Names        []string `json:"names"`
+	Descriptions []string `json:"descriptions"`
+	Prices       []int32  `json:"prices"`
+	Stocks       []int32  `json:"stocks"`
+	Categories   []string `json:"categories"`
+	ImageUrls    []string `json:"image_urls"`
+}
+
+// 배열 인자로 multi-row INSERT (대량 등록)
+func (q *Queries) BulkCreateProducts(ctx context.Context, arg BulkCreateProductsParams) (int64, error) {
+	result, err := q.db.Exec(ctx, bulkCreateProducts,
+		arg.Names,
+		arg.Descriptions,
+		arg.Prices,
+		arg.Stocks,
+		arg.Categories,
+		arg.ImageUrls,
+	)
+	if err != nil {
+		return 0, err
+	}
+	return result.RowsAffected(), nil
+}
+
+const commitStockReservation = `-- name: CommitStockReservation :many
+
+DELETE FROM product.stock_reservations
+WHERE reservation_id = $1 AND expires_at > NOW()
+RETURNING product_id, quantity
+`
+
+type CommitStockReservationRow struct {
+	ProductID pgtype.UUID `json:"product_id"`
+	Quantity  int32       `json:"quantity"`
+}
+
+// 확정: 만료 전인 예약만 삭제 (0행이면 없거나 만료됨, 만료된 예약은 sweeper가 반환)
+func (q *Queries) CommitStockReservation(ctx context.Context, reservationID pgtype.UUID) ([]CommitStockReservationRow, error) {
+	rows, err := q.db.Query(ctx, commitStockReservation, reservationID)
+	if err != nil {
+		return nil, err
+	}
+	defer rows.Close()
+	var items []CommitStockReservationRow
+	for rows.Next() {
+		var i CommitStockReservationRow
+		if err := rows.Scan(&i.ProductID, &i.Quantity); err != nil {
+			return nil, err
+		}
+		items = append(items, i)
+	}
+	if err := rows.Err(); err != nil {
+		return nil, err
+	}
+	return items, nil
+}
+
 const countActiveDeals = `-- name: CountActiveDeals :one
 SELECT COUNT(*) FROM product.deals
 WHERE starts_at <= $1 AND ends_at >= $1 AND remaining_stock > 0
@@ -85,6 +296,65 @@ func (q *Queries) CreateDeal(ctx context.Context, arg CreateDealParams) (Product
 	return i, err
 }
 
+const createHotdealSettlement = `-- name: CreateHotdealSettlement :one
+
+INSERT INTO product.hotdeal_settlements (run_id, product_id, sold)
+VALUES ($1, $2, $3)
+ON CONFLICT DO NOTHING
+RETURNING run_id
+`
+
+type CreateHotdealSettlementParams struct {
+	RunID     pgtype.UUID `json:"run_id"`
+	ProductID pgtype.UUID `json:"product_id"`
+	Sold      int32       `json:"sold"`
+}
+
+// 정산 기록 저장 (이미 정산된 run_id면 0행)
+func (q *Queries) CreateHotdealSettlement(ctx context.Context, arg CreateHotdealSettlementParams) (pgtype.UUID, error) {
+	row := q.db.QueryRow(ctx, createHotdealSettlement, arg.RunID, arg.ProductID, arg.Sold)
+	var run_id pgtype.UUID
+	err := row.Scan(&run_id)
+	return run_id, err
+}
+
+const createHotdealStockShards = `-- name: CreateHotdealStockShards :execrows
+
+INSERT INTO product.hotdeal_stock_shards (product_id, shard, deal_id, loaded, remaining)
+SELECT $1, s.shard, $2, s.stock, s.stock
+FROM (
+    SELECT shard, $3::integer / $4::integer
+        + CASE WHEN shard < $3::integer % $4::integer THEN 1 ELSE 0 END AS stock
+    FROM generate_series(0, $4::integer - 1) AS shard
+) s
+WHERE NOT EXISTS (
+    SELECT 1 FROM product.hotdeal_stock_shards WHERE product_id = $1
+)
+ON CONFLICT DO NOTHING
+`
+
+type CreateHotdealStockShardsParams struct {
+	ProductID pgtype.UUID `json:"product_id"`
+	DealID    pgtype.UUID `json:"deal_id"`
+	Stock     int32       `json:"stock"`
+	Shards    int32       `json:"shards"`
+}
+
+// Hotdeal stock shard queries
+// 재고를 shards개 행에 균등 분배 (이미 적재된 상품이면 0행)
+func (q *Queries) CreateHotdealStockShards(ctx context.Context, arg CreateHotdealStockShardsParams) (int64, error) {
+	result, err := q.db.Exec(ctx, createHotdealStockShards,
+		arg.ProductID,
+		arg.DealID,
+		arg.Stock,
+		arg.Shards,
+	)
+	if err != nil {
+		return 0, err
+	}
+	return result.RowsAffected(), nil
+}
+
 const createProduct = `-- name: CreateProduct :one
 
 INSERT INTO product.products (name, description, price, stock, category, image_url)
@@ -126,6 +396,151 @@ func (q *Queries) CreateProduct(ctx context.Context, arg CreateProductParams) (P
 	return i, err
 }
 
+const createStockReservation = `-- name: CreateStockReservation :exec
+
+INSERT INTO product.stock_reservations (reservation_id, product_id, quantity, expires_at)
+SELECT $1::uuid, unnest($2::uuid[]),
+       unnest($3::integer[]), $4::timestamptz
+`
+
+type CreateStockReservationParams struct {
+	ReservationID pgtype.UUID        `json:"reservation_id"`
+	ProductIds    []pgtype.UUID      `json:"product_ids"`
+	Quantities    []int32            `json:"quantities"`
+	ExpiresAt     pgtype.Timestamptz `json:"expires_at"`
+}
+
+// Stock reservation queries
+// 예약 항목 일괄 저장 (상품별 1행)
+func (q *Queries) CreateStockReservation(ctx context.Context, arg CreateStockReservationParams) error {
+	_, err := q.db.Exec(ctx, createStockReservation,
+		arg.ReservationID,
+		arg.ProductIds,
+		arg.Quantities,
+		arg.ExpiresAt,
+	)
+	return err
+}
+
+const deleteExpiredStockReservations = `-- name: DeleteExpiredStockReservations :many
+
+DELETE FROM product.stock_reservations
+WHERE (reservation_id, product_id) IN (
+    SELECT reservation_id, product_id FROM product.stock_reservations
+    WHERE expires_at <= NOW()
+    ORDER BY expires_at
+    LIMIT $1
+    FOR UPDATE SKIP LOCKED
+)
+RETURNING reservation_id, product_id, quantity, source
+`
+
+type DeleteExpiredStockReservationsRow struct {
+	ReservationID pgtype.UUID `json:"reservation_id"`
+	ProductID     pgtype.UUID `json:"product_id"`
+	Quantity      int32       `json:"quantity"`
+	Source        pgtype.Text `json:"source"`
+}
+
+// 만료된 예약을 오래된 순으로 batch 삭제 (여러 인스턴스가 동시에 실행해도 겹치지 않음)
+func (q *Queries) DeleteExpiredStockReservations(ctx context.Context, limit int32) ([]DeleteExpiredStockReservationsRow, error) {
+	rows, err := q.db.Query(ctx, deleteExpiredStockReservations, limit)
+	if err != nil {
+		return nil, err
+	}
+	defer rows.Close()
+	var items []DeleteExpiredStockReservationsRow
+	for rows.Next() {
+		var i DeleteExpiredStockReservationsRow
+		if err := rows.Scan(
+			&i.ReservationID,
+			&i.ProductID,
+			&i.Quantity,
+			&i.Source,
+		); err != nil {
+			return nil, err
+		}
+		items = append(items, i)
+	}
+	if err := rows.Err(); err != nil {
+		return nil, err
+	}
+	return items, nil
+}
+
+const deleteHotdealStockShards = `-- name: DeleteHotdealStockShards :exec
+DELETE FROM product.hotdeal_stock_shards WHERE product_id = $1
+`
+
+func (q *Queries) DeleteHotdealStockShards(ctx context.Context, productID pgtype.UUID) error {
+	_, err := q.db.Exec(ctx, deleteHotdealStockShards, productID)
+	return err
+}
+
+const deleteImportJobsBefore = `-- name: DeleteImportJobsBefore :exec
+DELETE FROM product.import_jobs WHERE updated_at < $1
+`
+
+func (q *Queries) DeleteImportJobsBefore(ctx context.Context, updatedAt pgtype.Timestamptz) error {
+	_, err := q.db.Exec(ctx, deleteImportJobsBefore, updatedAt)
+	return err
+}
+
+const estimateProducts = `-- name: EstimateProducts :one
+SELECT reltuples::bigint FROM pg_class WHERE oid = 'product.products'::regclass
+`
+
+func (q *Queries) EstimateProducts(ctx context.Context) (int64, error) {
+	row := q.db.QueryRow(ctx, estimateProducts)
+	var reltuples int64
+	err := row.Scan(&reltuples)
+	return reltuples, err
+}
+
+const estimateProductsByCategory = `-- name: EstimateProductsByCategory :one
+
+SELECT COALESCE(
+    (c.reltuples * s.most_common_freqs[array_position(s.most_common_vals::text::text[], $1::text)])::bigint,
+    -1
+)::bigint
+FROM pg_class c
+JOIN pg_stats s ON s.schemaname = 'product' AND s.tablename = 'products' AND s.attname = 'category'
+WHERE c.oid = 'product.products'::regclass
+`
+
+// 최빈값 통계에 없는 카테고리는 -1
+func (q *Queries) EstimateProductsByCategory(ctx context.Context, category string) (int64, error) {
+	row := q.db.QueryRow(ctx, estimateProductsByCategory, category)
+	var column_1 int64
+	err := row.Scan(&column_1)
+	return column_1, err
+}
+
+const getCurrentDealByProduct = `-- name: GetCurrentDealByProduct :one
+SELECT id, deal_stock, remaining_stock FROM product.deals
+WHERE product_id = $1 AND ends_at >= $2
+ORDER BY starts_at
+LIMIT 1
+`
+
+type GetCurrentDealByProductParams struct {
+	ProductID pgtype.UUID        `json:"product_id"`
+	EndsAt    pgtype.Timestamptz `json:"ends_at"`
+}
+
+type GetCurrentDealByProductRow struct {
+	ID             pgtype.UUID `json:"id"`
+	DealStock      int32       `json:"deal_stock"`
+	RemainingStock int32       `json:"remaining_stock"`
+}
+
+func (q *Queries) GetCurrentDealByProduct(ctx context.Context, arg GetCurrentDealByProductParams) (GetCurrentDealByProductRow, error) {
+	row := q.db.QueryRow(ctx, getCurrentDealByProduct, arg.ProductID, arg.EndsAt)
+	var i GetCurrentDealByProductRow
+	err := row.Scan(&i.ID, &i.DealStock, &i.RemainingStock)
+	return i, err
+}
+
 const getDealByID = `-- name: GetDealByID :one
 SELECT d.id, d.product_id, d.deal_price, d.deal_stock, d.remaining_stock,
        d.starts_at, d.ends_at, d.created_at,
@@ -182,6 +597,88 @@ func (q *Queries) GetDealByID(ctx context.Context, id pgtype.UUID) (GetDealByIDR
 	return i, err
 }
 
+const getDealsByIDs = `-- name: GetDealsByIDs :many
+
+SELECT d.id, d.product_id, d.deal_price, d.deal_stock, d.remaining_stock,
+       d.starts_at, d.ends_at, d.created_at,
+       p.id as p_id, p.name as p_name, p.description as p_description,
+       p.price as p_price, p.stock as p_stock, p.category as p_category,
+       p.image_url as p_image_url, p.created_at as p_created_at, p.updated_at as p_updated_at
+FROM product.deals d
+JOIN product.products p ON d.product_id = p.id
+WHERE d.id = ANY($1::uuid[])
+`
+
+type GetDealsByIDsRow struct {
+	ID             pgtype.UUID        `json:"id"`
+	ProductID      pgtype.UUID        `json:"product_id"`
+	DealPrice      int32              `json:"deal_price"`
+	DealStock      int32              `json:"deal_stock"`
+	RemainingStock int32              `json:"remaining_stock"`
+	StartsAt       pgtype.Timestamptz `json:"starts_at"`
+	EndsAt         pgtype.Timestamptz `json:"ends_at"`
+	CreatedAt      pgtype.Timestamptz `json:"created_at"`
+	PID            pgtype.UUID        `json:"p_id"`
+	PName          string             `json:"p_name"`
+	PDescription   pgtype.Text        `json:"p_description"`
+	PPrice         int32              `json:"p_price"`
+	PStock         int32              `json:"p_stock"`
+	PCategory      pgtype.Text        `json:"p_category"`
+	PImageUrl      pgtype.Text        `json:"p_image_url"`
+	PCreatedAt     pgtype.Timestamptz `json:"p_created_at"`
+	PUpdatedAt     pgtype.Timestamptz `json:"p_updated_at"`
+}
+
+// 여러 핫딜을 한 번에 조회 (없는 ID는 결과에서 빠짐, 순서 보장 없음)
+func (q *Queries) GetDealsByIDs(ctx context.Context, ids []pgtype.UUID) ([]GetDealsByIDsRow, error) {
+	rows, err := q.db.Query(ctx, getDealsByIDs, ids)
+	if err != nil {
+		return nil, err
+	}
+	defer rows.Close()
+	var items []GetDealsByIDsRow
+	for rows.Next() {
+		var i GetDealsByIDsRow
+		if err := rows.Scan(
+			&i.ID,
+			&i.ProductID,
+			&i.DealPrice,
+			&i.DealStock,
+			&i.RemainingStock,
+			&i.StartsAt,
+			&i.EndsAt,
+			&i.CreatedAt,
+			&i.PID,
+			&i.PName,
+			&i.PDescription,
+			&i.PPrice,
+			&i.PStock,
+			&i.PCategory,
+			&i.PImageUrl,
+			&i.PCreatedAt,
+			&i.PUpdatedAt,
+		); err != nil {
+			return nil, err
+		}
+		items = append(items, i)
+	}
+	if err := rows.Err(); err != nil {
+		return nil, err
+	}
+	return items, nil
+}
+
+const getImportJob = `-- name: GetImportJob :one
+SELECT job::text FROM product.import_jobs WHERE id = $1
+`
+
+func (q *Queries) GetImportJob(ctx context.Context, id pgtype.UUID) (string, error) {
+	row := q.db.QueryRow(ctx, getImportJob, id)
+	var job string
+	err := row.Scan(&job)
+	return job, err
+}
+
 const getProductByID = `-- name: GetProductByID :one
 SELECT id, name, description, price, stock, category, image_url, created_at, updated_at
 FROM product.products
@@ -205,19 +702,80 @@ func (q *Queries) GetProductByID(ctx context.Context, id pgtype.UUID) (ProductPr
 	return i, err
 }
 
+const getProductCount = `-- name: GetProductCount :one
+SELECT COALESCE(SUM(count), 0)::bigint FROM product.product_counts
+`
+
+func (q *Queries) GetProductCount(ctx context.Context) (int64, error) {
+	row := q.db.QueryRow(ctx, getProductCount)
+	var column_1 int64
+	err := row.Scan(&column_1)
+	return column_1, err
+}
+
+const getProductCountByCategory = `-- name: GetProductCountByCategory :one
+SELECT count FROM product.product_counts WHERE category = $1
+`
+
+func (q *Queries) GetProductCountByCategory(ctx context.Context, category string) (int64, error) {
+	row := q.db.QueryRow(ctx, getProductCountByCategory, category)
+	var count int64
+	err := row.Scan(&count)
+	return count, err
+}
+
+const getProductsByIDs = `-- name: GetProductsByIDs :many
+
+SELECT id, name, description, price, stock, category, image_url, created_at, updated_at
+FROM product.products
+WHERE id = ANY($1::uuid[])
+`
+
+// 여러 상품을 한 번에 조회 (없는 ID는 결과에서 빠짐, 순서 보장 없음)
+func (q *Queries) GetProductsByIDs(ctx context.Context, ids []pgtype.UUID) ([]ProductProduct, error) {
+	rows, err := q.db.Query(ctx, getProductsByIDs, ids)
+	if err != nil {
+		return nil, err
+	}
+	defer rows.Close()
+	var items []ProductProduct
+	for rows.Next() {
+		var i ProductProduct
+		if err := rows.Scan(
+			&i.ID,
+			&i.Name,
+			&i.Description,
+			&i.Price,
+			&i.Stock,
+			&i.Category,
+			&i.ImageUrl,
+			&i.CreatedAt,
+			&i.UpdatedAt,
+		); err != nil {
+			return nil, err
+		}
+		items = append(items, i)
+	}
+	if err := rows.Err(); err != nil {
+		return nil, err
+	}
+	return items, nil
+}
+
 const getStockForUpdate = `-- name: GetStockForUpdate :one
-SELECT id, stock FROM product.products WHERE id = $1 FOR UPDATE
+SELECT id, stock, category FROM product.products WHERE id = $1 FOR UPDATE
 `
 
 type GetStockForUpdateRow struct {
-	ID    pgtype.UUID `json:"id"`
-	Stock int32       `json:"stock"`
+	ID       pgtype.UUID `json:"id"`
+	Stock    int32       `json:"stock"`
+	Category pgtype.Text `json:"category"`
 }
 
 func (q *Queries) GetStockForUpdate(ctx context.Context, id pgtype.UUID) (GetStockForUpdateRow, error) {
 	row := q.db.QueryRow(ctx, getStockForUpdate, id)
 	var i GetStockForUpdateRow
-	err := row.Scan(&i.ID, &i.Stock)
+	err := row.Scan(&i.ID, &i.Stock, &i.Category)
 	return i, err
 }
 
@@ -298,10 +856,50 @@ func (q *Queries) ListActiveDeals(ctx context.Context, arg ListActiveDealsParams
 	return items, nil
 }
 
+const listHotdealStockTotals = `-- name: ListHotdealStockTotals :many
+SELECT product_id, deal_id, SUM(loaded)::integer AS loaded, SUM(remaining)::integer AS remaining
+FROM product.hotdeal_stock_shards
+WHERE NOT ending
+GROUP BY product_id, deal_id
+ORDER BY product_id
+`
+
+type ListHotdealStockTotalsRow struct {
+	ProductID pgtype.UUID `json:"product_id"`
+	DealID    pgtype.UUID `json:"deal_id"`
+	Loaded    int32       `json:"loaded"`
+	Remaining int32       `json:"remaining"`
+}
+
+func (q *Queries) ListHotdealStockTotals(ctx context.Context) ([]ListHotdealStockTotalsRow, error) {
+	rows, err := q.db.Query(ctx, listHotdealStockTotals)
+	if err != nil {
+		return nil, err
+	}
+	defer rows.Close()
+	var items []ListHotdealStockTotalsRow
+	for rows.Next() {
+		var i ListHotdealStockTotalsRow
+		if err := rows.Scan(
+			&i.ProductID,
+			&i.DealID,
+			&i.Loaded,
+			&i.Remaining,
+		); err != nil {
+			return nil, err
+		}
+		items = append(items, i)
+	}
+	if err := rows.Err(); err != nil {
+		return nil, err
+	}
+	return items, nil
+}
+
 const listProducts = `-- name: ListProducts :many
 SELECT id, name, description, price, stock, category, image_url, created_at, updated_at
 FROM product.products
-ORDER BY created_at DESC
+ORDER BY created_at DESC, id DESC
 LIMIT $1 OFFSET $2
 `
 
@@ -340,11 +938,55 @@ func (q *Queries) ListProducts(ctx context.Context, arg ListProductsParams) ([]P
 	return items, nil
 }
 
+const listProductsAfter = `-- name: ListProductsAfter :many
+SELECT id, name, description, price, stock, category, image_url, created_at, updated_at
+FROM product.products
+WHERE (created_at, id) < ($1::timestamptz, $2::uuid)
+ORDER BY created_at DESC, id DESC
+LIMIT $3
+`
+
+type ListProductsAfterParams struct {
+	CreatedAt pgtype.Timestamptz `json:"created_at"`
+	ID        pgtype.UUID        `json:"id"`
+	Limit     int32              `json:"limit"`
+}
+
+func (q *Queries) ListProductsAfter(ctx context.Context, arg ListProductsAfterParams) ([]ProductProduct, error) {
+	rows, err := q.db.Query(ctx, listProductsAfter, arg.CreatedAt, arg.ID, arg.Limit)
+	if err != nil {
+		return nil, err
+	}
+	defer rows.Close()
+	var items []ProductProduct
+	for rows.Next() {
+		var i ProductProduct
+		if err := rows.Scan(
+			&i.ID,
+			&i.Name,
+			&i.Description,
+			&i.Price,
+			&i.Stock,
+			&i.Category,
+			&i.ImageUrl,
+			&i.CreatedAt,
+			&i.UpdatedAt,
+		); err != nil {
+			return nil, err
+		}
+		items = append(items, i)
+	}
+	if err := rows.Err(); err != nil {
+		return nil, err
+	}
+	return items, nil
+}
+
 const listProductsByCategory = `-- name: ListProductsByCategory :many
 SELECT id, name, description, price, stock, category, image_url, created_at, updated_at
 FROM product.products
 WHERE category = $1
-ORDER BY created_at DESC
+ORDER BY created_at DESC, id DESC
 LIMIT $2 OFFSET $3
 `
 
@@ -384,6 +1026,259 @@ func (q *Queries) ListProductsByCategory(ctx context.Context, arg ListProductsBy
 	return items, nil
 }
 
+const listProductsByCategoryAfter = `-- name: ListProductsByCategoryAfter :many
+SELECT id, name, description, price, stock, category, image_url, created_at, updated_at
+FROM product.products
+WHERE category = $1
+  AND (created_at, id) < ($2::timestamptz, $3::uuid)
+ORDER BY created_at DESC, id DESC
+LIMIT $4
+`
+
+type ListProductsByCategoryAfterParams struct {
+	Category  pgtype.Text        `json:"category"`
+	CreatedAt pgtype.Timestamptz `json:"created_at"`
+	ID        pgtype.UUID        `json:"id"`
+	Limit     int32              `json:"limit"`
+}
+
+func (q *Queries) ListProductsByCategoryAfter(ctx context.Context, arg ListProductsByCategoryAfterParams) ([]ProductProduct, error) {
+	rows, err := q.db.Query(ctx, listProductsByCategoryAfter, arg.Category, arg.CreatedAt, arg.ID, arg.Limit)
+	if err != nil {
+		return nil, err
+	}
+	defer rows.Close()
+	var items []ProductProduct
+	for rows.Next() {
+		var i ProductProduct
+		if err := rows.Scan(
+			&i.ID,
+			&i.Name,
+			&i.Description,
+			&i.Price,
+			&i.Stock,
+			&i.Category,
+			&i.ImageUrl,
+			&i.CreatedAt,
+			&i.UpdatedAt,
+		); err != nil {
+			return nil, err
+		}
+		items = append(items, i)
+	}
+	if err := rows.Err(); err != nil {
+		return nil, err
+	}
+	return items, nil
+}
+
+const listUpcomingDeals = `-- name: ListUpcomingDeals :many
+SELECT d.id, d.product_id, d.deal_price, d.deal_stock, d.remaining_stock,
+       d.starts_at, d.ends_at, d.created_at,
+       p.id as p_id, p.name as p_name, p.description as p_description,
+       p.price as p_price, p.stock as p_stock, p.category as p_category,
+       p.image_url as p_image_url, p.created_at as p_created_at, p.updated_at as p_updated_at
+FROM product.deals d
+JOIN product.products p ON d.product_id = p.id
+WHERE d.ends_at >= $1
+ORDER BY d.starts_at
+`
+
+type ListUpcomingDealsRow struct {
+	ID             pgtype.UUID        `json:"id"`
+	ProductID      pgtype.UUID        `json:"product_id"`
+	DealPrice      int32              `json:"deal_price"`
+	DealStock      int32              `json:"deal_stock"`
+	RemainingStock int32              `json:"remaining_stock"`
+	StartsAt       pgtype.Timestamptz `json:"starts_at"`
+	EndsAt         pgtype.Timestamptz `json:"ends_at"`
+	CreatedAt      pgtype.Timestamptz `json:"created_at"`
+	PID            pgtype.UUID        `json:"p_id"`
+	PName          string             `json:"p_name"`
+	PDescription   pgtype.Text        `json:"p_description"`
+	PPrice         int32              `json:"p_price"`
+	PStock         int32              `json:"p_stock"`
+	PCategory      pgtype.Text        `json:"p_category"`
+	PImageUrl      pgtype.Text        `json:"p_image_url"`
+	PCreatedAt     pgtype.Timestamptz `json:"p_created_at"`
+	PUpdatedAt     pgtype.Timestamptz `json:"p_updated_at"`
+}
+
+func (q *Queries) ListUpcomingDeals(ctx context.Context, endsAt pgtype.Timestamptz) ([]ListUpcomingDealsRow, error) {
+	rows, err := q.db.Query(ctx, listUpcomingDeals, endsAt)
+	if err != nil {
+		return nil, err
+	}
+	defer rows.Close()
+	var items []ListUpcomingDealsRow
+	for rows.Next() {
+		var i ListUpcomingDealsRow
+		if err := rows.Scan(
+			&i.ID,
+			&i.ProductID,
+			&i.DealPrice,
+			&i.DealStock,
+			&i.RemainingStock,
+			&i.StartsAt,
+			&i.EndsAt,
+			&i.CreatedAt,
+			&i.PID,
+			&i.PName,
+			&i.PDescription,
+			&i.PPrice,
+			&i.PStock,
+			&i.PCategory,
+			&i.PImageUrl,
+			&i.PCreatedAt,
+			&i.PUpdatedAt,
+		); err != nil {
+			return nil, err
+		}
+		items = append(items, i)
+	}
+	if err := rows.Err(); err != nil {
+		return nil, err
+	}
+	return items, nil
+}
+
+const lockHotdealStockShards = `-- name: LockHotdealStockShards :many
+SELECT shard, remaining FROM product.hotdeal_stock_shards
+WHERE product_id = $1 AND NOT ending
+ORDER BY shard
+FOR UPDATE
+`
+
+type LockHotdealStockShardsRow struct {
+	Shard     int16 `json:"shard"`
+	Remaining int32 `json:"remaining"`
+}
+
+func (q *Queries) LockHotdealStockShards(ctx context.Context, productID pgtype.UUID) ([]LockHotdealStockShardsRow, error) {
+	rows, err := q.db.Query(ctx, lockHotdealStockShards, productID)
+	if err != nil {
+		return nil, err
+	}
+	defer rows.Close()
+	var items []LockHotdealStockShardsRow
+	for rows.Next() {
+		var i LockHotdealStockShardsRow
+		if err := rows.Scan(&i.Shard, &i.Remaining); err != nil {
+			return nil, err
+		}
+		items = append(items, i)
+	}
+	if err := rows.Err(); err != nil {
+		return nil, err
+	}
+	return items, nil
+}
+
+const releaseStockReservation = `-- name: ReleaseStockReservation :many
+
+DELETE FROM product.stock_reservations
+WHERE reservation_id = $1
+RETURNING product_id, quantity, source
+`
+
+type ReleaseStockReservationRow struct {
+	ProductID pgtype.UUID `json:"product_id"`
+	Quantity  int32       `json:"quantity"`
+	Source    pgtype.Text `json:"source"`
+}
+
+// 취소: 삭제한 항목만 재고 반환 (sweeper와 동시에 실행되어도 한쪽만 반환)
+func (q *Queries) ReleaseStockReservation(ctx context.Context, reservationID pgtype.UUID) ([]ReleaseStockReservationRow, error) {
+	rows, err := q.db.Query(ctx, releaseStockReservation, reservationID)
+	if err != nil {
+		return nil, err
+	}
+	defer rows.Close()
+	var items []ReleaseStockReservationRow
+	for rows.Next() {
+		var i ReleaseStockReservationRow
+		if err := rows.Scan(&i.ProductID, &i.Quantity, &i.Source); err != nil {
+			return nil, err
+		}
+		items = append(items, i)
+	}
+	if err := rows.Err(); err != nil {
+		return nil, err
+	}
+	return items, nil
+}
+
+const saveImportJob = `-- name: SaveImportJob :exec
+INSERT INTO product.import_jobs (id, job, updated_at)
+VALUES ($1, $2::jsonb, NOW())
+ON CONFLICT (id) DO UPDATE SET job = EXCLUDED.job, updated_at = NOW()
+`
+
+type SaveImportJobParams struct {
+	ID  pgtype.UUID `json:"id"`
+	Job []byte      `json:"job"`
+}
+
+func (q *Queries) SaveImportJob(ctx context.Context, arg SaveImportJobParams) error {
+	_, err := q.db.Exec(ctx, saveImportJob, arg.ID, arg.Job)
+	return err
+}
+
+const setDealRemainingStock = `-- name: SetDealRemainingStock :exec
+UPDATE product.deals
+SET remaining_stock = LEAST($1::integer, deal_stock)
+WHERE id = $2
+`
+
+type SetDealRemainingStockParams struct {
+	RemainingStock int32       `json:"remaining_stock"`
+	ID             pgtype.UUID `json:"id"`
+}
+
+func (q *Queries) SetDealRemainingStock(ctx context.Context, arg SetDealRemainingStockParams) error {
+	_, err := q.db.Exec(ctx, setDealRemainingStock, arg.RemainingStock, arg.ID)
+	return err
+}
+
+const setHotdealStockShard = `-- name: SetHotdealStockShard :exec
+UPDATE product.hotdeal_stock_shards
+SET remaining = $3
+WHERE product_id = $1 AND shard = $2
+`
+
+type SetHotdealStockShardParams struct {
+	ProductID pgtype.UUID `json:"product_id"`
+	Shard     int16       `json:"shard"`
+	Remaining int32       `json:"remaining"`
+}
+
+func (q *Queries) SetHotdealStockShard(ctx context.Context, arg SetHotdealStockShardParams) error {
+	_, err := q.db.Exec(ctx, setHotdealStockShard, arg.ProductID, arg.Shard, arg.Remaining)
+	return err
+}
+
+const setStockReservationSource = `-- name: SetStockReservationSource :execrows
+
+UPDATE product.stock_reservations
+SET source = $3
+WHERE reservation_id = $1 AND product_id = $2
+`
+
+type SetStockReservationSourceParams struct {
+	ReservationID pgtype.UUID `json:"reservation_id"`
+	ProductID     pgtype.UUID `json:"product_id"`
+	Source        pgtype.Text `json:"source"`
+}
+
+// 차감과 같은 트랜잭션에서 차감한 곳 기록 (0행이면 그 사이 만료되어 sweeper가 삭제함)
+func (q *Queries) SetStockReservationSource(ctx context.Context, arg SetStockReservationSourceParams) (int64, error) {
+	result, err := q.db.Exec(ctx, setStockReservationSource, arg.ReservationID, arg.ProductID, arg.Source)
+	if err != nil {
+		return 0, err
+	}
+	return result.RowsAffected(), nil
+}
+
 const updateProduct = `-- name: UpdateProduct :one
 UPDATE product.products
 SET name = COALESCE($2, name),
@@ -0,0 +1,78 @@
+"""상품 목록 캐시 적중 경로 비용 비교 (size=100)
+
+- before: json.loads → ProductResponse(**item) → response_model 검증 → JSONResponse 직렬화
+- after: 저장된 응답 본문(str)을 헤더와 분리 후 bytes로 반환
+
+실행: uv run python -m benchmarks.cache_hit_path
+"""
+
+import json
+import time
+import timeit
+from datetime import datetime, timezone
+from uuid import uuid4
+
+from src.schemas import ProductListResponse, ProductResponse
+
+PAGE_SIZE = 100
+ROUNDS = 2000
+
+
+def _make_page() -> ProductListResponse:
+    now = datetime.now(timezone.utc)
+    items = [
+        ProductResponse(
+            id=uuid4(),
+            name=f"상품 {i}",
+            description="부하 테스트용 상품 설명입니다." * 3,
+            price=10000 + i,
+            stock=100,
+            category="electronics",
+            image_url=f"https://example.com/images/{i}.png",
+            created_at=now,
+            updated_at=now,
+        )
+        for i in range(PAGE_SIZE)
+    ]
+    return ProductListResponse(items=items, total=10_000_000, page=1, size=PAGE_SIZE)
+
+
+def main() -> None:
+    page = _make_page()
+
+    # 변경 전 캐시 값: {"items": [...], "total": N}
+    before_cached = json.dumps(
+        {"items": [item.model_dump(mode="json") for item in page.items], "total": page.total}
+    )
+    # 변경 후 캐시 값: "{만료 시각} {적재 시간}\n{응답 본문}"
+    after_cached = f"{time.time() + 600:.3f} 0.0123\n{page.model_dump_json()}"
+
+    def before() -> bytes:
+        data = json.loads(before_cached)
+        items = [ProductResponse(**item) for item in data["items"]]
+        response = ProductListResponse(items=items, total=data["total"], page=1, size=PAGE_SIZE)
+        # FastAPI response_model 처리: dict 변환 → 검증 → JSON 직렬화
+        validated = ProductListResponse.model_validate(response.model_dump())
+        return json.dumps(
+            validated.model_dump(mode="json"), ensure_ascii=False, separators=(",", ":")
+        ).encode()
+
+    def after() -> bytes:
+        header, payload = after_cached.split("\n", 1)
+        expires_at, delta = header.split(" ")
+        float(expires_at), float(delta)
+        return payload.encode()
+
+    # 두 경로의 응답 본문이 같은 내용인지 확인
+    assert json.loads(before()) == json.loads(after())
+
+    results = {}
+    for name, func in (("before", before), ("after", after)):
+        elapsed = min(timeit.repeat(func, number=ROUNDS, repeat=5))
+        results[name] = elapsed / ROUNDS * 1_000_000
+        print(f"{name:>6}: {results[name]:10.2f} µs/hit")
+    print(f"speedup: {results['before'] / results['after']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
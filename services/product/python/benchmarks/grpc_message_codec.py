@@ -0,0 +1,122 @@
+"""gRPC 메시지 인코딩/디코딩 비용 비교 (product.proto v1 vs product_v2.proto)
+
+- v1: UUID는 36자 문자열, 시각은 isoformat()/fromisoformat() 문자열
+- v2: UUID는 16바이트, 시각은 google.protobuf.Timestamp
+
+encode: 응답 모델 → 메시지 → SerializeToString (ProductServicer 변환 경로)
+decode: FromString → UUID/datetime 값 (클라이언트가 값으로 쓰는 경우)
+
+실행: uv run python -m benchmarks.grpc_message_codec (src/grpc_gen 생성 후)
+"""
+
+import timeit
+from datetime import datetime, timezone
+from uuid import UUID, uuid4
+
+from src.grpc_server import ProductServicer, ProductServicerV2
+from src.schemas import DealResponse, DealStatus, ProductResponse
+
+ROUNDS = 20000
+
+
+def _make_deal() -> DealResponse:
+    now = datetime.now(timezone.utc)
+    product = ProductResponse(
+        id=uuid4(),
+        name="상품 1",
+        description="부하 테스트용 상품 설명입니다.",
+        price=10000,
+        stock=100,
+        category="electronics",
+        image_url="https://example.com/images/1.png",
+        created_at=now,
+        updated_at=now,
+    )
+    return DealResponse(
+        id=uuid4(),
+        product_id=product.id,
+        product=product,
+        deal_price=7000,
+        deal_stock=50,
+        remaining_stock=50,
+        starts_at=now,
+        ends_at=now,
+        status=DealStatus.ACTIVE,
+        created_at=now,
+    )
+
+
+def _decode_v1(data: bytes, servicer: ProductServicer) -> tuple:
+    deal = servicer.pb2.Deal.FromString(data)
+    return (
+        UUID(deal.id),
+        UUID(deal.product_id),
+        datetime.fromisoformat(deal.start_time),
+        datetime.fromisoformat(deal.end_time),
+        UUID(deal.product.id),
+        datetime.fromisoformat(deal.product.created_at),
+        datetime.fromisoformat(deal.product.updated_at),
+    )
+
+
+def _datetime(timestamp) -> datetime:
+    # order 클라이언트와 같은 변환 (Timestamp.ToDatetime보다 빠름)
+    return datetime.fromtimestamp(timestamp.seconds + timestamp.nanos / 1e9, timezone.utc)
+
+
+def _decode_v2(data: bytes, servicer: ProductServicer) -> tuple:
+    deal = servicer.pb2.Deal.FromString(data)
+    return (
+        UUID(bytes=deal.id),
+        UUID(bytes=deal.product_id),
+        _datetime(deal.start_time),
+        _datetime(deal.end_time),
+        UUID(bytes=deal.product.id),
+        _datetime(deal.product.created_at),
+        _datetime(deal.product.updated_at),
+    )
+
+
+def main() -> None:
+    deal = _make_deal()
+    cases = (
+        ("v1", ProductServicer(), _decode_v1),
+        ("v2", ProductServicerV2(), _decode_v2),
+    )
+
+    decoded = []
+    results: dict[str, dict[str, float]] = {}
+    for name, servicer, decode in cases:
+        data = servicer._deal_message(deal).SerializeToString()
+        decoded.append(decode(data, servicer))
+
+        def encode() -> bytes:
+            return servicer._deal_message(deal).SerializeToString()
+
+        def parse() -> object:
+            return servicer.pb2.Deal.FromString(data)
+
+        results[name] = {"size": len(data)}
+        for step, func in (
+            ("encode", encode),
+            ("parse", parse),
+            ("decode", lambda: decode(data, servicer)),
+        ):
+            elapsed = min(timeit.repeat(func, number=ROUNDS, repeat=5))
+            results[name][step] = elapsed / ROUNDS * 1_000_000
+
+    # 두 버전이 같은 값을 전달하는지 확인
+    assert decoded[0] == decoded[1]
+
+    print(f"{'':>4} {'bytes':>7} {'encode':>10} {'parse':>10} {'decode':>10}  (µs/Deal)")
+    for name, result in results.items():
+        print(
+            f"{name:>4} {result['size']:7.0f} {result['encode']:10.2f} "
+            f"{result['parse']:10.2f} {result['decode']:10.2f}"
+        )
+    for step in ("encode", "decode"):
+        print(f"{step} speedup: {results['v1'][step] / results['v2'][step]:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
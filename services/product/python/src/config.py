@@ -1,3 +1,5 @@
+from typing import Literal
+
 from pydantic_settings import BaseSettings
 
 
@@ -13,6 +15,8 @@ class Settings(BaseSettings):
     db_name: str = "flash_deals"
     db_user: str = "flash"
     db_password: str = "flash1234"
+    db_pool_size: int = 5  # 프로세스당 커넥션 풀 크기
+    db_max_overflow: int = 10
 
     @property
     def database_url(self) -> str:
@@ -29,11 +33,75 @@ class Settings(BaseSettings):
 
     # Cache
     enable_cache: bool = False
-    cache_ttl: int = 60
+    cache_ttl: int = 600  # 쓰기 시 무효화되므로 TTL은 메모리 회수 용도
+    cache_stale_ttl: int = 60  # 논리 만료 후 이전 값을 반환하며 백그라운드 갱신하는 시간
+    cache_xfetch_beta: float = 1.0  # 조기 갱신 강도 (0이면 비활성화)
+    cache_lock_enabled: bool = False  # 인스턴스 간 miss 합치기 (Redis 락)
+    cache_lock_timeout: float = 5.0
+
+    # Local Cache (Redis 캐시 앞단 L1, enable_cache 필요)
+    enable_local_cache: bool = False
+    local_cache_ttl: float = 5.0  # 무효화 메시지 유실 시 최대 stale 시간
+    local_cache_max_size: int = 10_000
+
+    # List totals (목록 응답의 total 계산 방식)
+    # - exact: 매 요청 COUNT(*)
+    # - cached: COUNT(*) 결과를 재사용하고 total_cache_ttl마다 백그라운드 갱신 (근사치)
+    # - counter: 트리거로 유지되는 카테고리별 카운터 테이블 조회 (정확)
+    # - estimate: 플래너 통계(reltuples, pg_stats) 추정치 (근사치)
+    product_total_mode: Literal["exact", "cached", "counter", "estimate"] = "exact"
+    # 진행 중 핫딜은 시각에 따라 바뀌어 카운터/통계 미지원
+    deal_total_mode: Literal["exact", "cached"] = "exact"
+    total_cache_ttl: float = 30.0
+
+    # Deal index (예정/진행 중 핫딜을 메모리에 유지, 목록/상태 조회를 DB 없이 처리)
+    deal_index_enabled: bool = False
+    deal_index_tick: float = 1.0  # 상태 전환 정밀도 (초)
+    deal_index_reload_interval: float = 60.0  # 전파 메시지 유실 시 수렴 주기 (초)
+
+    # Hotdeal (핫딜 상품 재고를 Redis Lua Script로 차감, false면 DB 행 잠금)
+    hotdeal_stock_redis: bool = False
+    # Redis 없이 핫딜 재고를 N개 DB 행으로 나눠 행 잠금 분산
+    # (0이면 비활성화, hotdeal_stock_redis 우선)
+    hotdeal_stock_shards: int = 0
+    # 핫딜 남은 재고를 deals.remaining_stock에 반영하는 주기 (초)
+    hotdeal_reconcile_interval: float = 5.0
+
+    # Stock write combining (같은 상품의 동시 재고 증감을 모아 조건부 UPDATE 한 번으로 반영)
+    stock_combine_enabled: bool = False
+    stock_combine_window: float = 0.002  # 첫 요청 후 배치를 모으는 시간 (초)
+    stock_combine_max_batch: int = 100
+
+    # Stock reservation (예약 후 확정/취소, 만료된 예약은 sweeper가 재고 반환)
+    stock_reservation_ttl: int = 300  # 기본 예약 유지 시간 (초)
+    stock_reservation_max_ttl: int = 3600
+    stock_reservation_sweep_interval: float = 5.0
+    stock_reservation_sweep_batch: int = 500
+
+    # Batch lookup (GET /products?ids=, GetProducts/GetDeals RPC 한 번에 조회할 수 있는 ID 수)
+    batch_lookup_max_ids: int = 100
+
+    # Admin API (비어 있으면 비활성화, X-Admin-Key 헤더로 전달)
+    admin_api_key: str = ""
+
+    # Product import (NDJSON/CSV 대량 등록, 백그라운드 작업)
+    product_import_batch_size: int = 1000  # multi-row INSERT 단위 (배치마다 커밋)
+    # 작업 상태에 보고하는 행 오류 수 (초과분은 failed 수만 집계)
+    product_import_max_errors: int = 1000
+    # 작업 상태 보관 기간(초), 새 작업 시작 시 지난 작업을 정리
+    product_import_job_retention: int = 86400
 
     # gRPC
     grpc_enabled: bool = False
     grpc_port: int = 50051
+    # 0: FastAPI 이벤트 루프에서 함께 실행, N: python -m src.run_grpc로 N개 전용 프로세스 실행
+    grpc_workers: int = 0
+    # 프로세스당 동시 처리 RPC 수 (0: 제한 없음, 초과 시 RESOURCE_EXHAUSTED)
+    grpc_max_concurrent_rpcs: int = 0
+    grpc_shutdown_grace: float = 5.0  # 종료 시 진행 중인 RPC를 기다리는 시간(초)
+    grpc_stock_stream_max_inflight: int = 1000  # StockStream 연결 하나에서 동시에 처리하는 요청 수
+    # 직렬화된 GetProduct/GetDeal 응답 캐시 항목 수 (0: 비활성화)
+    grpc_message_cache_size: int = 10000
 
     # OpenTelemetry
     otel_enabled: bool = False
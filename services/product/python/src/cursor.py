@@ -0,0 +1,22 @@
+import base64
+from datetime import datetime
+from uuid import UUID
+
+# 커서 페이지네이션 위치 (created_at, id): ORDER BY created_at DESC, id DESC의 마지막 행
+Cursor = tuple[datetime, UUID]
+
+
+def encode_cursor(created_at: datetime, product_id: UUID) -> str:
+    """정렬 키를 불투명한 URL-safe 문자열로 인코딩"""
+    raw = f"{created_at.isoformat()}|{product_id}".encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str) -> Cursor:
+    """encode_cursor의 역변환 (형식이 잘못되면 ValueError)"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        created_at, product_id = raw.split("|")
+        return datetime.fromisoformat(created_at), UUID(product_id)
+    except (UnicodeDecodeError, ValueError) as e:
+        raise ValueError(f"invalid cursor: {cursor}") from e
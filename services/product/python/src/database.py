@@ -10,15 +10,20 @@ engine: AsyncEngine = create_async_engine(
     settings.database_url,
     echo=settings.app_debug,
     pool_pre_ping=True,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
 )
 
-# Redis 연결 (캐시 활성화 시에만 사용)
+# Redis 연결 (캐시/핫딜 Redis 재고/핫딜 인덱스 전파 활성화 시에만 사용)
 redis_client: Redis | None = None
 
 
 async def get_redis() -> Redis | None:
     global redis_client
-    if settings.enable_cache and redis_client is None:
+    uses_redis = (
+        settings.enable_cache or settings.hotdeal_stock_redis or settings.deal_index_enabled
+    )
+    if uses_redis and redis_client is None:
         redis_client = Redis.from_url(settings.redis_url, decode_responses=True)
     return redis_client
 
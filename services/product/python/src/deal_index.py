@@ -0,0 +1,196 @@
+import asyncio
+import bisect
+import logging
+import time
+from typing import Awaitable, Callable
+from uuid import UUID
+
+from redis.asyncio import Redis
+
+from src.schemas import DealResponse, DealStatus
+from src.timer_wheel import TimerHandle, TimerWheel
+
+logger = logging.getLogger(__name__)
+
+# 핫딜 추가/갱신 전파 채널 (메시지는 DealResponse JSON)
+INDEX_CHANNEL = "deals:index"
+
+
+class DealIndex:
+    """예정/진행 중 핫딜 메모리 인덱스
+
+    - 시작 시 DB에서 종료되지 않은 핫딜을 적재하고, 핫딜 생성/재고 변경은 publish()로 즉시 반영
+    - publish()는 Redis pub/sub으로 다른 인스턴스(FastAPI/gRPC 프로세스)에도 전파
+    - 메시지 유실/순서 역전은 reload_interval마다 전체 재적재로 수렴
+    - 타이머 휠이 starts_at/ends_at에 scheduled → active → ended 전환 (정밀도 tick)
+    - 진행 중 목록은 starts_at DESC로 정렬 유지, 페이지 조회는 O(page)
+    """
+
+    def __init__(
+        self,
+        loader: Callable[[], Awaitable[list[DealResponse]]],
+        tick: float = 1.0,
+        reload_interval: float = 60.0,
+        redis_factory: Callable[[], Awaitable[Redis | None]] | None = None,
+    ):
+        self._loader = loader
+        self._redis_factory = redis_factory  # None이면 전파/구독 없이 재적재로만 수렴
+        self._redis: Redis | None = None
+        self.tick = tick
+        self.reload_interval = reload_interval
+        self._wheel = TimerWheel(time.time(), tick=tick)
+        self._deals: dict[UUID, DealResponse] = {}
+        self._active: list[tuple[float, UUID]] = []  # (-starts_at, id) 오름차순 = starts_at DESC
+        self._timers: dict[UUID, list[TimerHandle]] = {}
+        self._upserted_while_loading: dict[UUID, DealResponse] | None = None
+
+    async def _get_redis(self) -> Redis | None:
+        if self._redis is None and self._redis_factory is not None:
+            self._redis = await self._redis_factory()
+        return self._redis
+
+    # 조회
+
+    def get(self, deal_id: UUID) -> DealResponse | None:
+        return self._deals.get(deal_id)
+
+    def list_active(self, page: int, size: int) -> tuple[list[DealResponse], int]:
+        offset = (page - 1) * size
+        keys = self._active[offset : offset + size]
+        return [self._deals[deal_id] for _, deal_id in keys], len(self._active)
+
+    # 변경
+
+    def upsert(self, deal: DealResponse) -> None:
+        """핫딜 추가/갱신 (status는 호출 시점 기준으로 계산된 값)"""
+        if self._upserted_while_loading is not None:
+            self._upserted_while_loading[deal.id] = deal
+
+        self.remove(deal.id)
+        if deal.status == DealStatus.ENDED:
+            return
+
+        self._deals[deal.id] = deal
+        if deal.status == DealStatus.ACTIVE:
+            bisect.insort(self._active, self._active_key(deal))
+
+        timers = []
+        if deal.status == DealStatus.SCHEDULED:
+            timers.append(
+                self._wheel.schedule(deal.starts_at.timestamp(), lambda: self._start(deal.id))
+            )
+        timers.append(self._wheel.schedule(deal.ends_at.timestamp(), lambda: self._end(deal.id)))
+        # 이미 지난 시각의 타이머는 schedule 안에서 바로 실행되어 제거되었을 수 있음
+        if deal.id in self._deals:
+            self._timers[deal.id] = [timer for timer in timers if timer is not None]
+
+    async def publish(self, deal: DealResponse) -> None:
+        """upsert 후 다른 인스턴스에 전파"""
+        self.upsert(deal)
+        redis = await self._get_redis()
+        if redis is not None:
+            await redis.publish(INDEX_CHANNEL, deal.model_dump_json())
+
+    def remove(self, deal_id: UUID) -> None:
+        for timer in self._timers.pop(deal_id, []):
+            timer.cancel()
+        deal = self._deals.pop(deal_id, None)
+        if deal is not None and deal.status == DealStatus.ACTIVE:
+            self._discard_active(deal)
+
+    def replace(self, deals: list[DealResponse]) -> None:
+        for timers in self._timers.values():
+            for timer in timers:
+                timer.cancel()
+        self._deals.clear()
+        self._active.clear()
+        self._timers.clear()
+        for deal in deals:
+            self.upsert(deal)
+
+    # 타이머 콜백
+
+    def _start(self, deal_id: UUID) -> None:
+        deal = self._deals.get(deal_id)
+        if deal is None or deal.status != DealStatus.SCHEDULED:
+            return
+        # 예정 상태에서 재고가 소진된 경우는 upsert 시 SOLD_OUT으로 들어오므로
+        # 여기서는 진행 중으로만 전환
+        deal = deal.model_copy(update={"status": DealStatus.ACTIVE})
+        self._deals[deal_id] = deal
+        bisect.insort(self._active, self._active_key(deal))
+
+    def _end(self, deal_id: UUID) -> None:
+        self._timers.pop(deal_id, None)
+        deal = self._deals.pop(deal_id, None)
+        if deal is not None and deal.status == DealStatus.ACTIVE:
+            self._discard_active(deal)
+
+    def _active_key(self, deal: DealResponse) -> tuple[float, UUID]:
+        return (-deal.starts_at.timestamp(), deal.id)
+
+    def _discard_active(self, deal: DealResponse) -> None:
+        key = self._active_key(deal)
+        i = bisect.bisect_left(self._active, key)
+        if i < len(self._active) and self._active[i] == key:
+            del self._active[i]
+
+    # 적재/실행
+
+    async def load(self) -> None:
+        """DB 전체 재적재 (조회 중 upsert된 핫딜은 재적재 결과 위에 다시 반영)"""
+        self._upserted_while_loading = {}
+        try:
+            deals = await self._loader()
+            upserted = self._upserted_while_loading
+            self._upserted_while_loading = None
+            self.replace(deals)
+            for deal in upserted.values():
+                self.upsert(deal)
+        finally:
+            self._upserted_while_loading = None
+
+    def advance(self, now: float | None = None) -> int:
+        return self._wheel.advance(time.time() if now is None else now)
+
+    async def listen(self, redis: Redis) -> None:
+        """다른 인스턴스의 publish() 구독"""
+        subscribed = False
+        while True:
+            try:
+                async with redis.pubsub() as pubsub:
+                    await pubsub.subscribe(INDEX_CHANNEL)
+                    # 재연결 중 놓친 변경이 있을 수 있으므로 재적재 (첫 구독은 시작 시 적재로 충분)
+                    if subscribed:
+                        await self.load()
+                    subscribed = True
+                    async for message in pubsub.listen():
+                        if message["type"] == "message":
+                            self.upsert(DealResponse.model_validate_json(message["data"]))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Deal index listener failed: {e}")
+                await asyncio.sleep(1.0)
+
+    async def run(self) -> None:
+        """lifespan 백그라운드 태스크 (tick마다 상태 전환, reload_interval마다 재적재, 변경 구독)"""
+        redis = await self._get_redis()
+        listener = asyncio.create_task(self.listen(redis)) if redis is not None else None
+        try:
+            await self._run_timers()
+        finally:
+            if listener is not None:
+                listener.cancel()
+
+    async def _run_timers(self) -> None:
+        next_reload = time.monotonic() + self.reload_interval
+        while True:
+            await asyncio.sleep(self.tick - time.time() % self.tick)
+            self.advance()
+            if time.monotonic() >= next_reload:
+                next_reload = time.monotonic() + self.reload_interval
+                try:
+                    await self.load()
+                except Exception as e:
+                    logger.warning(f"Deal index reload failed: {e}")
@@ -3,7 +3,7 @@
 #   sqlc v1.30.0
 import dataclasses
 import datetime
-from typing import Optional
+from typing import Any, Optional
 import uuid
 
 
@@ -19,6 +19,31 @@ class ProductDeal:
     created_at: datetime.datetime
 
 
+@dataclasses.dataclass()
+class ProductHotdealSettlement:
+    run_id: uuid.UUID
+    product_id: uuid.UUID
+    sold: int
+    settled_at: datetime.datetime
+
+
+@dataclasses.dataclass()
+class ProductHotdealStockShard:
+    product_id: uuid.UUID
+    shard: int
+    deal_id: Optional[uuid.UUID]
+    loaded: int
+    remaining: int
+    ending: bool
+
+
+@dataclasses.dataclass()
+class ProductImportJob:
+    id: uuid.UUID
+    job: Any
+    updated_at: datetime.datetime
+
+
 @dataclasses.dataclass()
 class ProductProduct:
     id: uuid.UUID
@@ -30,3 +55,18 @@ class ProductProduct:
     image_url: Optional[str]
     created_at: datetime.datetime
     updated_at: datetime.datetime
+
+
+@dataclasses.dataclass()
+class ProductProductCount:
+    category: str
+    count: int
+
+
+@dataclasses.dataclass()
+class ProductStockReservation:
+    reservation_id: uuid.UUID
+    product_id: uuid.UUID
+    quantity: int
+    expires_at: datetime.datetime
+    source: Optional[str]
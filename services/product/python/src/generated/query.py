@@ -4,7 +4,7 @@
 # source: query.sql
 import dataclasses
 import datetime
-from typing import AsyncIterator, Optional
+from typing import AsyncIterator, List, Optional
 import uuid
 
 import sqlalchemy
@@ -13,6 +13,141 @@ import sqlalchemy.ext.asyncio
 from src.generated import models
 
 
+ADJUST_HOTDEAL_STOCK_SHARD = """-- name: adjust_hotdeal_stock_shard \\:one
+
+WITH picked AS (
+    SELECT product_id, shard FROM product.hotdeal_stock_shards
+    WHERE product_id = :p1 AND NOT ending
+      AND remaining + :p2\\:\\:integer >= 0
+    ORDER BY random()
+    LIMIT 1
+    FOR UPDATE
+), updated AS (
+    UPDATE product.hotdeal_stock_shards s
+    SET remaining = s.remaining + :p2\\:\\:integer
+    FROM picked
+    WHERE s.product_id = picked.product_id AND s.shard = picked.shard
+    RETURNING s.shard, s.remaining
+)
+SELECT EXISTS (SELECT 1 FROM updated) AS adjusted, COALESCE((
+    SELECT updated.remaining + (
+        SELECT COALESCE(SUM(o.remaining), 0) FROM product.hotdeal_stock_shards o
+        WHERE o.product_id = :p1 AND o.shard <> updated.shard
+    )
+    FROM updated
+), 0)\\:\\:integer AS stock
+FROM (
+    SELECT 1 FROM product.hotdeal_stock_shards
+    WHERE product_id = :p1 AND NOT ending
+    LIMIT 1
+) hotdeal
+"""
+
+
+@dataclasses.dataclass()
+class AdjustHotdealStockShardRow:
+    adjusted: bool
+    stock: int
+
+
+ADJUST_STOCK = """-- name: adjust_stock \\:one
+
+WITH updated AS (
+    UPDATE product.products
+    SET stock = stock + :p1\\:\\:integer,
+        updated_at = GREATEST(NOW(), updated_at + INTERVAL '1 microsecond')
+    WHERE id = :p2 AND stock + :p1\\:\\:integer >= 0
+    RETURNING id, name, description, price, stock, category, image_url, created_at, updated_at
+), active_deal AS (
+    SELECT id FROM product.deals
+    WHERE product_id = :p2 AND starts_at <= :p3 AND ends_at >= :p3
+    ORDER BY starts_at
+    LIMIT 1
+), updated_deal AS (
+    UPDATE product.deals d
+    SET remaining_stock = LEAST(d.remaining_stock + :p1\\:\\:integer, d.deal_stock)
+    FROM active_deal, updated
+    WHERE d.id = active_deal.id AND d.remaining_stock + :p1\\:\\:integer >= 0
+    RETURNING d.remaining_stock
+)
+SELECT updated.id, updated.name, updated.description, updated.price, updated.stock,
+       updated.category, updated.image_url, updated.created_at, updated.updated_at,
+       active_deal.id AS deal_id, updated_deal.remaining_stock AS deal_remaining_stock
+FROM updated
+LEFT JOIN active_deal ON true
+LEFT JOIN updated_deal ON true
+"""
+
+
+@dataclasses.dataclass()
+class AdjustStockRow:
+    id: uuid.UUID
+    name: str
+    description: Optional[str]
+    price: int
+    stock: int
+    category: Optional[str]
+    image_url: Optional[str]
+    created_at: datetime.datetime
+    updated_at: datetime.datetime
+    deal_id: Optional[uuid.UUID]
+    deal_remaining_stock: Optional[int]
+
+
+BEGIN_END_HOTDEAL_STOCK_SHARDS = """-- name: begin_end_hotdeal_stock_shards \\:one
+
+WITH ending AS (
+    UPDATE product.hotdeal_stock_shards
+    SET ending = true
+    WHERE product_id = :p1
+    RETURNING deal_id, loaded, remaining
+)
+SELECT deal_id, SUM(loaded)\\:\\:integer AS loaded, SUM(remaining)\\:\\:integer AS remaining
+FROM ending
+GROUP BY deal_id
+"""
+
+
+@dataclasses.dataclass()
+class BeginEndHotdealStockShardsRow:
+    deal_id: Optional[uuid.UUID]
+    loaded: int
+    remaining: int
+
+
+BULK_CREATE_PRODUCTS = """-- name: bulk_create_products \\:execrows
+
+INSERT INTO product.products (name, description, price, stock, category, image_url)
+SELECT unnest(:p1\\:\\:text[]), unnest(:p2\\:\\:text[]),
+       unnest(:p3\\:\\:integer[]), unnest(:p4\\:\\:integer[]),
+       unnest(:p5\\:\\:text[]), unnest(:p6\\:\\:text[])
+"""
+
+
+@dataclasses.dataclass()
+class BulkCreateProductsParams:
+    names: List[str]
+    descriptions: List[str]
+    prices: List[int]
+    stocks: List[int]
+    categories: List[str]
+    image_urls: List[str]
+
+
+COMMIT_STOCK_RESERVATION = """-- name: commit_stock_reservation \\:many
+
+DELETE FROM product.stock_reservations
+WHERE reservation_id = :p1 AND expires_at > NOW()
+RETURNING product_id, quantity
+"""
+
+
+@dataclasses.dataclass()
+class CommitStockReservationRow:
+    product_id: uuid.UUID
+    quantity: int
+
+
 COUNT_ACTIVE_DEALS = """-- name: count_active_deals \\:one
 SELECT COUNT(*) FROM product.deals
 WHERE starts_at <= :p1 AND ends_at >= :p1 AND remaining_stock > 0
@@ -47,6 +182,31 @@ class CreateDealParams:
     ends_at: datetime.datetime
 
 
+CREATE_HOTDEAL_SETTLEMENT = """-- name: create_hotdeal_settlement \\:one
+
+INSERT INTO product.hotdeal_settlements (run_id, product_id, sold)
+VALUES (:p1, :p2, :p3)
+ON CONFLICT DO NOTHING
+RETURNING run_id
+"""
+
+
+CREATE_HOTDEAL_STOCK_SHARDS = """-- name: create_hotdeal_stock_shards \\:execrows
+
+INSERT INTO product.hotdeal_stock_shards (product_id, shard, deal_id, loaded, remaining)
+SELECT :p1, s.shard, :p2, s.stock, s.stock
+FROM (
+    SELECT shard, :p3\\:\\:integer / :p4\\:\\:integer
+        + CASE WHEN shard < :p3\\:\\:integer % :p4\\:\\:integer THEN 1 ELSE 0 END AS stock
+    FROM generate_series(0, :p4\\:\\:integer - 1) AS shard
+) s
+WHERE NOT EXISTS (
+    SELECT 1 FROM product.hotdeal_stock_shards WHERE product_id = :p1
+)
+ON CONFLICT DO NOTHING
+"""
+
+
 CREATE_PRODUCT = """-- name: create_product \\:one
 
 INSERT INTO product.products (name, description, price, stock, category, image_url)
@@ -65,6 +225,112 @@ class CreateProductParams:
     image_url: Optional[str]
 
 
+CREATE_STOCK_RESERVATION = """-- name: create_stock_reservation \\:exec
+
+INSERT INTO product.stock_reservations (reservation_id, product_id, quantity, expires_at)
+SELECT :p1\\:\\:uuid, unnest(:p2\\:\\:uuid[]),
+       unnest(:p3\\:\\:integer[]), :p4\\:\\:timestamptz
+"""
+
+
+DELETE_EXPIRED_STOCK_RESERVATIONS = """-- name: delete_expired_stock_reservations \\:many
+
+DELETE FROM product.stock_reservations
+WHERE (reservation_id, product_id) IN (
+    SELECT reservation_id, product_id FROM product.stock_reservations
+    WHERE expires_at <= NOW()
+    ORDER BY expires_at
+    LIMIT :p1
+    FOR UPDATE SKIP LOCKED
+)
+RETURNING reservation_id, product_id, quantity, source
+"""
+
+
+@dataclasses.dataclass()
+class DeleteExpiredStockReservationsRow:
+    reservation_id: uuid.UUID
+    product_id: uuid.UUID
+    quantity: int
+    source: Optional[str]
+
+
+DELETE_HOTDEAL_STOCK_SHARDS = """-- name: delete_hotdeal_stock_shards \\:exec
+DELETE FROM product.hotdeal_stock_shards WHERE product_id = :p1
+"""
+
+
+DELETE_IMPORT_JOBS_BEFORE = """-- name: delete_import_jobs_before \\:exec
+DELETE FROM product.import_jobs WHERE updated_at < :p1
+"""
+
+
+ESTIMATE_PRODUCTS = """-- name: estimate_products \\:one
+SELECT reltuples\\:\\:bigint FROM pg_class WHERE oid = 'product.products'\\:\\:regclass
+"""
+
+
+ESTIMATE_PRODUCTS_BY_CATEGORY = """-- name: estimate_products_by_category \\:one
+
+SELECT COALESCE(
+    (c.reltuples * s.most_common_freqs[array_position(s.most_common_vals\\:\\:text\\:\\:text[], :p1\\:\\:text)])\\:\\:bigint,
+    -1
+)\\:\\:bigint
+FROM pg_class c
+JOIN pg_stats s ON s.schemaname = 'product' AND s.tablename = 'products' AND s.attname = 'category'
+WHERE c.oid = 'product.products'\\:\\:regclass
+"""
+
+
+GET_CURRENT_DEAL_BY_PRODUCT = """-- name: get_current_deal_by_product \\:one
+SELECT id, deal_stock, remaining_stock FROM product.deals
+WHERE product_id = :p1 AND ends_at >= :p2
+ORDER BY starts_at
+LIMIT 1
+"""
+
+
+@dataclasses.dataclass()
+class GetCurrentDealByProductRow:
+    id: uuid.UUID
+    deal_stock: int
+    remaining_stock: int
+
+
+GET_DEALS_BY_IDS = """-- name: get_deals_by_ids \\:many
+
+SELECT d.id, d.product_id, d.deal_price, d.deal_stock, d.remaining_stock,
+       d.starts_at, d.ends_at, d.created_at,
+       p.id as p_id, p.name as p_name, p.description as p_description,
+       p.price as p_price, p.stock as p_stock, p.category as p_category,
+       p.image_url as p_image_url, p.created_at as p_created_at, p.updated_at as p_updated_at
+FROM product.deals d
+JOIN product.products p ON d.product_id = p.id
+WHERE d.id = ANY(:p1\\:\\:uuid[])
+"""
+
+
+@dataclasses.dataclass()
+class GetDealsByIDsRow:
+    id: uuid.UUID
+    product_id: uuid.UUID
+    deal_price: int
+    deal_stock: int
+    remaining_stock: int
+    starts_at: datetime.datetime
+    ends_at: datetime.datetime
+    created_at: datetime.datetime
+    p_id: uuid.UUID
+    p_name: str
+    p_description: Optional[str]
+    p_price: int
+    p_stock: int
+    p_category: Optional[str]
+    p_image_url: Optional[str]
+    p_created_at: datetime.datetime
+    p_updated_at: datetime.datetime
+
+
 GET_DEAL_BY_ID = """-- name: get_deal_by_id \\:one
 SELECT d.id, d.product_id, d.deal_price, d.deal_stock, d.remaining_stock,
        d.starts_at, d.ends_at, d.created_at,
@@ -98,6 +364,19 @@ class GetDealByIDRow:
     p_updated_at: datetime.datetime
 
 
+GET_IMPORT_JOB = """-- name: get_import_job \\:one
+SELECT job\\:\\:text FROM product.import_jobs WHERE id = :p1
+"""
+
+
+GET_PRODUCTS_BY_IDS = """-- name: get_products_by_ids \\:many
+
+SELECT id, name, description, price, stock, category, image_url, created_at, updated_at
+FROM product.products
+WHERE id = ANY(:p1\\:\\:uuid[])
+"""
+
+
 GET_PRODUCT_BY_ID = """-- name: get_product_by_id \\:one
 SELECT id, name, description, price, stock, category, image_url, created_at, updated_at
 FROM product.products
@@ -105,8 +384,18 @@ WHERE id = :p1
 """
 
 
+GET_PRODUCT_COUNT = """-- name: get_product_count \\:one
+SELECT COALESCE(SUM(count), 0)\\:\\:bigint FROM product.product_counts
+"""
+
+
+GET_PRODUCT_COUNT_BY_CATEGORY = """-- name: get_product_count_by_category \\:one
+SELECT count FROM product.product_counts WHERE category = :p1
+"""
+
+
 GET_STOCK_FOR_UPDATE = """-- name: get_stock_for_update \\:one
-SELECT id, stock FROM product.products WHERE id = :p1 FOR UPDATE
+SELECT id, stock, category FROM product.products WHERE id = :p1 FOR UPDATE
 """
 
 
@@ -114,6 +403,7 @@ SELECT id, stock FROM product.products WHERE id = :p1 FOR UPDATE
 class GetStockForUpdateRow:
     id: uuid.UUID
     stock: int
+    category: Optional[str]
 
 
 LIST_ACTIVE_DEALS = """-- name: list_active_deals \\:many
@@ -151,23 +441,151 @@ class ListActiveDealsRow:
     p_updated_at: datetime.datetime
 
 
+LIST_HOTDEAL_STOCK_TOTALS = """-- name: list_hotdeal_stock_totals \\:many
+SELECT product_id, deal_id, SUM(loaded)\\:\\:integer AS loaded, SUM(remaining)\\:\\:integer AS remaining
+FROM product.hotdeal_stock_shards
+WHERE NOT ending
+GROUP BY product_id, deal_id
+ORDER BY product_id
+"""
+
+
+@dataclasses.dataclass()
+class ListHotdealStockTotalsRow:
+    product_id: uuid.UUID
+    deal_id: Optional[uuid.UUID]
+    loaded: int
+    remaining: int
+
+
 LIST_PRODUCTS = """-- name: list_products \\:many
 SELECT id, name, description, price, stock, category, image_url, created_at, updated_at
 FROM product.products
-ORDER BY created_at DESC
+ORDER BY created_at DESC, id DESC
 LIMIT :p1 OFFSET :p2
 """
 
 
+LIST_PRODUCTS_AFTER = """-- name: list_products_after \\:many
+SELECT id, name, description, price, stock, category, image_url, created_at, updated_at
+FROM product.products
+WHERE (created_at, id) < (:p1\\:\\:timestamptz, :p2\\:\\:uuid)
+ORDER BY created_at DESC, id DESC
+LIMIT :p3
+"""
+
+
 LIST_PRODUCTS_BY_CATEGORY = """-- name: list_products_by_category \\:many
 SELECT id, name, description, price, stock, category, image_url, created_at, updated_at
 FROM product.products
 WHERE category = :p1
-ORDER BY created_at DESC
+ORDER BY created_at DESC, id DESC
 LIMIT :p2 OFFSET :p3
 """
 
 
+LIST_PRODUCTS_BY_CATEGORY_AFTER = """-- name: list_products_by_category_after \\:many
+SELECT id, name, description, price, stock, category, image_url, created_at, updated_at
+FROM product.products
+WHERE category = :p1
+  AND (created_at, id) < (:p2\\:\\:timestamptz, :p3\\:\\:uuid)
+ORDER BY created_at DESC, id DESC
+LIMIT :p4
+"""
+
+
+LIST_UPCOMING_DEALS = """-- name: list_upcoming_deals \\:many
+SELECT d.id, d.product_id, d.deal_price, d.deal_stock, d.remaining_stock,
+       d.starts_at, d.ends_at, d.created_at,
+       p.id as p_id, p.name as p_name, p.description as p_description,
+       p.price as p_price, p.stock as p_stock, p.category as p_category,
+       p.image_url as p_image_url, p.created_at as p_created_at, p.updated_at as p_updated_at
+FROM product.deals d
+JOIN product.products p ON d.product_id = p.id
+WHERE d.ends_at >= :p1
+ORDER BY d.starts_at
+"""
+
+
+@dataclasses.dataclass()
+class ListUpcomingDealsRow:
+    id: uuid.UUID
+    product_id: uuid.UUID
+    deal_price: int
+    deal_stock: int
+    remaining_stock: int
+    starts_at: datetime.datetime
+    ends_at: datetime.datetime
+    created_at: datetime.datetime
+    p_id: uuid.UUID
+    p_name: str
+    p_description: Optional[str]
+    p_price: int
+    p_stock: int
+    p_category: Optional[str]
+    p_image_url: Optional[str]
+    p_created_at: datetime.datetime
+    p_updated_at: datetime.datetime
+
+
+LOCK_HOTDEAL_STOCK_SHARDS = """-- name: lock_hotdeal_stock_shards \\:many
+SELECT shard, remaining FROM product.hotdeal_stock_shards
+WHERE product_id = :p1 AND NOT ending
+ORDER BY shard
+FOR UPDATE
+"""
+
+
+@dataclasses.dataclass()
+class LockHotdealStockShardsRow:
+    shard: int
+    remaining: int
+
+
+RELEASE_STOCK_RESERVATION = """-- name: release_stock_reservation \\:many
+
+DELETE FROM product.stock_reservations
+WHERE reservation_id = :p1
+RETURNING product_id, quantity, source
+"""
+
+
+@dataclasses.dataclass()
+class ReleaseStockReservationRow:
+    product_id: uuid.UUID
+    quantity: int
+    source: Optional[str]
+
+
+SAVE_IMPORT_JOB = """-- name: save_import_job \\:exec
+INSERT INTO product.import_jobs (id, job, updated_at)
+VALUES (:p1, :p2\\:\\:jsonb, NOW())
+ON CONFLICT (id) DO UPDATE SET job = EXCLUDED.job, updated_at = NOW()
+"""
+
+
+SET_DEAL_REMAINING_STOCK = """-- name: set_deal_remaining_stock \\:exec
+UPDATE product.deals
+SET remaining_stock = LEAST(:p1\\:\\:integer, deal_stock)
+WHERE id = :p2
+"""
+
+
+SET_HOTDEAL_STOCK_SHARD = """-- name: set_hotdeal_stock_shard \\:exec
+UPDATE product.hotdeal_stock_shards
+SET remaining = :p3
+WHERE product_id = :p1 AND shard = :p2
+"""
+
+
+SET_STOCK_RESERVATION_SOURCE = """-- name: set_stock_reservation_source \\:execrows
+
+UPDATE product.stock_reservations
+SET source = :p3
+WHERE reservation_id = :p1 AND product_id = :p2
+"""
+
+
 UPDATE_PRODUCT = """-- name: update_product \\:one
 UPDATE product.products
 SET name = COALESCE(:p2, name),
@@ -210,6 +628,62 @@ class AsyncQuerier:
     def __init__(self, conn: sqlalchemy.ext.asyncio.AsyncConnection):
         self._conn = conn
 
+    async def adjust_hotdeal_stock_shard(self, *, product_id: uuid.UUID, delta: int) -> Optional[AdjustHotdealStockShardRow]:
+        row = (await self._conn.execute(sqlalchemy.text(ADJUST_HOTDEAL_STOCK_SHARD), {"p1": product_id, "p2": delta})).first()
+        if row is None:
+            return None
+        return AdjustHotdealStockShardRow(
+            adjusted=row[0],
+            stock=row[1],
+        )
+
+    async def adjust_stock(self, *, delta: int, id: uuid.UUID, now: datetime.datetime) -> Optional[AdjustStockRow]:
+        row = (await self._conn.execute(sqlalchemy.text(ADJUST_STOCK), {"p1": delta, "p2": id, "p3": now})).first()
+        if row is None:
+            return None
+        return AdjustStockRow(
+            id=row[0],
+            name=row[1],
+            description=row[2],
+            price=row[3],
+            stock=row[4],
+            category=row[5],
+            image_url=row[6],
+            created_at=row[7],
+            updated_at=row[8],
+            deal_id=row[9],
+            deal_remaining_stock=row[10],
+        )
+
+    async def begin_end_hotdeal_stock_shards(self, *, product_id: uuid.UUID) -> Optional[BeginEndHotdealStockShardsRow]:
+        row = (await self._conn.execute(sqlalchemy.text(BEGIN_END_HOTDEAL_STOCK_SHARDS), {"p1": product_id})).first()
+        if row is None:
+            return None
+        return BeginEndHotdealStockShardsRow(
+            deal_id=row[0],
+            loaded=row[1],
+            remaining=row[2],
+        )
+
+    async def bulk_create_products(self, arg: BulkCreateProductsParams) -> int:
+        result = await self._conn.execute(sqlalchemy.text(BULK_CREATE_PRODUCTS), {
+            "p1": arg.names,
+            "p2": arg.descriptions,
+            "p3": arg.prices,
+            "p4": arg.stocks,
+            "p5": arg.categories,
+            "p6": arg.image_urls,
+        })
+        return result.rowcount
+
+    async def commit_stock_reservation(self, *, reservation_id: uuid.UUID) -> AsyncIterator[CommitStockReservationRow]:
+        result = await self._conn.stream(sqlalchemy.text(COMMIT_STOCK_RESERVATION), {"p1": reservation_id})
+        async for row in result:
+            yield CommitStockReservationRow(
+                product_id=row[0],
+                quantity=row[1],
+            )
+
     async def count_active_deals(self, *, starts_at: datetime.datetime) -> Optional[int]:
         row = (await self._conn.execute(sqlalchemy.text(COUNT_ACTIVE_DEALS), {"p1": starts_at})).first()
         if row is None:
@@ -250,6 +724,21 @@ class AsyncQuerier:
             created_at=row[7],
         )
 
+    async def create_hotdeal_settlement(self, *, run_id: uuid.UUID, product_id: uuid.UUID, sold: int) -> Optional[uuid.UUID]:
+        row = (await self._conn.execute(sqlalchemy.text(CREATE_HOTDEAL_SETTLEMENT), {"p1": run_id, "p2": product_id, "p3": sold})).first()
+        if row is None:
+            return None
+        return row[0]
+
+    async def create_hotdeal_stock_shards(self, *, product_id: uuid.UUID, deal_id: Optional[uuid.UUID], stock: int, shards: int) -> int:
+        result = await self._conn.execute(sqlalchemy.text(CREATE_HOTDEAL_STOCK_SHARDS), {
+            "p1": product_id,
+            "p2": deal_id,
+            "p3": stock,
+            "p4": shards,
+        })
+        return result.rowcount
+
     async def create_product(self, arg: CreateProductParams) -> Optional[models.ProductProduct]:
         row = (await self._conn.execute(sqlalchemy.text(CREATE_PRODUCT), {
             "p1": arg.name,
@@ -273,6 +762,47 @@ class AsyncQuerier:
             updated_at=row[8],
         )
 
+    async def create_stock_reservation(self, *, reservation_id: uuid.UUID, product_ids: List[uuid.UUID], quantities: List[int], expires_at: datetime.datetime) -> None:
+        await self._conn.execute(sqlalchemy.text(CREATE_STOCK_RESERVATION), {"p1": reservation_id, "p2": product_ids, "p3": quantities, "p4": expires_at})
+
+    async def delete_expired_stock_reservations(self, *, limit: int) -> AsyncIterator[DeleteExpiredStockReservationsRow]:
+        result = await self._conn.stream(sqlalchemy.text(DELETE_EXPIRED_STOCK_RESERVATIONS), {"p1": limit})
+        async for row in result:
+            yield DeleteExpiredStockReservationsRow(
+                reservation_id=row[0],
+                product_id=row[1],
+                quantity=row[2],
+                source=row[3],
+            )
+
+    async def delete_hotdeal_stock_shards(self, *, product_id: uuid.UUID) -> None:
+        await self._conn.execute(sqlalchemy.text(DELETE_HOTDEAL_STOCK_SHARDS), {"p1": product_id})
+
+    async def delete_import_jobs_before(self, *, updated_at: datetime.datetime) -> None:
+        await self._conn.execute(sqlalchemy.text(DELETE_IMPORT_JOBS_BEFORE), {"p1": updated_at})
+
+    async def estimate_products(self) -> Optional[int]:
+        row = (await self._conn.execute(sqlalchemy.text(ESTIMATE_PRODUCTS))).first()
+        if row is None:
+            return None
+        return row[0]
+
+    async def estimate_products_by_category(self, *, category: str) -> Optional[int]:
+        row = (await self._conn.execute(sqlalchemy.text(ESTIMATE_PRODUCTS_BY_CATEGORY), {"p1": category})).first()
+        if row is None:
+            return None
+        return row[0]
+
+    async def get_current_deal_by_product(self, *, product_id: uuid.UUID, ends_at: datetime.datetime) -> Optional[GetCurrentDealByProductRow]:
+        row = (await self._conn.execute(sqlalchemy.text(GET_CURRENT_DEAL_BY_PRODUCT), {"p1": product_id, "p2": ends_at})).first()
+        if row is None:
+            return None
+        return GetCurrentDealByProductRow(
+            id=row[0],
+            deal_stock=row[1],
+            remaining_stock=row[2],
+        )
+
     async def get_deal_by_id(self, *, id: uuid.UUID) -> Optional[GetDealByIDRow]:
         row = (await self._conn.execute(sqlalchemy.text(GET_DEAL_BY_ID), {"p1": id})).first()
         if row is None:
@@ -297,6 +827,35 @@ class AsyncQuerier:
             p_updated_at=row[16],
         )
 
+    async def get_deals_by_ids(self, *, ids: List[uuid.UUID]) -> AsyncIterator[GetDealsByIDsRow]:
+        result = await self._conn.stream(sqlalchemy.text(GET_DEALS_BY_IDS), {"p1": ids})
+        async for row in result:
+            yield GetDealsByIDsRow(
+                id=row[0],
+                product_id=row[1],
+                deal_price=row[2],
+                deal_stock=row[3],
+                remaining_stock=row[4],
+                starts_at=row[5],
+                ends_at=row[6],
+                created_at=row[7],
+                p_id=row[8],
+                p_name=row[9],
+                p_description=row[10],
+                p_price=row[11],
+                p_stock=row[12],
+                p_category=row[13],
+                p_image_url=row[14],
+                p_created_at=row[15],
+                p_updated_at=row[16],
+            )
+
+    async def get_import_job(self, *, id: uuid.UUID) -> Optional[str]:
+        row = (await self._conn.execute(sqlalchemy.text(GET_IMPORT_JOB), {"p1": id})).first()
+        if row is None:
+            return None
+        return row[0]
+
     async def get_product_by_id(self, *, id: uuid.UUID) -> Optional[models.ProductProduct]:
         row = (await self._conn.execute(sqlalchemy.text(GET_PRODUCT_BY_ID), {"p1": id})).first()
         if row is None:
@@ -313,6 +872,33 @@ class AsyncQuerier:
             updated_at=row[8],
         )
 
+    async def get_product_count(self) -> Optional[int]:
+        row = (await self._conn.execute(sqlalchemy.text(GET_PRODUCT_COUNT))).first()
+        if row is None:
+            return None
+        return row[0]
+
+    async def get_product_count_by_category(self, *, category: str) -> Optional[int]:
+        row = (await self._conn.execute(sqlalchemy.text(GET_PRODUCT_COUNT_BY_CATEGORY), {"p1": category})).first()
+        if row is None:
+            return None
+        return row[0]
+
+    async def get_products_by_ids(self, *, ids: List[uuid.UUID]) -> AsyncIterator[models.ProductProduct]:
+        result = await self._conn.stream(sqlalchemy.text(GET_PRODUCTS_BY_IDS), {"p1": ids})
+        async for row in result:
+            yield models.ProductProduct(
+                id=row[0],
+                name=row[1],
+                description=row[2],
+                price=row[3],
+                stock=row[4],
+                category=row[5],
+                image_url=row[6],
+                created_at=row[7],
+                updated_at=row[8],
+            )
+
     async def get_stock_for_update(self, *, id: uuid.UUID) -> Optional[GetStockForUpdateRow]:
         row = (await self._conn.execute(sqlalchemy.text(GET_STOCK_FOR_UPDATE), {"p1": id})).first()
         if row is None:
@@ -320,6 +906,7 @@ class AsyncQuerier:
         return GetStockForUpdateRow(
             id=row[0],
             stock=row[1],
+            category=row[2],
         )
 
     async def list_active_deals(self, *, starts_at: datetime.datetime, limit: int, offset: int) -> AsyncIterator[ListActiveDealsRow]:
@@ -345,6 +932,16 @@ class AsyncQuerier:
                 p_updated_at=row[16],
             )
 
+    async def list_hotdeal_stock_totals(self) -> AsyncIterator[ListHotdealStockTotalsRow]:
+        result = await self._conn.stream(sqlalchemy.text(LIST_HOTDEAL_STOCK_TOTALS))
+        async for row in result:
+            yield ListHotdealStockTotalsRow(
+                product_id=row[0],
+                deal_id=row[1],
+                loaded=row[2],
+                remaining=row[3],
+            )
+
     async def list_products(self, *, limit: int, offset: int) -> AsyncIterator[models.ProductProduct]:
         result = await self._conn.stream(sqlalchemy.text(LIST_PRODUCTS), {"p1": limit, "p2": offset})
         async for row in result:
@@ -360,6 +957,21 @@ class AsyncQuerier:
                 updated_at=row[8],
             )
 
+    async def list_products_after(self, *, created_at: datetime.datetime, id: uuid.UUID, limit: int) -> AsyncIterator[models.ProductProduct]:
+        result = await self._conn.stream(sqlalchemy.text(LIST_PRODUCTS_AFTER), {"p1": created_at, "p2": id, "p3": limit})
+        async for row in result:
+            yield models.ProductProduct(
+                id=row[0],
+                name=row[1],
+                description=row[2],
+                price=row[3],
+                stock=row[4],
+                category=row[5],
+                image_url=row[6],
+                created_at=row[7],
+                updated_at=row[8],
+            )
+
     async def list_products_by_category(self, *, category: Optional[str], limit: int, offset: int) -> AsyncIterator[models.ProductProduct]:
         result = await self._conn.stream(sqlalchemy.text(LIST_PRODUCTS_BY_CATEGORY), {"p1": category, "p2": limit, "p3": offset})
         async for row in result:
@@ -375,6 +987,74 @@ class AsyncQuerier:
                 updated_at=row[8],
             )
 
+    async def list_products_by_category_after(self, *, category: Optional[str], created_at: datetime.datetime, id: uuid.UUID, limit: int) -> AsyncIterator[models.ProductProduct]:
+        result = await self._conn.stream(sqlalchemy.text(LIST_PRODUCTS_BY_CATEGORY_AFTER), {"p1": category, "p2": created_at, "p3": id, "p4": limit})
+        async for row in result:
+            yield models.ProductProduct(
+                id=row[0],
+                name=row[1],
+                description=row[2],
+                price=row[3],
+                stock=row[4],
+                category=row[5],
+                image_url=row[6],
+                created_at=row[7],
+                updated_at=row[8],
+            )
+
+    async def list_upcoming_deals(self, *, ends_at: datetime.datetime) -> AsyncIterator[ListUpcomingDealsRow]:
+        result = await self._conn.stream(sqlalchemy.text(LIST_UPCOMING_DEALS), {"p1": ends_at})
+        async for row in result:
+            yield ListUpcomingDealsRow(
+                id=row[0],
+                product_id=row[1],
+                deal_price=row[2],
+                deal_stock=row[3],
+                remaining_stock=row[4],
+                starts_at=row[5],
+                ends_at=row[6],
+                created_at=row[7],
+                p_id=row[8],
+                p_name=row[9],
+                p_description=row[10],
+                p_price=row[11],
+                p_stock=row[12],
+                p_category=row[13],
+                p_image_url=row[14],
+                p_created_at=row[15],
+                p_updated_at=row[16],
+            )
+
+    async def lock_hotdeal_stock_shards(self, *, product_id: uuid.UUID) -> AsyncIterator[LockHotdealStockShardsRow]:
+        result = await self._conn.stream(sqlalchemy.text(LOCK_HOTDEAL_STOCK_SHARDS), {"p1": product_id})
+        async for row in result:
+            yield LockHotdealStockShardsRow(
+                shard=row[0],
+                remaining=row[1],
+            )
+
+    async def release_stock_reservation(self, *, reservation_id: uuid.UUID) -> AsyncIterator[ReleaseStockReservationRow]:
+        result = await self._conn.stream(sqlalchemy.text(RELEASE_STOCK_RESERVATION), {"p1": reservation_id})
+        async for row in result:
+            yield ReleaseStockReservationRow(
+                product_id=row[0],
+                quantity=row[1],
+                source=row[2],
+            )
+
+    async def save_import_job(self, *, id: uuid.UUID, job: str) -> None:
+        await self._conn.execute(sqlalchemy.text(SAVE_IMPORT_JOB), {"p1": id, "p2": job})
+
+    async def set_deal_remaining_stock(self, *, remaining_stock: int, id: uuid.UUID) -> None:
+        await self._conn.execute(sqlalchemy.text(SET_DEAL_REMAINING_STOCK), {"p1": remaining_stock, "p2": id})
+
+    async def set_hotdeal_stock_shard(self, *, product_id: uuid.UUID, shard: int, remaining: int) -> None:
+        await self._conn.execute(sqlalchemy.text(SET_HOTDEAL_STOCK_SHARD), {"p1": product_id, "p2": shard, "p3": remaining})
+
+    async def set_stock_reservation_source(self, *, reservation_id: uuid.UUID, product_id: uuid.UUID, source: Optional[str]) -> int:
+        result = await self._conn.execute(sqlalchemy.text(SET_STOCK_RESERVATION_SOURCE), {"p1": reservation_id, "p2": product_id, "p3": source})
+        return result.rowcount
+
     async def update_product(self, arg: UpdateProductParams) -> Optional[models.ProductProduct]:
         row = (await self._conn.execute(sqlalchemy.text(UPDATE_PRODUCT), {
             "p1": arg.id,
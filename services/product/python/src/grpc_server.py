@@ -1,37 +1,174 @@
 import asyncio
+import functools
 import logging
-from concurrent import futures
+import multiprocessing
+import signal
+import weakref
+from collections import OrderedDict
+from datetime import datetime
+from multiprocessing.connection import wait
+from typing import Any, Callable
 from uuid import UUID
 
 import grpc
 from grpc_reflection.v1alpha import reflection
 
 from src.config import settings
-from src.service import ProductServiceError, get_deal, get_product, update_stock
+from src.database import close_redis, engine
+from src.repository import LocalCachedProductRepository
+from src.repository.metrics import record_cache_lookup
+from src.schemas import (
+    DealResponse,
+    ProductResponse,
+    StockReservationItem,
+    StockReservationResponse,
+    StockResponse,
+)
+from src.service import (
+    ProductServiceError,
+    get_deal,
+    get_deal_index,
+    get_deals,
+    get_product,
+    get_products,
+    get_repository,
+    update_stock,
+    update_stock_product,
+)
+from src.stock_reservation import commit_reservation, release_reservation, reserve_stock
 
 # gRPC generated code (생성 후 사용)
-from src.grpc_gen import product_pb2, product_pb2_grpc
+from src.grpc_gen import product_pb2, product_pb2_grpc, product_v2_pb2, product_v2_pb2_grpc
 
 logger = logging.getLogger(__name__)
 
+_HANDLER_FACTORIES = {
+    (False, False): grpc.unary_unary_rpc_method_handler,
+    (False, True): grpc.unary_stream_rpc_method_handler,
+    (True, False): grpc.stream_unary_rpc_method_handler,
+    (True, True): grpc.stream_stream_rpc_method_handler,
+}
+
+
+class SerializedMessageCache:
+    """응답 객체별 직렬화된 메시지 bytes 캐시
+
+    L1 상품 캐시와 핫딜 인덱스는 값이 바뀌면 기존 객체를 고치지 않고 새 객체로 교체하므로,
+    객체 identity를 키로 쓰면 별도 무효화 없이
+    원본 캐시에서 빠지는 시점(weakref 콜백)에 함께 폐기됨.
+    매번 새 객체를 만드는 경로(Redis만 사용, DB 조회)는 적중하지 않고 직렬화만 수행
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._entries: OrderedDict[int, tuple[weakref.ref, bytes]] = OrderedDict()
+
+    def get(self, kind: str, value: Any, serialize: Callable[[Any], bytes]) -> bytes:
+        key = id(value)
+        entry = self._entries.get(key)
+        hit = entry is not None and entry[0]() is value
+        record_cache_lookup("grpc", kind, hit)
+        if hit:
+            self._entries.move_to_end(key)
+            return entry[1]
+
+        data = serialize(value)
+        if self.max_size > 0:
+            self._entries[key] = (weakref.ref(value, functools.partial(self._discard, key)), data)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        return data
+
+    def _discard(self, key: int, ref: weakref.ref) -> None:
+        # 같은 id를 재사용한 새 객체의 항목은 유지
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] is ref:
+            del self._entries[key]
+
 
 class ProductServicer(product_pb2_grpc.ProductServiceServicer):
-    """Product gRPC Service 구현"""
+    """Product gRPC Service 구현 (v1: 문자열 ID, ISO 8601 시각)
+
+    메시지 변환은 메서드로 분리되어 있어 ProductServicerV2는 변환만 바꿔서 재사용
+    """
+
+    pb2 = product_pb2
+
+    # 직렬화된 bytes를 그대로 반환하는 RPC (add_servicer에서 응답 직렬화 생략)
+    SERIALIZED_METHODS = frozenset({"GetProduct", "GetDeal"})
+
+    def __init__(self):
+        self._messages = SerializedMessageCache(settings.grpc_message_cache_size)
+
+    @staticmethod
+    def _uuid(value: str) -> UUID:
+        return UUID(value)
+
+    @staticmethod
+    def _id(value: UUID) -> str:
+        return str(value)
+
+    @staticmethod
+    def _time(value: datetime | None) -> str:
+        return value.isoformat() if value else ""
+
+    def _product_message(self, product: ProductResponse):
+        return self.pb2.Product(
+            id=self._id(product.id),
+            name=product.name,
+            description=product.description or "",
+            price=product.price,
+            stock=product.stock,
+            created_at=self._time(product.created_at),
+            updated_at=self._time(product.updated_at),
+        )
+
+    def _deal_message(self, deal: DealResponse):
+        return self.pb2.Deal(
+            id=self._id(deal.id),
+            product_id=self._id(deal.product_id),
+            deal_price=deal.deal_price,
+            stock_limit=deal.deal_stock,
+            start_time=self._time(deal.starts_at),
+            end_time=self._time(deal.ends_at),
+            status=deal.status.value,
+            product=self._product_message(deal.product),
+        )
+
+    def _stock_result_message(self, result: StockResponse):
+        return self.pb2.StockResult(
+            product_id=self._id(result.product_id),
+            stock=result.stock,
+            updated_at=self._time(result.updated_at),
+        )
+
+    def _reservation_items(self, request) -> list[StockReservationItem]:
+        items = [
+            StockReservationItem(product_id=self._uuid(item.product_id), quantity=item.quantity)
+            for item in request.items
+        ]
+        if not items:
+            raise ValueError("items is empty")
+        return items
+
+    def _reservation_message(self, reservation: StockReservationResponse):
+        return self.pb2.Reservation(
+            reservation_id=self._id(reservation.reservation_id),
+            items=[
+                self.pb2.StockItem(product_id=self._id(item.product_id), quantity=item.quantity)
+                for item in reservation.items
+            ],
+            expires_at=self._time(reservation.expires_at),
+        )
 
     async def GetProduct(self, request, context):
-        """상품 정보 조회"""
+        """상품 정보 조회 (L1 캐시 적중 시 직렬화된 응답 재사용, 메시지 생성 없음)"""
         try:
-            product_id = UUID(request.product_id)
+            product_id = self._uuid(request.product_id)
             product = await get_product(product_id)
-
-            return product_pb2.Product(
-                id=str(product.id),
-                name=product.name,
-                description=product.description or "",
-                price=product.price,
-                stock=product.stock,
-                created_at=product.created_at.isoformat() if product.created_at else "",
-                updated_at=product.updated_at.isoformat() if product.updated_at else "",
+            return self._messages.get(
+                "detail", product, lambda p: self._product_message(p).SerializeToString()
             )
         except ProductServiceError as e:
             if e.status_code == 404:
@@ -39,37 +176,19 @@ class ProductServicer(product_pb2_grpc.ProductServiceServicer):
             else:
                 context.set_code(grpc.StatusCode.INTERNAL)
             context.set_details(e.message)
-            return product_pb2.Product()
+            return b""  # 빈 Product
         except ValueError:
             context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
             context.set_details("Invalid product_id format")
-            return product_pb2.Product()
+            return b""
 
     async def GetDeal(self, request, context):
-        """핫딜 정보 조회"""
+        """핫딜 정보 조회 (핫딜 인덱스 적중 시 직렬화된 응답 재사용, 메시지 생성 없음)"""
         try:
-            deal_id = UUID(request.deal_id)
+            deal_id = self._uuid(request.deal_id)
             deal = await get_deal(deal_id)
-
-            product_msg = product_pb2.Product(
-                id=str(deal.product.id),
-                name=deal.product.name,
-                description=deal.product.description or "",
-                price=deal.product.price,
-                stock=deal.product.stock,
-                created_at=deal.product.created_at.isoformat() if deal.product.created_at else "",
-                updated_at=deal.product.updated_at.isoformat() if deal.product.updated_at else "",
-            )
-
-            return product_pb2.Deal(
-                id=str(deal.id),
-                product_id=str(deal.product_id),
-                deal_price=deal.deal_price,
-                stock_limit=deal.deal_stock,
-                start_time=deal.starts_at.isoformat() if deal.starts_at else "",
-                end_time=deal.ends_at.isoformat() if deal.ends_at else "",
-                status=deal.status.value,
-                product=product_msg,
+            return self._messages.get(
+                "deal", deal, lambda d: self._deal_message(d).SerializeToString()
             )
         except ProductServiceError as e:
             if e.status_code == 404:
@@ -77,29 +196,75 @@ class ProductServicer(product_pb2_grpc.ProductServiceServicer):
             else:
                 context.set_code(grpc.StatusCode.INTERNAL)
             context.set_details(e.message)
-            return product_pb2.Deal()
+            return b""  # 빈 Deal
         except ValueError:
             context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
             context.set_details("Invalid deal_id format")
-            return product_pb2.Deal()
+            return b""
+
+    async def GetProducts(self, request, context):
+        """상품 여러 건 조회 (캐시 MGET + miss만 DB 한 번)"""
+        try:
+            product_ids = [self._uuid(product_id) for product_id in request.product_ids]
+            products = await get_products(product_ids)
+            return self.pb2.ProductList(products=[self._product_message(p) for p in products])
+        except ProductServiceError as e:
+            if e.status_code == 400:
+                context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+            else:
+                context.set_code(grpc.StatusCode.INTERNAL)
+            context.set_details(e.message)
+            return self.pb2.ProductList()
+        except ValueError:
+            context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+            context.set_details("Invalid product_id format")
+            return self.pb2.ProductList()
+
+    async def GetDeals(self, request, context):
+        """핫딜 여러 건 조회"""
+        try:
+            deal_ids = [self._uuid(deal_id) for deal_id in request.deal_ids]
+            deals = await get_deals(deal_ids)
+            return self.pb2.DealList(deals=[self._deal_message(deal) for deal in deals])
+        except ProductServiceError as e:
+            if e.status_code == 400:
+                context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+            else:
+                context.set_code(grpc.StatusCode.INTERNAL)
+            context.set_details(e.message)
+            return self.pb2.DealList()
+        except ValueError:
+            context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+            context.set_details("Invalid deal_id format")
+            return self.pb2.DealList()
 
     async def UpdateStock(self, request, context):
         """재고 변경"""
         try:
-            product_id = UUID(request.product_id)
-            stock_result = await update_stock(product_id, request.delta)
+            product_id = self._uuid(request.product_id)
+            # 갱신된 행을 UPDATE ... RETURNING에서 그대로 받아 응답 (재조회 없음)
+            product = await update_stock_product(product_id, request.delta)
+            return self._product_message(product)
+        except ProductServiceError as e:
+            if e.status_code == 404:
+                context.set_code(grpc.StatusCode.NOT_FOUND)
+            elif e.error == "INSUFFICIENT_STOCK":
+                context.set_code(grpc.StatusCode.FAILED_PRECONDITION)
+            else:
+                context.set_code(grpc.StatusCode.INTERNAL)
+            context.set_details(e.message)
+            return self.pb2.Product()
+        except ValueError:
+            context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+            context.set_details("Invalid product_id format")
+            return self.pb2.Product()
 
-            # 재고 변경 후 상품 정보 반환
-            product = await get_product(product_id)
-            return product_pb2.Product(
-                id=str(product.id),
-                name=product.name,
-                description=product.description or "",
-                price=product.price,
-                stock=product.stock,
-                created_at=product.created_at.isoformat() if product.created_at else "",
-                updated_at=product.updated_at.isoformat() if product.updated_at else "",
-            )
+    async def AdjustStock(self, request, context):
+        """재고 변경 (재고만 반환)"""
+        try:
+            product_id = self._uuid(request.product_id)
+            result = await update_stock(product_id, request.delta)
+            return self._stock_result_message(result)
         except ProductServiceError as e:
             if e.status_code == 404:
                 context.set_code(grpc.StatusCode.NOT_FOUND)
@@ -108,21 +273,200 @@ class ProductServicer(product_pb2_grpc.ProductServiceServicer):
             else:
                 context.set_code(grpc.StatusCode.INTERNAL)
             context.set_details(e.message)
-            return product_pb2.Product()
+            return self.pb2.StockResult()
         except ValueError:
             context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
             context.set_details("Invalid product_id format")
-            return product_pb2.Product()
+            return self.pb2.StockResult()
+
+    async def ReserveStock(self, request, context):
+        """재고 예약"""
+        try:
+            items = self._reservation_items(request)
+            reservation = await reserve_stock(items, request.ttl_seconds or None)
+            return self._reservation_message(reservation)
+        except ProductServiceError as e:
+            if e.status_code == 404:
+                context.set_code(grpc.StatusCode.NOT_FOUND)
+            elif e.error == "INSUFFICIENT_STOCK":
+                context.set_code(grpc.StatusCode.FAILED_PRECONDITION)
+            else:
+                context.set_code(grpc.StatusCode.INTERNAL)
+            context.set_details(e.message)
+            return self.pb2.Reservation()
+        except ValueError:
+            context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+            context.set_details("Invalid reservation items")
+            return self.pb2.Reservation()
+
+    async def CommitReservation(self, request, context):
+        """예약 확정"""
+        return await self._finish_reservation(request, context, commit_reservation)
+
+    async def ReleaseReservation(self, request, context):
+        """예약 취소"""
+        return await self._finish_reservation(request, context, release_reservation)
+
+    async def _finish_reservation(self, request, context, finish):
+        try:
+            reservation = await finish(self._uuid(request.reservation_id))
+            return self._reservation_message(reservation)
+        except ProductServiceError as e:
+            if e.status_code == 404:
+                context.set_code(grpc.StatusCode.NOT_FOUND)
+            elif e.status_code == 409:
+                context.set_code(grpc.StatusCode.ABORTED)
+            else:
+                context.set_code(grpc.StatusCode.INTERNAL)
+            context.set_details(e.message)
+            return self.pb2.Reservation()
+        except ValueError:
+            context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+            context.set_details("Invalid reservation_id format")
+            return self.pb2.Reservation()
+
+    async def StockStream(self, request_iterator, context):
+        """재고 요청 스트림
+
+        요청마다 태스크로 동시에 처리하므로 같은 상품의 요청은 재고 쓰기 배치
+        (stock_combine_enabled)로 합쳐지고, 응답은 완료 순서대로 전송
+        """
+        responses: asyncio.Queue = asyncio.Queue()
+        inflight = asyncio.Semaphore(settings.grpc_stock_stream_max_inflight)
+        tasks: set[asyncio.Task] = set()
+
+        async def handle(request):
+            try:
+                responses.put_nowait(await self._stock_stream_reply(request))
+            finally:
+                inflight.release()
+
+        async def read():
+            try:
+                async for request in request_iterator:
+                    await inflight.acquire()
+                    task = asyncio.create_task(handle(request))
+                    tasks.add(task)
+                    task.add_done_callback(tasks.discard)
+                # 클라이언트가 쓰기를 끝내면 남은 요청의 응답까지 보낸 뒤 종료
+                if tasks:
+                    await asyncio.wait(tasks)
+            finally:
+                responses.put_nowait(None)
+
+        reader = asyncio.create_task(read())
+        try:
+            while (response := await responses.get()) is not None:
+                yield response
+        finally:
+            # 연결이 끊겨도 이미 시작한 재고 변경은 끝까지 처리 (응답만 버림)
+            reader.cancel()
+
+    async def _stock_stream_reply(self, request):
+        """스트림 요청 하나 처리 (요청별 오류는 스트림을 끊지 않고 응답 code/details로 전달)"""
+        response = self.pb2.StockStreamResponse(request_id=request.request_id)
+        op = request.WhichOneof("op")
+        try:
+            if op == "adjust":
+                product_id = self._uuid(request.adjust.product_id)
+                result = await update_stock(product_id, request.adjust.delta)
+                response.stock.CopyFrom(self._stock_result_message(result))
+            elif op == "reserve":
+                items = self._reservation_items(request.reserve)
+                reservation = await reserve_stock(items, request.reserve.ttl_seconds or None)
+                response.reservation.CopyFrom(self._reservation_message(reservation))
+            elif op in ("commit", "release"):
+                finish = commit_reservation if op == "commit" else release_reservation
+                reservation = await finish(self._uuid(getattr(request, op).reservation_id))
+                response.reservation.CopyFrom(self._reservation_message(reservation))
+            else:
+                raise ValueError("op is not set")
+        except ProductServiceError as e:
+            response.code = _status_code(e).value[0]
+            response.details = e.message
+        except ValueError as e:
+            response.code = grpc.StatusCode.INVALID_ARGUMENT.value[0]
+            response.details = f"Invalid {op or 'stock'} request: {e}"
+        except Exception as e:
+            logger.exception(f"StockStream {op} request failed")
+            response.code = grpc.StatusCode.INTERNAL.value[0]
+            response.details = str(e)
+        return response
+
+
+class ProductServicerV2(ProductServicer, product_v2_pb2_grpc.ProductServiceServicer):
+    """Product gRPC Service v2 (16바이트 UUID, Timestamp 시각), RPC 처리는 v1과 같음"""
+
+    pb2 = product_v2_pb2
+
+    @staticmethod
+    def _uuid(value: bytes) -> UUID:
+        return UUID(bytes=value)
+
+    @staticmethod
+    def _id(value: UUID) -> bytes:
+        return value.bytes
+
+    @staticmethod
+    def _time(value: datetime | None) -> dict | None:
+        # Timestamp.FromDatetime(순수 Python)보다 seconds/nanos를 직접 넘기는 쪽이 빠름
+        if value is None:
+            return None
+        return {"seconds": int(value.timestamp()), "nanos": value.microsecond * 1000}
+
+
+def _status_code(e: ProductServiceError) -> grpc.StatusCode:
+    if e.status_code == 404:
+        return grpc.StatusCode.NOT_FOUND
+    if e.error == "INSUFFICIENT_STOCK":
+        return grpc.StatusCode.FAILED_PRECONDITION
+    if e.status_code == 400:
+        return grpc.StatusCode.INVALID_ARGUMENT
+    if e.status_code == 409:
+        return grpc.StatusCode.ABORTED
+    return grpc.StatusCode.INTERNAL
+
+
+def add_servicer(servicer: ProductServicer, server: grpc.aio.Server) -> None:
+    """생성 코드의 add_ProductServiceServicer_to_server와 같은 등록 (v1/v2 공통)
+
+    SERIALIZED_METHODS는 servicer가 bytes를 반환하므로 response_serializer 없이 등록
+    """
+    service = servicer.pb2.DESCRIPTOR.services_by_name["ProductService"]
+    handlers = {}
+    for method in service.methods:
+        factory = _HANDLER_FACTORIES[(method.client_streaming, method.server_streaming)]
+        response_type = getattr(servicer.pb2, method.output_type.name)
+        handlers[method.name] = factory(
+            getattr(servicer, method.name),
+            request_deserializer=getattr(servicer.pb2, method.input_type.name).FromString,
+            response_serializer=(
+                None
+                if method.name in servicer.SERIALIZED_METHODS
+                else response_type.SerializeToString
+            ),
+        )
+    server.add_generic_rpc_handlers(
+        (grpc.method_handlers_generic_handler(service.full_name, handlers),)
+    )
+    server.add_registered_method_handlers(service.full_name, handlers)
 
 
 async def serve_grpc():
     """gRPC 서버 시작"""
-    server = grpc.aio.server(futures.ThreadPoolExecutor(max_workers=10))
-    product_pb2_grpc.add_ProductServiceServicer_to_server(ProductServicer(), server)
+    server = grpc.aio.server(
+        maximum_concurrent_rpcs=settings.grpc_max_concurrent_rpcs or None,
+        # 전용 프로세스 여러 개가 같은 포트를 열고 커널이 연결을 분배
+        options=[("grpc.so_reuseport", 1)],
+    )
+    # 이전 기간 동안 v1/v2를 같은 포트에서 함께 제공
+    add_servicer(ProductServicer(), server)
+    add_servicer(ProductServicerV2(), server)
 
     # gRPC reflection 활성화 (디버깅용)
     service_names = (
         product_pb2.DESCRIPTOR.services_by_name["ProductService"].full_name,
+        product_v2_pb2.DESCRIPTOR.services_by_name["ProductService"].full_name,
         reflection.SERVICE_NAME,
     )
     reflection.enable_server_reflection(service_names, server)
@@ -132,9 +476,81 @@ async def serve_grpc():
 
     logger.info(f"gRPC server starting on port {settings.grpc_port}")
     await server.start()
-    await server.wait_for_termination()
+    try:
+        await server.wait_for_termination()
+    finally:
+        await server.stop(settings.grpc_shutdown_grace)
+
+
+async def _serve_process():
+    """전용 프로세스의 gRPC 서버 실행 (SIGTERM/SIGINT로 종료)
+
+    L1 캐시 무효화 구독과 핫딜 인덱스는 프로세스마다 필요하므로 함께 실행하고,
+    핫딜 재고 DB 반영/예약 반환 같은 주기 작업은 FastAPI 프로세스에 둔다.
+    """
+    tasks: list[asyncio.Task] = []
+
+    repository = await get_repository()
+    if isinstance(repository, LocalCachedProductRepository):
+        tasks.append(asyncio.create_task(repository.listen_invalidations()))
+
+    deal_index = get_deal_index()
+    if deal_index is not None:
+        await deal_index.load()
+        tasks.append(asyncio.create_task(deal_index.run()))
+
+    server_task = asyncio.create_task(serve_grpc())
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(sig, server_task.cancel)
+
+    try:
+        await server_task
+    except asyncio.CancelledError:
+        pass
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await close_redis()
+        await engine.dispose()
 
 
 def run_grpc_server():
-    """gRPC 서버 실행 (별도 프로세스/스레드용)"""
-    asyncio.run(serve_grpc())
+    """gRPC 서버 실행 (전용 프로세스용)"""
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(_serve_process())
+
+
+def run_grpc_servers(workers: int) -> int:
+    """gRPC 서버 프로세스 workers개 실행, 하나라도 종료되면 나머지도 종료
+
+    spawn으로 시작해 프로세스마다 DB 커넥션 풀/Redis 연결을 따로 만든다.
+    반환값은 먼저 종료된 프로세스의 exit code.
+    """
+    context = multiprocessing.get_context("spawn")
+    processes = [
+        context.Process(target=run_grpc_server, name=f"grpc-{i}") for i in range(workers)
+    ]
+
+    def stop(signum, frame):
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+
+    # Ctrl+C는 자식 프로세스에도 전달되지만 SIGTERM과 같이 처리
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+
+    for process in processes:
+        process.start()
+    logger.info(f"gRPC server running in {workers} processes on port {settings.grpc_port}")
+
+    sentinels = {process.sentinel: process for process in processes}
+    exited = sentinels[wait(list(sentinels))[0]]
+    exited.join()
+    stop(None, None)
+    for process in processes:
+        process.join()
+    # 시그널로 종료된 경우 음수 → 셸 관례(128 + 시그널 번호)
+    return exited.exitcode if exited.exitcode >= 0 else 128 - exited.exitcode
@@ -0,0 +1,247 @@
+from typing import Awaitable, Callable, NamedTuple
+from uuid import UUID, uuid4
+
+from redis.asyncio import Redis
+
+from src.database import get_connection
+from src.generated.query import AsyncQuerier
+
+# 재고 키는 Go 구현(hotdeal_repository.go)과 동일: hotdeal:stock:{product_id}
+_ACTIVE_KEY = "hotdeal:active"
+
+# 이미 시작된 핫딜이면 0, 시작하면 1
+_START_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 1 or redis.call('EXISTS', KEYS[3]) == 1 then
+    return 0
+end
+redis.call('SET', KEYS[1], ARGV[1])
+redis.call('HSET', KEYS[2], 'deal_id', ARGV[2], 'loaded', ARGV[1], 'run_id', ARGV[4])
+redis.call('SADD', KEYS[4], ARGV[3])
+return 1
+"""
+
+# 재고 증감 (핫딜이 아니면 -1, 재고 부족이면 -2, 성공 시 변경 후 재고)
+# 종료 처리 중이면 판매량이 products.stock에 반영되기 전이므로 DB 경로로 넘기지 않고 거부
+_UPDATE_SCRIPT = """
+local stock = redis.call('GET', KEYS[1])
+if stock == false then
+    if redis.call('EXISTS', KEYS[2]) == 1 then
+        return -2
+    end
+    return -1
+end
+local new_stock = tonumber(stock) + tonumber(ARGV[1])
+if new_stock < 0 then
+    return -2
+end
+redis.call('SET', KEYS[1], new_stock)
+return new_stock
+"""
+
+# 재고/메타를 종료 처리 키로 옮기고 반환 (이후 주문은 정산이 끝날 때까지 거부)
+# DB 반영 전에 실패했다면 종료 처리 키가 남아 있으므로 재시도 시 그 값을 반환
+_END_SCRIPT = """
+if redis.call('EXISTS', KEYS[3]) == 1 then
+    return redis.call('HMGET', KEYS[3], 'deal_id', 'loaded', 'remaining', 'run_id')
+end
+local stock = redis.call('GET', KEYS[1])
+if stock == false then
+    return false
+end
+local meta = redis.call('HMGET', KEYS[2], 'deal_id', 'loaded', 'run_id')
+local ending = {meta[1] or '', meta[2] or stock, stock, meta[3] or ''}
+redis.call(
+    'HSET', KEYS[3],
+    'deal_id', ending[1], 'loaded', ending[2], 'remaining', ending[3], 'run_id', ending[4]
+)
+redis.call('DEL', KEYS[1], KEYS[2])
+redis.call('SREM', KEYS[4], ARGV[1])
+return ending
+"""
+
+
+# 재고 예약 차감 (예약 토큰을 함께 기록, 이미 기록된 토큰이면 다시 차감하지 않음)
+# 핫딜이 아니면 -1, 재고 부족/종료 처리 중이면 -2, 차감했으면 1
+_RESERVE_SCRIPT = """
+if redis.call('EXISTS', KEYS[3]) == 1 then
+    return 1
+end
+local stock = redis.call('GET', KEYS[1])
+if stock == false then
+    if redis.call('EXISTS', KEYS[2]) == 1 then
+        return -2
+    end
+    return -1
+end
+if tonumber(stock) < tonumber(ARGV[1]) then
+    return -2
+end
+redis.call('DECRBY', KEYS[1], ARGV[1])
+redis.call('SET', KEYS[3], ARGV[1], 'EX', ARGV[2])
+return 1
+"""
+
+# 재고 예약 반환 (토큰이 있을 때만 반환하고 토큰 삭제, 재시도해도 한 번만 반환)
+# 차감한 적 없거나 이미 반환했으면 0, 반환했으면 1, 종료 처리 중이면 -2
+# 핫딜이 끝났으면 -1 (판매량에 포함되어 products.stock에서 차감되었으므로 호출자가 DB 재고로 반환)
+_RELEASE_SCRIPT = """
+local quantity = redis.call('GET', KEYS[3])
+if quantity == false then
+    return 0
+end
+if redis.call('EXISTS', KEYS[1]) == 1 then
+    redis.call('INCRBY', KEYS[1], quantity)
+    redis.call('DEL', KEYS[3])
+    return 1
+end
+if redis.call('EXISTS', KEYS[2]) == 1 then
+    return -2
+end
+return -1
+"""
+
+
+class InsufficientStockError(Exception):
+    pass
+
+
+class HotdealEndingError(Exception):
+    """종료 처리 중이라 반영할 수 없음 (정산 후 재시도)"""
+
+
+class HotdealSnapshot(NamedTuple):
+    product_id: UUID
+    deal_id: UUID | None
+    loaded: int  # 시작 시 적재한 재고
+    remaining: int  # 현재 Redis 재고
+
+
+# 종료 시 판매량을 DB에 반영하는 콜백 (종료 처리 트랜잭션 안에서 호출)
+HotdealSettle = Callable[[AsyncQuerier, HotdealSnapshot], Awaitable[None]]
+
+
+class HotdealStock:
+    """핫딜 재고 Redis 저장소 (Lua Script로 원자적 증감)
+
+    - 시작 시 DB 재고를 Redis에 적재하고, 진행 중 주문 재고 차감/복원은 Redis에서만 처리
+    - 핫딜(product.deals)이 있으면 남은 재고를 주기적으로 deals.remaining_stock에 반영
+    - 종료 시 판매량(loaded - remaining)을 products.stock에 반영
+      (시작마다 발급한 run_id로 정산 기록을 남겨, 종료를 재시도해도 한 번만 반영)
+    """
+
+    def __init__(self, redis: Redis):
+        self.redis = redis
+        self._start = redis.register_script(_START_SCRIPT)
+        self._update = redis.register_script(_UPDATE_SCRIPT)
+        self._end = redis.register_script(_END_SCRIPT)
+        self._reserve = redis.register_script(_RESERVE_SCRIPT)
+        self._release = redis.register_script(_RELEASE_SCRIPT)
+
+    def _keys(self, product_id: UUID) -> list[str]:
+        return [
+            f"hotdeal:stock:{product_id}",
+            f"hotdeal:meta:{product_id}",
+            f"hotdeal:ending:{product_id}",
+            _ACTIVE_KEY,
+        ]
+
+    async def start(self, product_id: UUID, stock: int, deal_id: UUID | None) -> bool:
+        """재고 적재 (이미 진행 중이거나 종료 처리 중이면 False)"""
+        started = await self._start(
+            keys=self._keys(product_id),
+            args=[stock, str(deal_id or ""), str(product_id), str(uuid4())],
+        )
+        return started == 1
+
+    async def update(self, product_id: UUID, delta: int) -> int | None:
+        """재고 증감 후 재고 반환 (핫딜 상품이 아니면 None)"""
+        stock_key, _, ending_key, _ = self._keys(product_id)
+        result = await self._update(keys=[stock_key, ending_key], args=[delta])
+        if result == -1:
+            return None
+        if result == -2:
+            raise InsufficientStockError(str(product_id))
+        return result
+
+    def _reservation_keys(self, reservation_id: UUID, product_id: UUID) -> list[str]:
+        stock_key, _, ending_key, _ = self._keys(product_id)
+        return [stock_key, ending_key, f"hotdeal:reservation:{reservation_id}:{product_id}"]
+
+    async def reserve(
+        self, reservation_id: UUID, product_id: UUID, quantity: int, ttl: int
+    ) -> bool:
+        """예약 차감 (핫딜 상품이 아니면 False), 예약 토큰은 ttl초 동안 보관"""
+        result = await self._reserve(
+            keys=self._reservation_keys(reservation_id, product_id), args=[quantity, ttl]
+        )
+        if result == -2:
+            raise InsufficientStockError(str(product_id))
+        return result == 1
+
+    async def release(self, reservation_id: UUID, product_id: UUID) -> bool | None:
+        """예약 반환 (Redis에서 차감하지 않았거나 이미 반환했으면 False)
+
+        핫딜이 끝나 Redis 재고가 없으면 None (호출자가 products.stock으로 반환)
+        """
+        result = await self._release(keys=self._reservation_keys(reservation_id, product_id))
+        if result == -2:
+            raise HotdealEndingError(str(product_id))
+        if result == -1:
+            return None
+        return result == 1
+
+    async def end(self, product_id: UUID, settle: HotdealSettle) -> HotdealSnapshot | None:
+        """종료 처리 (진행 중이 아니면 None)
+
+        재고를 종료 처리 키로 옮긴 뒤 정산 기록과 settle을 한 트랜잭션으로 반영하고 키를 삭제
+        (정산 기록이 이미 있으면 이전 시도에서 반영된 것이므로 settle을 건너뜀)
+        """
+        result = await self._end(keys=self._keys(product_id), args=[str(product_id)])
+        if result is None:
+            return None
+        deal_id, loaded, remaining, run_id = result
+        snapshot = HotdealSnapshot(
+            product_id, UUID(deal_id) if deal_id else None, int(loaded), int(remaining)
+        )
+
+        async with get_connection() as conn:
+            querier = AsyncQuerier(conn)
+            settled = await querier.create_hotdeal_settlement(
+                run_id=UUID(run_id),
+                product_id=product_id,
+                sold=snapshot.loaded - snapshot.remaining,
+            )
+            if settled is not None:
+                await settle(querier, snapshot)
+            await conn.commit()
+
+        await self.redis.delete(f"hotdeal:ending:{product_id}")
+        return snapshot
+
+    async def snapshot(self) -> list[HotdealSnapshot]:
+        """진행 중인 핫딜의 현재 재고 (주기적 DB 반영용)"""
+        product_ids = sorted(await self.redis.smembers(_ACTIVE_KEY))
+        if not product_ids:
+            return []
+
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for product_id in product_ids:
+                pipe.hmget(f"hotdeal:meta:{product_id}", "deal_id", "loaded")
+                pipe.get(f"hotdeal:stock:{product_id}")
+            results = await pipe.execute()
+
+        snapshots = []
+        for product_id, (deal_id, loaded), remaining in zip(
+            product_ids, results[::2], results[1::2]
+        ):
+            if loaded is None or remaining is None:
+                continue  # 조회 사이에 종료됨
+            snapshots.append(
+                HotdealSnapshot(
+                    UUID(product_id),
+                    UUID(deal_id) if deal_id else None,
+                    int(loaded),
+                    int(remaining),
+                )
+            )
+        return snapshots
@@ -0,0 +1,98 @@
+from uuid import UUID
+
+from src.database import get_connection
+from src.generated.query import AsyncQuerier
+from src.hotdeal import HotdealSettle, HotdealSnapshot, InsufficientStockError
+
+
+class ShardedHotdealStock:
+    """핫딜 재고 분할 카운터 (Redis 없이 DB 행 잠금 분산, HotdealStock과 같은 인터페이스)
+
+    - 시작 시 재고를 N개 shard 행(product.hotdeal_stock_shards)에 나눠 적재
+    - 주문은 증감 가능한 shard 하나를 임의로 골라 그 행만 잠금 (동시 주문이 N개 행에 분산)
+    - 단일 shard로 부족하면 전체 shard를 잠그고 여러 shard에서 나눠 차감
+    - 합계는 조회 시 집계하며, 주기적으로 deals.remaining_stock에 반영되어 핫딜 조회에 사용
+    """
+
+    def __init__(self, shards: int):
+        self.shards = shards
+
+    async def start(self, product_id: UUID, stock: int, deal_id: UUID | None) -> bool:
+        """재고 적재 (이미 진행 중이거나 종료 처리 중이면 False)"""
+        async with get_connection() as conn:
+            querier = AsyncQuerier(conn)
+            created = await querier.create_hotdeal_stock_shards(
+                product_id=product_id, deal_id=deal_id, stock=stock, shards=self.shards
+            )
+            await conn.commit()
+        return created > 0
+
+    async def update(self, product_id: UUID, delta: int) -> int | None:
+        """재고 증감 후 전체 재고 반환 (핫딜 상품이 아니면 None)"""
+        async with get_connection() as conn:
+            querier = AsyncQuerier(conn)
+            stock = await self.adjust(querier, product_id, delta)
+            if stock is not None:
+                await conn.commit()
+        return stock
+
+    async def adjust(self, querier: AsyncQuerier, product_id: UUID, delta: int) -> int | None:
+        """진행 중인 트랜잭션에서 재고 증감 (예약 기록 등 다른 변경과 함께 커밋)"""
+        # 핫딜이 아닌 상품은 이 한 번의 조회로 판별 (0행)
+        row = await querier.adjust_hotdeal_stock_shard(product_id=product_id, delta=delta)
+        if row is None:
+            return None
+        if row.adjusted:
+            return row.stock
+        # 어느 shard도 단독으로 증감할 수 없음
+        return await self._update_across_shards(querier, product_id, delta)
+
+    async def _update_across_shards(
+        self, querier: AsyncQuerier, product_id: UUID, delta: int
+    ) -> int | None:
+        shards = [row async for row in querier.lock_hotdeal_stock_shards(product_id=product_id)]
+        if not shards:
+            return None
+
+        total = sum(shard.remaining for shard in shards)
+        if total + delta < 0:
+            raise InsufficientStockError(str(product_id))
+
+        # 남은 재고가 많은 shard부터 차감
+        needed = -delta
+        for shard in sorted(shards, key=lambda shard: shard.remaining, reverse=True):
+            if needed <= 0:
+                break
+            taken = min(shard.remaining, needed)
+            if taken > 0:
+                await querier.set_hotdeal_stock_shard(
+                    product_id=product_id, shard=shard.shard, remaining=shard.remaining - taken
+                )
+                needed -= taken
+        return total + delta
+
+    async def end(self, product_id: UUID, settle: HotdealSettle) -> HotdealSnapshot | None:
+        """종료 처리 (진행 중이 아니면 None)
+
+        shard 행 잠금, 판매량 반영, shard 삭제를 한 트랜잭션으로 처리
+        (대기하던 주문은 커밋 후 products.stock 경로로 넘어가며, 재시도해도 한 번만 반영)
+        """
+        async with get_connection() as conn:
+            querier = AsyncQuerier(conn)
+            row = await querier.begin_end_hotdeal_stock_shards(product_id=product_id)
+            if row is None:
+                return None
+            snapshot = HotdealSnapshot(product_id, row.deal_id, row.loaded, row.remaining)
+            await settle(querier, snapshot)
+            await querier.delete_hotdeal_stock_shards(product_id=product_id)
+            await conn.commit()
+        return snapshot
+
+    async def snapshot(self) -> list[HotdealSnapshot]:
+        """진행 중인 핫딜의 shard 합계 (주기적 DB 반영용)"""
+        async with get_connection() as conn:
+            querier = AsyncQuerier(conn)
+            return [
+                HotdealSnapshot(row.product_id, row.deal_id, row.loaded, row.remaining)
+                async for row in querier.list_hotdeal_stock_totals()
+            ]
@@ -1,12 +1,15 @@
 import asyncio
 import logging
+import secrets
 from contextlib import asynccontextmanager
 from uuid import UUID
 
-from fastapi import FastAPI, Query
-from fastapi.responses import JSONResponse
+from fastapi import Depends, FastAPI, Header, Query, Request
+from fastapi.responses import JSONResponse, Response
 
 from src.config import settings
+from src.product_import import get_import_job, start_product_import
+from src.repository import LocalCachedProductRepository
 from src.schemas import (
     CreateDealRequest,
     CreateProductRequest,
@@ -14,8 +17,12 @@ from src.schemas import (
     DealResponse,
     ErrorResponse,
     HealthResponse,
+    HotdealResponse,
+    ProductImportJob,
     ProductListResponse,
     ProductResponse,
+    ReserveStockRequest,
+    StockReservationResponse,
     StockResponse,
     UpdateProductRequest,
     UpdateStockRequest,
@@ -24,42 +31,92 @@ from src.service import (
     ProductServiceError,
     create_deal,
     create_product,
+    end_hotdeal,
     get_deal,
-    get_product,
+    get_deal_index,
+    get_deals,
+    get_product_json,
+    get_products,
+    get_repository,
     get_stock,
     list_active_deals,
-    list_products,
+    list_products_after,
+    list_products_json,
+    run_hotdeal_reconciler,
+    start_hotdeal,
     update_product,
     update_stock,
 )
+from src.stock_reservation import (
+    commit_reservation,
+    release_reservation,
+    reserve_stock,
+    run_reservation_sweeper,
+)
 from src.telemetry import setup_telemetry
 
 logger = logging.getLogger(__name__)
 
 # gRPC 서버 태스크
 _grpc_task: asyncio.Task | None = None
+# L1 캐시 무효화 구독 태스크
+_invalidation_task: asyncio.Task | None = None
+# 핫딜 인덱스 상태 전환/재적재 태스크
+_deal_index_task: asyncio.Task | None = None
+# 핫딜 Redis 재고 → DB 반영 태스크
+_hotdeal_reconcile_task: asyncio.Task | None = None
+# 만료된 재고 예약 반환 태스크
+_reservation_sweep_task: asyncio.Task | None = None
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    global _grpc_task
+    global _grpc_task, _invalidation_task, _deal_index_task, _hotdeal_reconcile_task
+    global _reservation_sweep_task
 
-    # Startup: gRPC 서버 시작
-    if settings.grpc_enabled:
+    # Startup: gRPC 서버 시작 (grpc_workers > 0이면 python -m src.run_grpc 전용 프로세스가 담당)
+    if settings.grpc_enabled and settings.grpc_workers == 0:
         from src.grpc_server import serve_grpc
 
         logger.info(f"Starting gRPC server on port {settings.grpc_port}")
         _grpc_task = asyncio.create_task(serve_grpc())
+    elif settings.grpc_enabled:
+        logger.info(f"gRPC server is served by {settings.grpc_workers} dedicated processes")
+
+    # Startup: L1 캐시 무효화 구독 시작
+    repository = await get_repository()
+    if isinstance(repository, LocalCachedProductRepository):
+        _invalidation_task = asyncio.create_task(repository.listen_invalidations())
+
+    # Startup: 핫딜 인덱스 적재 (요청을 받기 전에 완료)
+    deal_index = get_deal_index()
+    if deal_index is not None:
+        await deal_index.load()
+        _deal_index_task = asyncio.create_task(deal_index.run())
+
+    # Startup: 핫딜 Redis 재고 주기적 DB 반영
+    if settings.hotdeal_stock_redis or settings.hotdeal_stock_shards > 0:
+        _hotdeal_reconcile_task = asyncio.create_task(run_hotdeal_reconciler())
+
+    # Startup: 만료된 재고 예약 주기적 반환
+    _reservation_sweep_task = asyncio.create_task(run_reservation_sweeper())
 
     yield
 
-    # Shutdown: gRPC 서버 중지
-    if _grpc_task:
-        _grpc_task.cancel()
-        try:
-            await _grpc_task
-        except asyncio.CancelledError:
-            pass
+    # Shutdown: 백그라운드 태스크 중지
+    for task in (
+        _grpc_task,
+        _invalidation_task,
+        _deal_index_task,
+        _hotdeal_reconcile_task,
+        _reservation_sweep_task,
+    ):
+        if task:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
 
 
 app = FastAPI(
@@ -80,6 +137,13 @@ async def product_service_error_handler(request, exc: ProductServiceError):
     )
 
 
+def require_admin_key(x_admin_key: str | None = Header(default=None)) -> None:
+    if not settings.admin_api_key:
+        raise ProductServiceError("NOT_FOUND", "관리자 API가 비활성화되어 있습니다.", 404)
+    if x_admin_key is None or not secrets.compare_digest(x_admin_key, settings.admin_api_key):
+        raise ProductServiceError("FORBIDDEN", "관리자 권한이 필요합니다.", 403)
+
+
 # Health check
 @app.get("/health", response_model=HealthResponse)
 @app.get("/products/health", response_model=HealthResponse)
@@ -87,15 +151,37 @@ async def health_check():
     return HealthResponse(status="healthy", service="product-service")
 
 
+def _parse_ids(ids: str) -> list[UUID]:
+    try:
+        return [UUID(value) for value in ids.split(",") if value.strip()]
+    except ValueError:
+        raise ProductServiceError("INVALID_ID", "유효하지 않은 ID가 포함되어 있습니다.", 400)
+
+
 # Product endpoints
 @app.get("/products", response_model=ProductListResponse)
 async def list_products_endpoint(
     page: int = Query(default=1, ge=1),
     size: int = Query(default=20, ge=1, le=100),
     category: str | None = None,
+    cursor: str | None = None,
+    ids: str | None = Query(
+        default=None, description="쉼표로 구분한 상품 ID (지정 시 해당 상품만 조회)"
+    ),
 ):
-    items, total = await list_products(page=page, size=size, category=category)
-    return ProductListResponse(items=items, total=total, page=page, size=size)
+    # ID 목록 조회: 한 번의 캐시 MGET + miss만 DB 한 번 (요청 순서대로, 없는 ID는 제외)
+    if ids is not None:
+        items = await get_products(_parse_ids(ids))
+        return ProductListResponse(items=items, total=len(items), size=len(items))
+
+    # 커서가 있으면 page 대신 keyset 조회 (깊은 페이지도 첫 페이지와 같은 비용)
+    if cursor:
+        items = await list_products_after(cursor=cursor, size=size, category=category)
+        return ProductListResponse(items=items, size=size)
+
+    # 캐시된 응답 본문을 그대로 반환 (response_model 검증/재직렬화 생략)
+    body = await list_products_json(page=page, size=size, category=category)
+    return Response(content=body, media_type="application/json")
 
 
 @app.post("/products", response_model=ProductResponse, status_code=201)
@@ -110,14 +196,70 @@ async def create_product_endpoint(request: CreateProductRequest):
     )
 
 
+# Admin endpoints (상품 대량 등록)
+@app.post(
+    "/products/admin/imports",
+    response_model=ProductImportJob,
+    status_code=202,
+    dependencies=[Depends(require_admin_key)],
+)
+async def start_product_import_endpoint(request: Request):
+    """상품 대량 등록 (NDJSON/CSV 본문, 백그라운드 작업으로 처리)"""
+    return await start_product_import(
+        request.stream(), request.headers.get("content-type", "")
+    )
+
+
+@app.get(
+    "/products/admin/imports/{job_id}",
+    response_model=ProductImportJob,
+    dependencies=[Depends(require_admin_key)],
+)
+async def get_product_import_endpoint(job_id: UUID):
+    return await get_import_job(job_id)
+
+
+# Stock reservation endpoints (must be before /products/{product_id})
+@app.post("/products/reservations", response_model=StockReservationResponse, status_code=201)
+async def reserve_stock_endpoint(request: ReserveStockRequest):
+    return await reserve_stock(request.items, request.ttl_seconds)
+
+
+@app.post(
+    "/products/reservations/{reservation_id}/commit", response_model=StockReservationResponse
+)
+async def commit_reservation_endpoint(reservation_id: UUID):
+    return await commit_reservation(reservation_id)
+
+
+@app.post(
+    "/products/reservations/{reservation_id}/release", response_model=StockReservationResponse
+)
+async def release_reservation_endpoint(reservation_id: UUID):
+    return await release_reservation(reservation_id)
+
+
 # Deal endpoints (must be before /products/{product_id} to avoid route conflict)
 @app.get("/products/deals", response_model=DealListResponse)
 async def list_deals_endpoint(
     page: int = Query(default=1, ge=1),
     size: int = Query(default=20, ge=1, le=100),
+    ids: str | None = Query(
+        default=None, description="쉼표로 구분한 핫딜 ID (지정 시 해당 핫딜만 조회)"
+    ),
 ):
+    if ids is not None:
+        items = await get_deals(_parse_ids(ids))
+        return DealListResponse(items=items, total=len(items), page=1, size=len(items))
+
     items, total = await list_active_deals(page=page, size=size)
-    return DealListResponse(items=items, total=total, page=page, size=size)
+    return DealListResponse(
+        items=items,
+        total=total.count,
+        total_approximate=total.approximate,
+        page=page,
+        size=size,
+    )
 
 
 @app.post("/products/deals", response_model=DealResponse, status_code=201)
@@ -138,7 +280,7 @@ async def get_deal_endpoint(deal_id: UUID):
 
 @app.get("/products/{product_id}", response_model=ProductResponse)
 async def get_product_endpoint(product_id: UUID):
-    return await get_product(product_id)
+    return Response(content=await get_product_json(product_id), media_type="application/json")
 
 
 @app.patch("/products/{product_id}", response_model=ProductResponse)
@@ -153,6 +295,17 @@ async def update_product_endpoint(product_id: UUID, request: UpdateProductReques
     )
 
 
+# Hotdeal endpoints (Redis 재고 적재/DB 반영)
+@app.post("/products/{product_id}/hotdeal/start", response_model=HotdealResponse)
+async def start_hotdeal_endpoint(product_id: UUID):
+    return await start_hotdeal(product_id)
+
+
+@app.post("/products/{product_id}/hotdeal/end", response_model=HotdealResponse)
+async def end_hotdeal_endpoint(product_id: UUID):
+    return await end_hotdeal(product_id)
+
+
 # Stock endpoints
 @app.get("/products/{product_id}/stock", response_model=StockResponse)
 async def get_stock_endpoint(product_id: UUID):
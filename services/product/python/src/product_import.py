@@ -0,0 +1,182 @@
+import asyncio
+import csv
+import io
+import logging
+import tempfile
+from datetime import datetime, timedelta, timezone
+from typing import IO, AsyncIterator, Iterator
+from uuid import UUID, uuid4
+
+from pydantic import ValidationError
+
+from src.config import settings
+from src.database import get_connection
+from src.generated.query import AsyncQuerier, BulkCreateProductsParams
+from src.schemas import CreateProductRequest, ImportJobStatus, ProductImportError, ProductImportJob
+from src.service import ProductServiceError, get_repository
+
+logger = logging.getLogger(__name__)
+
+_MEDIA_TYPES = {
+    "application/x-ndjson": "ndjson",
+    "application/jsonl": "ndjson",
+    "text/csv": "csv",
+}
+
+_CSV_REQUIRED_COLUMNS = {"name", "price", "stock"}
+
+# 작업은 시작한 프로세스에서 실행하고, 상태는 product.import_jobs에 저장하여 어느 워커에서든 조회
+_tasks: set[asyncio.Task] = set()
+
+
+async def _save_job(job: ProductImportJob) -> None:
+    async with get_connection() as conn:
+        querier = AsyncQuerier(conn)
+        await querier.save_import_job(id=job.id, job=job.model_dump_json())
+        await conn.commit()
+
+
+async def get_import_job(job_id: UUID) -> ProductImportJob:
+    async with get_connection() as conn:
+        querier = AsyncQuerier(conn)
+        job = await querier.get_import_job(id=job_id)
+    if job is None:
+        raise ProductServiceError("NOT_FOUND", "등록 작업을 찾을 수 없습니다.", 404)
+    return ProductImportJob.model_validate_json(job)
+
+
+async def start_product_import(body: AsyncIterator[bytes], content_type: str) -> ProductImportJob:
+    """요청 본문을 임시 파일에 받아 둔 뒤 백그라운드에서 batch 단위로 등록
+
+    본문 수신은 디스크 쓰기만 하므로 수백만 행도 요청 시간 안에 끝나고,
+    등록 진행 상황은 get_import_job으로 조회
+    """
+    import_format = _MEDIA_TYPES.get(content_type.split(";", 1)[0].strip().lower())
+    if import_format is None:
+        raise ProductServiceError(
+            "UNSUPPORTED_MEDIA_TYPE",
+            "application/x-ndjson 또는 text/csv 본문만 지원합니다.",
+            415,
+        )
+
+    file = tempfile.TemporaryFile()
+    try:
+        async for chunk in body:
+            file.write(chunk)
+        file.seek(0)
+    except BaseException:
+        file.close()
+        raise
+
+    job = ProductImportJob(
+        id=uuid4(),
+        format=import_format,
+        status=ImportJobStatus.RUNNING,
+        started_at=datetime.now(timezone.utc),
+    )
+    try:
+        async with get_connection() as conn:
+            querier = AsyncQuerier(conn)
+            await querier.delete_import_jobs_before(
+                updated_at=job.started_at
+                - timedelta(seconds=settings.product_import_job_retention)
+            )
+            await querier.save_import_job(id=job.id, job=job.model_dump_json())
+            await conn.commit()
+    except BaseException:
+        file.close()
+        raise
+
+    task = asyncio.create_task(_run_import(job, file))
+    _tasks.add(task)
+    task.add_done_callback(_tasks.discard)
+    return job
+
+
+def _iter_ndjson(file: IO[bytes]) -> Iterator[tuple[int, bytes | dict]]:
+    for line_no, line in enumerate(file, 1):
+        if line.strip():
+            yield line_no, line
+
+
+def _iter_csv(file: IO[bytes]) -> Iterator[tuple[int, bytes | dict]]:
+    reader = csv.DictReader(io.TextIOWrapper(file, encoding="utf-8-sig", newline=""))
+    missing = _CSV_REQUIRED_COLUMNS - set(reader.fieldnames or [])
+    if missing:
+        raise ValueError(f"CSV 헤더에 필수 컬럼이 없습니다: {', '.join(sorted(missing))}")
+
+    fields = CreateProductRequest.model_fields.keys()
+    for row in reader:
+        # 빈 칸은 값 없음으로 처리 (선택 필드는 NULL, 필수 필드는 검증 오류)
+        yield reader.line_num, {
+            key: value if value != "" else None for key, value in row.items() if key in fields
+        }
+
+
+def _validate(data: bytes | dict) -> CreateProductRequest:
+    if isinstance(data, bytes):
+        return CreateProductRequest.model_validate_json(data)
+    return CreateProductRequest.model_validate(data)
+
+
+def _record_error(job: ProductImportJob, line: int, message: str) -> None:
+    job.failed += 1
+    if len(job.errors) < settings.product_import_max_errors:
+        job.errors.append(ProductImportError(line=line, message=message))
+
+
+async def _insert_products(batch: list[CreateProductRequest]) -> int:
+    async with get_connection() as conn:
+        querier = AsyncQuerier(conn)
+        created = await querier.bulk_create_products(
+            BulkCreateProductsParams(
+                names=[request.name for request in batch],
+                descriptions=[request.description for request in batch],
+                prices=[request.price for request in batch],
+                stocks=[request.stock for request in batch],
+                categories=[request.category for request in batch],
+                image_urls=[request.image_url for request in batch],
+            )
+        )
+        await conn.commit()
+
+    # 배치마다 커밋되어 바로 조회되므로 해당 카테고리 목록 캐시도 배치마다 폐기
+    repository = await get_repository()
+    await repository.invalidate_product_list(*{request.category for request in batch})
+    return created
+
+
+async def _run_import(job: ProductImportJob, file: IO[bytes]) -> None:
+    try:
+        rows = _iter_ndjson(file) if job.format == "ndjson" else _iter_csv(file)
+        batch: list[CreateProductRequest] = []
+        for line_no, data in rows:
+            job.processed += 1
+            try:
+                batch.append(_validate(data))
+            except ValidationError as e:
+                error = e.errors()[0]
+                field = ".".join(str(loc) for loc in error["loc"])
+                _record_error(job, line_no, f"{field}: {error['msg']}" if field else error["msg"])
+                continue
+
+            if len(batch) >= settings.product_import_batch_size:
+                job.created += await _insert_products(batch)
+                batch = []
+                await _save_job(job)
+
+        if batch:
+            job.created += await _insert_products(batch)
+        job.status = ImportJobStatus.COMPLETED
+    except Exception as e:
+        # 이미 커밋된 배치는 유지되며 created로 확인 가능
+        logger.warning(f"Product import {job.id} failed: {e}")
+        job.status = ImportJobStatus.FAILED
+        job.message = str(e)
+    finally:
+        file.close()
+        job.finished_at = datetime.now(timezone.utc)
+        try:
+            await _save_job(job)
+        except Exception as e:
+            logger.warning(f"Product import {job.id} status could not be saved: {e}")
@@ -1,5 +1,11 @@
 from src.repository.base import ProductRepository
 from src.repository.cached import CachedProductRepository
+from src.repository.local import LocalCachedProductRepository
 from src.repository.rdb import RdbProductRepository
 
-__all__ = ["ProductRepository", "RdbProductRepository", "CachedProductRepository"]
+__all__ = [
+    "ProductRepository",
+    "RdbProductRepository",
+    "CachedProductRepository",
+    "LocalCachedProductRepository",
+]
@@ -1,7 +1,9 @@
 from abc import ABC, abstractmethod
 from uuid import UUID
 
-from src.schemas import ProductResponse
+from src.cursor import Cursor
+from src.schemas import ProductListResponse, ProductResponse
+from src.totals import Total
 
 
 class ProductRepository(ABC):
@@ -10,11 +12,56 @@ class ProductRepository(ABC):
     @abstractmethod
     async def list_products(
         self, page: int, size: int, category: str | None
-    ) -> tuple[list[ProductResponse], int]:
+    ) -> tuple[list[ProductResponse], Total]:
         """상품 목록 조회"""
         pass
 
+    @abstractmethod
+    async def list_products_after(
+        self, cursor: Cursor, size: int, category: str | None
+    ) -> list[ProductResponse]:
+        """커서 이후 상품 목록 조회 (keyset, COUNT 없음)"""
+        pass
+
     @abstractmethod
     async def get_product(self, product_id: UUID) -> ProductResponse | None:
         """상품 단건 조회"""
         pass
+
+    @abstractmethod
+    async def get_products(self, product_ids: list[UUID]) -> dict[UUID, ProductResponse]:
+        """상품 여러 건 조회 (없는 상품은 결과에서 빠짐)"""
+        pass
+
+    async def list_products_json(self, page: int, size: int, category: str | None) -> bytes:
+        """상품 목록 조회 (응답 본문 JSON, 캐시 구현은 저장된 본문을 그대로 반환)"""
+        items, total = await self.list_products(page, size, category)
+        return ProductListResponse(
+            items=items,
+            total=total.count,
+            total_approximate=total.approximate,
+            page=page,
+            size=size,
+        ).model_dump_json().encode()
+
+    async def get_product_json(self, product_id: UUID) -> bytes | None:
+        """상품 단건 조회 (응답 본문 JSON, 캐시 구현은 저장된 본문을 그대로 반환)"""
+        product = await self.get_product(product_id)
+        return product.model_dump_json().encode() if product is not None else None
+
+    # Cache invalidation
+
+    @abstractmethod
+    async def invalidate_product(self, product_id: UUID) -> None:
+        """상품 단건 캐시 무효화"""
+        pass
+
+    @abstractmethod
+    async def store_product(self, product: ProductResponse) -> None:
+        """상품 단건 캐시를 커밋된 값으로 갱신 (재고 변경, 더 최신 값은 덮지 않음)"""
+        pass
+
+    @abstractmethod
+    async def invalidate_product_list(self, *categories: str | None) -> None:
+        """카테고리별 상품 목록 캐시 무효화 (전체 목록 포함)"""
+        pass
@@ -1,60 +1,487 @@
+import asyncio
 import json
+import logging
+import math
+import random
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Any, Awaitable, Callable, NamedTuple
 from uuid import UUID
 
 from redis.asyncio import Redis
 
+from src.cursor import Cursor
 from src.repository.base import ProductRepository
-from src.schemas import ProductResponse
+from src.repository.metrics import record_cache_lookup
+from src.schemas import ProductListResponse, ProductResponse
+from src.totals import Total
+
+logger = logging.getLogger(__name__)
+
+# 카테고리 버전 조회 + 해당 버전의 목록 키 조회를 한 번의 왕복으로 처리
+_GET_LIST_SCRIPT = """
+local version = redis.call('GET', KEYS[1]) or '0'
+return {version, redis.call('GET', ARGV[1] .. version .. ARGV[2])}
+"""
+
+# 자신이 획득한 락만 해제
+_RELEASE_LOCK_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+# 상품 단건 무효화 시 키를 잠시 이 값으로 덮어 두어,
+# 무효화 전에 시작된 조회가 이전 값을 다시 저장하지 못하게 함 (조회 시에는 miss)
+_TOMBSTONE = "invalidated"
+_TOMBSTONE_TTL = 5  # 초
+
+# tombstone이 아니고, 저장된 값의 버전(ARGV[4], 없으면 비교 생략)이 더 크지 않을 때만 저장
+_STORE_SCRIPT = """
+local current = redis.call('GET', KEYS[1])
+if current == ARGV[2] then
+    return 0
+end
+if current and ARGV[4] ~= '' then
+    local version = tonumber(string.match(current, '^%S+ %S+ (%d+)\\n'))
+    if version and version > tonumber(ARGV[4]) then
+        return 0
+    end
+end
+redis.call('SET', KEYS[1], ARGV[1], 'EX', ARGV[3])
+return 1
+"""
+
+# 락을 얻지 못했을 때 다른 인스턴스의 적재 완료를 확인하는 간격 (초)
+_LOCK_POLL_INTERVAL = 0.05
+
+
+class CacheCodec(NamedTuple):
+    """캐시 값 직렬화/역직렬화 (payload는 HTTP 응답 본문과 동일한 JSON)"""
+
+    dump: Callable[[Any], str]
+    load: Callable[[str], Any]
+    # 값의 버전 (더 큰 버전이 저장되어 있으면 덮지 않음, None이면 비교 없이 저장)
+    version: Callable[[Any], int | None] = lambda value: None
+
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def _product_version(product: ProductResponse) -> int:
+    """상품 행의 updated_at (마이크로초, 재고 변경마다 커밋 순서대로 증가)"""
+    return (product.updated_at - _EPOCH) // timedelta(microseconds=1)
+
+
+_PRODUCT_CODEC = CacheCodec(
+    dump=lambda product: product.model_dump_json(),
+    load=ProductResponse.model_validate_json,
+    version=_product_version,
+)
+
+
+class ProductPage(NamedTuple):
+    """목록 캐시 값 (상품 본문은 상세 키에서 조회하므로 재고 변경이 목록을 폐기하지 않음)"""
+
+    ids: list[UUID]
+    total: Total
+    next_cursor: str | None
+
+
+def _product_page_codec(page: int, size: int) -> CacheCodec:
+    def load(payload: str) -> ProductPage:
+        data = json.loads(payload)
+        return ProductPage(
+            ids=[UUID(product_id) for product_id in data["ids"]],
+            total=Total(data["total"], data["total_approximate"]),
+            next_cursor=data["next_cursor"],
+        )
+
+    def dump(result: tuple[list[ProductResponse], Total]) -> str:
+        items, total = result
+        # next_cursor는 페이지의 마지막 상품(생성 시각, ID)으로 정해지므로 함께 저장
+        response = ProductListResponse(
+            items=items,
+            total=total.count,
+            total_approximate=total.approximate,
+            page=page,
+            size=size,
+        )
+        return json.dumps(
+            {
+                "ids": [str(item.id) for item in items],
+                "total": total.count,
+                "total_approximate": total.approximate,
+                "next_cursor": response.next_cursor,
+            }
+        )
+
+    return CacheCodec(dump=dump, load=load)
 
 
 class CachedProductRepository(ProductRepository):
-    """Redis 캐싱 Repository (Decorator 패턴)"""
+    """Redis 캐싱 Repository (Decorator 패턴)
+
+    - 상품 단건: 쓰기 시 키를 잠시 tombstone으로 덮음 (진행 중이던 조회가 이전 값을 저장하지 못함)
+      - 재고 변경은 tombstone 대신 커밋된 행으로 덮어 계속 캐시에서 응답 (주문이 몰리는 핫딜 상품)
+      - 값에 updated_at 버전을 함께 저장하여 늦게 도착한 이전 값이 최신 값을 덮지 못함
+    - 상품 목록: 페이지의 상품 ID/총계만 저장하고 상품 본문은 단건 키를 MGET으로 조회
+      - 재고 변경은 단건 키만 무효화 (목록 구성은 바뀌지 않음)
+      - 카테고리별 버전 카운터를 키에 포함, 생성/수정 시 INCR로 해당 카테고리의 모든 페이지를 폐기
+        (이전 버전 키는 더 이상 조회되지 않고 TTL로 자연 만료)
+    - 만료 시 DB 폭주(stampede) 방지
+      - 값과 함께 논리 만료 시각/적재 소요 시간을 저장하고, Redis TTL은 stale_ttl만큼 더 길게 유지
+      - 논리 만료 후에는 이전 값을 반환하면서 백그라운드에서 갱신 (stale-while-revalidate)
+      - 만료 전이라도 XFetch 확률에 따라 미리 백그라운드 갱신
+      - 동일 키 miss는 프로세스 내에서 하나의 DB 조회로 합치고,
+        선택적으로 Redis 락으로 인스턴스 간에도 합침
+    """
 
-    def __init__(self, inner: ProductRepository, redis: Redis, ttl: int = 60):
+    def __init__(
+        self,
+        inner: ProductRepository,
+        redis: Redis,
+        ttl: int = 60,
+        stale_ttl: int = 0,
+        xfetch_beta: float = 0.0,
+        lock_timeout: float | None = None,
+    ):
         self.inner = inner
         self.redis = redis
         self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.xfetch_beta = xfetch_beta  # 0이면 조기 갱신 비활성화
+        self.lock_timeout = lock_timeout  # None이면 인스턴스 간 락 미사용
+        self._get_list = redis.register_script(_GET_LIST_SCRIPT)
+        self._release_lock = redis.register_script(_RELEASE_LOCK_SCRIPT)
+        self._set_if_newer = redis.register_script(_STORE_SCRIPT)
+        self._inflight: dict[str, asyncio.Future] = {}
+        self._refresh_tasks: set[asyncio.Task] = set()
+
+    def _list_version_key(self, category: str | None) -> str:
+        return f"products:version:{category or 'all'}"
+
+    def _detail_key(self, product_id: UUID) -> str:
+        return f"products:detail:{product_id}"
+
+    async def _store(
+        self,
+        cache_key: str,
+        payload: str,
+        delta: float,
+        client=None,
+        version: int | None = None,
+    ) -> None:
+        await self._set_if_newer(
+            keys=[cache_key],
+            args=[
+                self._wrap(payload, delta, version),
+                _TOMBSTONE,
+                self.ttl + self.stale_ttl,
+                "" if version is None else version,
+            ],
+            client=client,
+        )
+
+    # 저장 형식: "{논리 만료 시각} {적재 소요 시간}[ {버전}]\n{payload}"
+
+    def _wrap(self, payload: str, delta: float, version: int | None = None) -> str:
+        header = f"{time.time() + self.ttl:.3f} {delta:.4f}"
+        if version is not None:
+            header += f" {version}"
+        return f"{header}\n{payload}"
+
+    def _unwrap(self, cached: str) -> tuple[float, float, str]:
+        header, payload = cached.split("\n", 1)
+        expires_at, delta, *_ = header.split(" ")
+        return float(expires_at), float(delta), payload
+
+    def _should_refresh(self, expires_at: float, delta: float) -> bool:
+        now = time.time()
+        if now >= expires_at:
+            return True
+        if self.xfetch_beta <= 0:
+            return False
+        # XFetch: 만료가 가까울수록, 적재 비용(delta)이 클수록 높은 확률로 조기 갱신
+        return now - delta * self.xfetch_beta * math.log(1.0 - random.random()) >= expires_at
+
+    async def _get_or_load(
+        self,
+        kind: str,
+        cache_key: str,
+        cached: str | None,
+        loader: Callable[[], Awaitable[Any]],
+        codec: CacheCodec,
+        raw: bool = False,
+    ) -> Any:
+        """캐시 조회 결과 반환 (raw=True면 객체 대신 응답 본문 JSON, 값이 없으면 None)"""
+        if cached is not None:
+            try:
+                expires_at, delta, payload = self._unwrap(cached)
+            except ValueError:
+                cached = None  # 이전 형식으로 저장된 값은 miss로 처리
+        record_cache_lookup("l2", kind, cached is not None)
+        if cached is not None:
+            if self._should_refresh(expires_at, delta):
+                # 이전 값을 즉시 반환하고 갱신은 백그라운드에서
+                self._refresh_in_background(cache_key, loader, codec)
+            # 적중 시 raw 경로는 역직렬화/모델 생성 없이 저장된 본문을 그대로 반환
+            return payload if raw else codec.load(payload)
+
+        value, payload = await self._load(cache_key, loader, codec)
+        if raw:
+            return payload
+        if value is None and payload is not None:
+            value = codec.load(payload)  # 다른 인스턴스가 적재한 값
+        return value
+
+    async def _load(
+        self, cache_key: str, loader: Callable[[], Awaitable[Any]], codec: CacheCodec
+    ) -> tuple[Any, str | None]:
+        """(값, 직렬화된 payload) 반환 (다른 인스턴스가 적재한 경우 값 없이 payload만 반환)"""
+        # 이미 적재 중인 요청이 있으면 그 결과를 공유
+        while (inflight := self._inflight.get(cache_key)) is not None:
+            try:
+                return await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                if not inflight.cancelled():
+                    raise  # 대기자 자신이 취소됨
+                # 적재하던 요청이 취소되면 대기자 중 하나가 이어서 적재
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[cache_key] = future
+        try:
+            value = await self._load_with_lock(cache_key, loader, codec)
+            future.set_result(value)
+            return value
+        except Exception as e:
+            future.set_exception(e)
+            # 대기자가 없어도 "exception was never retrieved" 경고가 나지 않도록 소비
+            future.exception()
+            raise
+        finally:
+            # 취소(클라이언트 연결 종료 등)로 결과 없이 끝나도 대기자가 멈추지 않도록 함
+            if not future.done():
+                future.cancel()
+            del self._inflight[cache_key]
+
+    async def _load_with_lock(
+        self, cache_key: str, loader: Callable[[], Awaitable[Any]], codec: CacheCodec
+    ) -> tuple[Any, str | None]:
+        lock_key = f"{cache_key}:lock"
+        token = None
+        if self.lock_timeout is not None:
+            token = uuid.uuid4().hex
+            acquired = await self.redis.set(
+                lock_key, token, nx=True, px=int(self.lock_timeout * 1000)
+            )
+            if not acquired:
+                token = None
+                # 다른 인스턴스가 적재 중: 락이 풀리면(또는 만료되면) 캐시 확인
+                deadline = time.monotonic() + self.lock_timeout
+                while time.monotonic() < deadline and await self.redis.exists(lock_key):
+                    await asyncio.sleep(_LOCK_POLL_INTERVAL)
+                cached = await self.redis.get(cache_key)
+                if cached is not None and cached != _TOMBSTONE:
+                    return None, self._unwrap(cached)[2]
+
+        try:
+            started = time.monotonic()
+            value = await loader()
+            if value is None:
+                return None, None
+            payload = codec.dump(value)
+            await self._store(
+                cache_key, payload, time.monotonic() - started, version=codec.version(value)
+            )
+            return value, payload
+        finally:
+            if token is not None:
+                await self._release_lock(keys=[lock_key], args=[token])
+
+    def _refresh_in_background(
+        self, cache_key: str, loader: Callable[[], Awaitable[Any]], codec: CacheCodec
+    ) -> None:
+        if cache_key in self._inflight:
+            return
+
+        async def refresh():
+            try:
+                await self._load(cache_key, loader, codec)
+            except Exception as e:
+                logger.warning(f"Background cache refresh failed ({cache_key}): {e}")
+
+        task = asyncio.create_task(refresh())
+        self._refresh_tasks.add(task)
+        task.add_done_callback(self._refresh_tasks.discard)
+
+    async def _load_page(
+        self, page: int, size: int, category: str | None
+    ) -> tuple[list[ProductResponse], Total]:
+        started = time.monotonic()
+        items, total = await self.inner.list_products(page, size, category)
+        # 이어지는 단건 키 MGET이 DB를 거치지 않도록 목록 적재 결과로 단건 키도 채움
+        await self._store_products(items, time.monotonic() - started)
+        return items, total
+
+    async def _list(self, page: int, size: int, category: str | None, raw: bool) -> Any:
+        namespace = category or "all"
+        codec = _product_page_codec(page, size)
+
+        # 캐시 조회 (products:list:{category}:v{version}:{page}:{size})
+        version, cached = await self._get_list(
+            keys=[self._list_version_key(category)],
+            args=[f"products:list:{namespace}:v", f":{page}:{size}"],
+        )
+
+        # 조회 중 버전이 바뀌었다면 이전 버전 키에 저장되므로 읽히지 않음
+        product_page = codec.load(
+            await self._get_or_load(
+                "list",
+                f"products:list:{namespace}:v{version}:{page}:{size}",
+                cached,
+                lambda: self._load_page(page, size, category),
+                codec,
+                raw=True,
+            )
+        )
+
+        # 상품 본문은 단건 키에서 (목록 적재 이후 삭제된 상품은 제외)
+        payloads, loaded = await self._get_payloads(product_page.ids)
+        if raw:
+            tail = json.dumps(
+                {
+                    "total": product_page.total.count,
+                    "total_approximate": product_page.total.approximate,
+                    "page": page,
+                    "size": size,
+                    "next_cursor": product_page.next_cursor,
+                },
+                separators=(",", ":"),
+            )
+            items = ",".join(payloads[i] for i in product_page.ids if i in payloads)
+            return f'{{"items":[{items}],{tail[1:]}'
+        return [
+            loaded.get(i) or _PRODUCT_CODEC.load(payloads[i])
+            for i in product_page.ids
+            if i in payloads
+        ], product_page.total
+
+    async def _get(self, product_id: UUID, raw: bool) -> Any:
+        cache_key = self._detail_key(product_id)
+        return await self._get_or_load(
+            "detail",
+            cache_key,
+            await self.redis.get(cache_key),
+            lambda: self.inner.get_product(product_id),
+            _PRODUCT_CODEC,
+            raw=raw,
+        )
+
+    async def _store_products(self, products: list[ProductResponse], delta: float) -> dict:
+        """단건 키 저장 (tombstone/더 최신 값은 덮지 않음), {상품 ID: payload} 반환"""
+        payloads = {product.id: _PRODUCT_CODEC.dump(product) for product in products}
+        if payloads:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for product in products:
+                    await self._store(
+                        self._detail_key(product.id),
+                        payloads[product.id],
+                        delta,
+                        client=pipe,
+                        version=_product_version(product),
+                    )
+                await pipe.execute()
+        return payloads
+
+    async def _get_payloads(
+        self, product_ids: list[UUID]
+    ) -> tuple[dict[UUID, str], dict[UUID, ProductResponse]]:
+        """단건 키 MGET 한 번으로 조회하고 miss만 모아 DB 한 번으로 적재
+
+        ({상품 ID: payload}, DB에서 적재한 {상품 ID: 상품}) 반환, 없는 상품은 빠짐
+        """
+        if not product_ids:
+            return {}, {}
+        cache_keys = [self._detail_key(product_id) for product_id in product_ids]
+        payloads: dict[UUID, str] = {}
+        missing: list[UUID] = []
+        for product_id, cache_key, cached in zip(
+            product_ids, cache_keys, await self.redis.mget(cache_keys)
+        ):
+            if cached is not None:
+                try:
+                    expires_at, delta, payload = self._unwrap(cached)
+                except ValueError:
+                    cached = None  # tombstone/이전 형식
+            record_cache_lookup("l2", "detail", cached is not None)
+            if cached is None:
+                missing.append(product_id)
+                continue
+            if self._should_refresh(expires_at, delta):
+                self._refresh_in_background(
+                    cache_key,
+                    lambda product_id=product_id: self.inner.get_product(product_id),
+                    _PRODUCT_CODEC,
+                )
+            payloads[product_id] = payload
+
+        loaded: dict[UUID, ProductResponse] = {}
+        if missing:
+            started = time.monotonic()
+            loaded = await self.inner.get_products(missing)
+            payloads.update(
+                await self._store_products(list(loaded.values()), time.monotonic() - started)
+            )
+        return payloads, loaded
 
     async def list_products(
         self, page: int, size: int, category: str | None
-    ) -> tuple[list[ProductResponse], int]:
-        cache_key = f"products:list:{page}:{size}:{category or 'all'}"
+    ) -> tuple[list[ProductResponse], Total]:
+        return await self._list(page, size, category, raw=False)
 
-        # 캐시 조회
-        cached = await self.redis.get(cache_key)
-        if cached:
-            data = json.loads(cached)
-            items = [ProductResponse(**item) for item in data["items"]]
-            return items, data["total"]
+    async def list_products_after(
+        self, cursor: Cursor, size: int, category: str | None
+    ) -> list[ProductResponse]:
+        # 커서 조회는 DB 비용이 페이지 깊이와 무관하고 키 공간이 무한하므로 캐싱하지 않음
+        return await self.inner.list_products_after(cursor, size, category)
 
-        # DB 조회 (inner repository)
-        items, total = await self.inner.list_products(page, size, category)
+    async def get_product(self, product_id: UUID) -> ProductResponse | None:
+        return await self._get(product_id, raw=False)
 
-        # 캐시 저장
-        cache_data = {
-            "items": [item.model_dump(mode="json") for item in items],
-            "total": total,
+    async def get_products(self, product_ids: list[UUID]) -> dict[UUID, ProductResponse]:
+        payloads, loaded = await self._get_payloads(product_ids)
+        return {
+            product_id: loaded.get(product_id) or _PRODUCT_CODEC.load(payload)
+            for product_id, payload in payloads.items()
         }
-        await self.redis.set(cache_key, json.dumps(cache_data), ex=self.ttl)
 
-        return items, total
+    async def list_products_json(self, page: int, size: int, category: str | None) -> bytes:
+        return (await self._list(page, size, category, raw=True)).encode()
 
-    async def get_product(self, product_id: UUID) -> ProductResponse | None:
-        cache_key = f"products:detail:{product_id}"
+    async def get_product_json(self, product_id: UUID) -> bytes | None:
+        payload = await self._get(product_id, raw=True)
+        return payload.encode() if payload is not None else None
 
-        # 캐시 조회
-        cached = await self.redis.get(cache_key)
-        if cached:
-            return ProductResponse(**json.loads(cached))
+    # Cache invalidation
 
-        # DB 조회
-        product = await self.inner.get_product(product_id)
-        if product is None:
-            return None
+    async def invalidate_product(self, product_id: UUID) -> None:
+        await self.redis.set(self._detail_key(product_id), _TOMBSTONE, ex=_TOMBSTONE_TTL)
 
-        # 캐시 저장
-        await self.redis.set(
-            cache_key, json.dumps(product.model_dump(mode="json")), ex=self.ttl
+    async def store_product(self, product: ProductResponse) -> None:
+        # 적재 비용을 알 수 없으므로 delta 0 (XFetch 조기 갱신 없이 만료 시 갱신)
+        await self._store(
+            self._detail_key(product.id),
+            _PRODUCT_CODEC.dump(product),
+            0.0,
+            version=_product_version(product),
         )
 
-        return product
+    async def invalidate_product_list(self, *categories: str | None) -> None:
+        # 카테고리 목록과 전체 목록 모두 해당 상품을 포함하므로 함께 폐기
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for category in {*categories, None}:
+                pipe.incr(self._list_version_key(category))
+            await pipe.execute()
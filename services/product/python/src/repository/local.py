@@ -0,0 +1,194 @@
+import asyncio
+import json
+import logging
+import time
+from collections import OrderedDict, defaultdict
+from typing import Any, Awaitable, Callable
+from uuid import UUID
+
+from redis.asyncio import Redis
+
+from src.cursor import Cursor
+from src.repository.base import ProductRepository
+from src.repository.metrics import record_cache_lookup
+from src.schemas import ProductResponse
+from src.totals import Total
+
+logger = logging.getLogger(__name__)
+
+INVALIDATION_CHANNEL = "products:invalidate"
+
+
+class LocalCachedProductRepository(ProductRepository):
+    """프로세스 메모리 L1 캐시 Repository (Decorator 패턴, Redis 캐시 앞단)
+
+    - 크기 제한 LRU + 짧은 TTL (무효화 메시지를 놓쳐도 TTL 이내에 수렴)
+    - 적중 시 Redis 왕복/역직렬화 없이 객체(또는 응답 본문 bytes)를 그대로 반환
+    - 쓰기 시 Redis pub/sub으로 모든 인스턴스의 L1 항목을 무효화
+      (재고 변경은 무효화 대신 변경된 상품을 전파하여 각 인스턴스가 더 최신일 때만 교체)
+    - 목록은 카테고리별 로컬 세대 번호를 키에 포함, 무효화 시 세대 증가로 일괄 폐기
+      (재고 변경은 목록을 폐기하지 않으므로 L1 목록의 재고는 최대 TTL만큼 늦을 수 있음)
+    """
+
+    def __init__(self, inner: ProductRepository, redis: Redis, ttl: float, max_size: int):
+        self.inner = inner
+        self.redis = redis
+        self.ttl = ttl
+        self.max_size = max_size
+        self._entries: OrderedDict[tuple, tuple[float, Any]] = OrderedDict()
+        self._generations: defaultdict[str, int] = defaultdict(int)
+
+    def _get(self, key: tuple) -> Any | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def _set(self, key: tuple, value: Any) -> None:
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    async def _cached(
+        self, kind: str, cache_key: tuple, loader: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        cached = self._get(cache_key)
+        record_cache_lookup("l1", kind, cached is not None)
+        if cached is not None:
+            return cached
+
+        value = await loader()
+        if value is not None:
+            self._set(cache_key, value)
+        return value
+
+    def _list_key(self, kind: str, page: int, size: int, category: str | None) -> tuple:
+        namespace = category or "all"
+        # 조회 중 무효화되면 이전 세대 키에 저장되어 다시 읽히지 않음
+        return (kind, namespace, self._generations[namespace], page, size)
+
+    async def list_products(
+        self, page: int, size: int, category: str | None
+    ) -> tuple[list[ProductResponse], Total]:
+        return await self._cached(
+            "list",
+            self._list_key("list", page, size, category),
+            lambda: self.inner.list_products(page, size, category),
+        )
+
+    async def list_products_after(
+        self, cursor: Cursor, size: int, category: str | None
+    ) -> list[ProductResponse]:
+        return await self.inner.list_products_after(cursor, size, category)
+
+    async def get_product(self, product_id: UUID) -> ProductResponse | None:
+        return await self._cached(
+            "detail", ("detail", product_id), lambda: self.inner.get_product(product_id)
+        )
+
+    async def get_products(self, product_ids: list[UUID]) -> dict[UUID, ProductResponse]:
+        products: dict[UUID, ProductResponse] = {}
+        missing: list[UUID] = []
+        for product_id in product_ids:
+            cached = self._get(("detail", product_id))
+            record_cache_lookup("l1", "detail", cached is not None)
+            if cached is not None:
+                products[product_id] = cached
+            else:
+                missing.append(product_id)
+
+        if missing:
+            loaded = await self.inner.get_products(missing)
+            for product_id, product in loaded.items():
+                self._set(("detail", product_id), product)
+            products.update(loaded)
+        return products
+
+    async def list_products_json(self, page: int, size: int, category: str | None) -> bytes:
+        return await self._cached(
+            "list",
+            self._list_key("list_json", page, size, category),
+            lambda: self.inner.list_products_json(page, size, category),
+        )
+
+    async def get_product_json(self, product_id: UUID) -> bytes | None:
+        return await self._cached(
+            "detail",
+            ("detail_json", product_id),
+            lambda: self.inner.get_product_json(product_id),
+        )
+
+    # Cache invalidation
+
+    def _evict(self, product_ids: list[str], namespaces: list[str]) -> None:
+        for product_id in product_ids:
+            self._entries.pop(("detail", UUID(product_id)), None)
+            self._entries.pop(("detail_json", UUID(product_id)), None)
+        for namespace in namespaces:
+            self._generations[namespace] += 1
+
+    def _put(self, product: ProductResponse) -> None:
+        current = self._get(("detail", product.id))
+        if current is not None and current.updated_at > product.updated_at:
+            return  # 더 최신 값이 이미 있음 (전파 순서가 뒤바뀐 경우)
+        self._set(("detail", product.id), product)
+        self._set(("detail_json", product.id), product.model_dump_json().encode())
+
+    async def _publish(
+        self,
+        product_ids: list[str],
+        namespaces: list[str],
+        products: list[ProductResponse] | None = None,
+    ) -> None:
+        products = products or []
+        self._evict(product_ids, namespaces)
+        for product in products:
+            self._put(product)
+        message = json.dumps(
+            {
+                "products": product_ids,
+                "lists": namespaces,
+                "updated": [product.model_dump(mode="json") for product in products],
+            }
+        )
+        await self.redis.publish(INVALIDATION_CHANNEL, message)
+
+    async def invalidate_product(self, product_id: UUID) -> None:
+        # L2(Redis)를 먼저 무효화해야 L1 재적재 시 최신 값을 읽음
+        await self.inner.invalidate_product(product_id)
+        await self._publish([str(product_id)], [])
+
+    async def store_product(self, product: ProductResponse) -> None:
+        await self.inner.store_product(product)
+        await self._publish([], [], [product])
+
+    async def invalidate_product_list(self, *categories: str | None) -> None:
+        await self.inner.invalidate_product_list(*categories)
+        await self._publish([], sorted({category or "all" for category in categories} | {"all"}))
+
+    async def listen_invalidations(self) -> None:
+        """다른 인스턴스의 무효화 메시지 구독 (lifespan 백그라운드 태스크)"""
+        while True:
+            try:
+                async with self.redis.pubsub() as pubsub:
+                    await pubsub.subscribe(INVALIDATION_CHANNEL)
+                    # 구독 전/재연결 중 놓친 메시지가 있을 수 있으므로 L1 전체 폐기
+                    self._entries.clear()
+                    async for message in pubsub.listen():
+                        if message["type"] != "message":
+                            continue
+                        data = json.loads(message["data"])
+                        self._evict(data["products"], data["lists"])
+                        for product in data.get("updated", []):
+                            self._put(ProductResponse.model_validate(product))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Cache invalidation listener failed: {e}")
+                await asyncio.sleep(1.0)
@@ -0,0 +1,13 @@
+from opentelemetry import metrics
+
+meter = metrics.get_meter("product-service")
+cache_requests_counter = meter.create_counter(
+    "product.cache.requests",
+    description="상품 캐시 조회 수 (tier: l1/l2/grpc, result: hit/miss)",
+)
+
+
+def record_cache_lookup(tier: str, kind: str, hit: bool) -> None:
+    cache_requests_counter.add(
+        1, {"tier": tier, "kind": kind, "result": "hit" if hit else "miss"}
+    )
@@ -1,9 +1,11 @@
 from uuid import UUID
 
+from src.cursor import Cursor
 from src.database import get_connection
 from src.generated.query import AsyncQuerier
 from src.repository.base import ProductRepository
 from src.schemas import ProductResponse
+from src.totals import Total, product_totals
 
 
 class RdbProductRepository(ProductRepository):
@@ -11,19 +13,14 @@ class RdbProductRepository(ProductRepository):
 
     async def list_products(
         self, page: int, size: int, category: str | None
-    ) -> tuple[list[ProductResponse], int]:
+    ) -> tuple[list[ProductResponse], Total]:
         offset = (page - 1) * size
 
         async with get_connection() as conn:
             querier = AsyncQuerier(conn)
 
-            # Count query
-            if category:
-                total = await querier.count_products_by_category(category=category)
-            else:
-                total = await querier.count_products()
-
-            total = total or 0
+            # Count query (PRODUCT_TOTAL_MODE에 따라 COUNT/캐시/카운터/통계)
+            total = await product_totals.count(querier, category)
 
             # List query
             items = []
@@ -38,6 +35,25 @@ class RdbProductRepository(ProductRepository):
 
             return items, total
 
+    async def list_products_after(
+        self, cursor: Cursor, size: int, category: str | None
+    ) -> list[ProductResponse]:
+        created_at, product_id = cursor
+
+        async with get_connection() as conn:
+            querier = AsyncQuerier(conn)
+
+            # (created_at, id) 인덱스 범위 스캔이므로 페이지 깊이와 무관하게 size건만 읽음
+            if category:
+                rows = querier.list_products_by_category_after(
+                    category=category, created_at=created_at, id=product_id, limit=size
+                )
+            else:
+                rows = querier.list_products_after(
+                    created_at=created_at, id=product_id, limit=size
+                )
+            return [self._to_response(product) async for product in rows]
+
     async def get_product(self, product_id: UUID) -> ProductResponse | None:
         async with get_connection() as conn:
             querier = AsyncQuerier(conn)
@@ -48,6 +64,15 @@ class RdbProductRepository(ProductRepository):
 
             return self._to_response(product)
 
+    async def get_products(self, product_ids: list[UUID]) -> dict[UUID, ProductResponse]:
+        async with get_connection() as conn:
+            querier = AsyncQuerier(conn)
+            # ID 수와 무관하게 한 번의 왕복 (id = ANY($1))
+            return {
+                product.id: self._to_response(product)
+                async for product in querier.get_products_by_ids(ids=product_ids)
+            }
+
     def _to_response(self, product) -> ProductResponse:
         return ProductResponse(
             id=product.id,
@@ -60,3 +85,14 @@ class RdbProductRepository(ProductRepository):
             created_at=product.created_at,
             updated_at=product.updated_at,
         )
+
+    # Cache invalidation (no-op for DB-only repository)
+
+    async def invalidate_product(self, product_id: UUID) -> None:
+        pass
+
+    async def store_product(self, product: ProductResponse) -> None:
+        pass
+
+    async def invalidate_product_list(self, *categories: str | None) -> None:
+        pass
@@ -0,0 +1,9 @@
+import logging
+import sys
+
+from src.config import settings
+from src.grpc_server import run_grpc_servers
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    sys.exit(run_grpc_servers(max(settings.grpc_workers, 1)))
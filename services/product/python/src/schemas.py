@@ -1,8 +1,11 @@
 from datetime import datetime
 from enum import Enum
+from typing import Literal
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, computed_field
+
+from src.cursor import encode_cursor
 
 
 class HealthResponse(BaseModel):
@@ -48,10 +51,47 @@ class ProductResponse(BaseModel):
 
 class ProductListResponse(BaseModel):
     items: list[ProductResponse]
-    total: int
-    page: int
+    total: int | None = None  # 커서 조회 시 COUNT 생략
+    total_approximate: bool = False  # total이 캐시/통계 기반 근사치인지 여부
+    page: int | None = None  # 커서 조회 시 없음
     size: int
 
+    @computed_field
+    @property
+    def next_cursor(self) -> str | None:
+        """다음 페이지 커서 (마지막 페이지면 None)"""
+        if not self.items or len(self.items) < self.size:
+            return None
+        if self.page is None and self.total is not None:
+            return None  # ID 목록 조회 (이어서 조회할 페이지 없음)
+        last = self.items[-1]
+        return encode_cursor(last.created_at, last.id)
+
+
+# Product import schemas
+class ImportJobStatus(str, Enum):
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+class ProductImportError(BaseModel):
+    line: int  # 요청 본문의 줄 번호 (1부터, CSV는 헤더 포함)
+    message: str
+
+
+class ProductImportJob(BaseModel):
+    id: UUID
+    format: Literal["ndjson", "csv"]
+    status: ImportJobStatus
+    processed: int = 0  # 처리한 행 수
+    created: int = 0
+    failed: int = 0
+    errors: list[ProductImportError] = []  # 앞쪽 일부 행만 보고
+    message: str | None = None  # 작업 전체 실패 사유
+    started_at: datetime
+    finished_at: datetime | None = None
+
 
 # Stock schemas
 class UpdateStockRequest(BaseModel):
@@ -64,6 +104,29 @@ class StockResponse(BaseModel):
     updated_at: datetime
 
 
+class StockReservationItem(BaseModel):
+    product_id: UUID
+    quantity: int = Field(ge=1)
+
+
+class ReserveStockRequest(BaseModel):
+    items: list[StockReservationItem] = Field(min_length=1)
+    ttl_seconds: int | None = Field(default=None, ge=1)  # 없으면 STOCK_RESERVATION_TTL
+
+
+class StockReservationResponse(BaseModel):
+    reservation_id: UUID
+    items: list[StockReservationItem]
+    expires_at: datetime | None = None  # 확정/취소 응답에서는 없음
+
+
+class HotdealResponse(BaseModel):
+    product_id: UUID
+    deal_id: UUID | None = None
+    stock: int
+    message: str
+
+
 # Deal schemas
 class DealStatus(str, Enum):
     SCHEDULED = "scheduled"
@@ -97,5 +160,6 @@ class DealResponse(BaseModel):
 class DealListResponse(BaseModel):
     items: list[DealResponse]
     total: int
+    total_approximate: bool = False
     page: int
     size: int
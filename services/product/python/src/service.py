@@ -1,25 +1,40 @@
+import asyncio
+import logging
 from datetime import datetime, timezone
 from uuid import UUID
 
+from sqlalchemy.ext.asyncio import AsyncConnection
+
 from src.config import settings
+from src.cursor import decode_cursor
 from src.database import get_connection, get_redis
+from src.deal_index import DealIndex
 from src.generated.query import (
+    AdjustStockRow,
     AsyncQuerier,
     CreateDealParams,
     CreateProductParams,
     GetDealByIDRow,
+    GetDealsByIDsRow,
     ListActiveDealsRow,
+    ListUpcomingDealsRow,
     UpdateProductParams,
 )
+from src.hotdeal import HotdealSnapshot, HotdealStock, InsufficientStockError
+from src.hotdeal_shards import ShardedHotdealStock
 from src.repository.base import ProductRepository
 from src.repository.cached import CachedProductRepository
+from src.repository.local import LocalCachedProductRepository
 from src.repository.rdb import RdbProductRepository
 from src.schemas import (
     DealResponse,
     DealStatus,
+    HotdealResponse,
     ProductResponse,
     StockResponse,
 )
+from src.stock_combiner import StockWriteCombiner
+from src.totals import Total, deal_totals
 
 # Repository 인스턴스 (lazy initialization)
 _repository: ProductRepository | None = None
@@ -32,13 +47,90 @@ async def get_repository() -> ProductRepository:
         if settings.enable_cache:
             redis = await get_redis()
             _repository = CachedProductRepository(
-                inner=rdb_repo, redis=redis, ttl=settings.cache_ttl
+                inner=rdb_repo,
+                redis=redis,
+                ttl=settings.cache_ttl,
+                stale_ttl=settings.cache_stale_ttl,
+                xfetch_beta=settings.cache_xfetch_beta,
+                lock_timeout=settings.cache_lock_timeout if settings.cache_lock_enabled else None,
             )
+            if settings.enable_local_cache:
+                _repository = LocalCachedProductRepository(
+                    inner=_repository,
+                    redis=redis,
+                    ttl=settings.local_cache_ttl,
+                    max_size=settings.local_cache_max_size,
+                )
         else:
             _repository = rdb_repo
     return _repository
 
 
+logger = logging.getLogger(__name__)
+
+# 핫딜 메모리 인덱스 (deal_index_enabled일 때만 생성)
+_deal_index: DealIndex | None = None
+
+
+def get_deal_index() -> DealIndex | None:
+    global _deal_index
+    if settings.deal_index_enabled and _deal_index is None:
+        _deal_index = DealIndex(
+            loader=_load_upcoming_deals,
+            tick=settings.deal_index_tick,
+            reload_interval=settings.deal_index_reload_interval,
+            redis_factory=get_redis,
+        )
+    return _deal_index
+
+
+async def _publish_deal_stock(deal_id: UUID, remaining_stock: int) -> None:
+    """핫딜 인덱스의 남은 재고/상태 갱신 (다른 인스턴스에도 전파)"""
+    deal_index = get_deal_index()
+    if deal_index is None:
+        return
+    deal = deal_index.get(deal_id)
+    if deal is None or deal.remaining_stock == remaining_stock:
+        return
+    await deal_index.publish(
+        deal.model_copy(
+            update={
+                "remaining_stock": remaining_stock,
+                "status": _get_deal_status(deal.starts_at, deal.ends_at, remaining_stock),
+            }
+        )
+    )
+
+
+# 핫딜 재고 저장소 (hotdeal_stock_redis면 Redis, hotdeal_stock_shards > 0이면 DB 분할 카운터)
+_hotdeal_stock: HotdealStock | ShardedHotdealStock | None = None
+
+
+async def get_hotdeal_stock() -> HotdealStock | ShardedHotdealStock | None:
+    global _hotdeal_stock
+    if _hotdeal_stock is None:
+        if settings.hotdeal_stock_redis:
+            _hotdeal_stock = HotdealStock(await get_redis())
+        elif settings.hotdeal_stock_shards > 0:
+            _hotdeal_stock = ShardedHotdealStock(settings.hotdeal_stock_shards)
+    return _hotdeal_stock
+
+
+# 재고 쓰기 배치 (stock_combine_enabled일 때만 생성)
+_stock_combiner: StockWriteCombiner | None = None
+
+
+def get_stock_combiner() -> StockWriteCombiner | None:
+    global _stock_combiner
+    if settings.stock_combine_enabled and _stock_combiner is None:
+        _stock_combiner = StockWriteCombiner(
+            apply=_apply_stock_deltas,
+            window=settings.stock_combine_window,
+            max_batch=settings.stock_combine_max_batch,
+        )
+    return _stock_combiner
+
+
 class ProductServiceError(Exception):
     def __init__(self, error: str, message: str, status_code: int = 400):
         self.error = error
@@ -58,7 +150,9 @@ def _get_deal_status(starts_at: datetime, ends_at: datetime, remaining_stock: in
     return DealStatus.ACTIVE
 
 
-def _deal_row_to_response(row: GetDealByIDRow | ListActiveDealsRow) -> DealResponse:
+def _deal_row_to_response(
+    row: GetDealByIDRow | GetDealsByIDsRow | ListActiveDealsRow | ListUpcomingDealsRow,
+) -> DealResponse:
     product = ProductResponse(
         id=row.p_id,
         name=row.p_name,
@@ -111,17 +205,20 @@ async def create_product(
         if product is None:
             raise ProductServiceError("CREATE_FAILED", "상품 생성에 실패했습니다.", 500)
 
-        return ProductResponse(
-            id=product.id,
-            name=product.name,
-            description=product.description,
-            price=product.price,
-            stock=product.stock,
-            category=product.category,
-            image_url=product.image_url,
-            created_at=product.created_at,
-            updated_at=product.updated_at,
-        )
+    repository = await get_repository()
+    await repository.invalidate_product_list(product.category)
+
+    return ProductResponse(
+        id=product.id,
+        name=product.name,
+        description=product.description,
+        price=product.price,
+        stock=product.stock,
+        category=product.category,
+        image_url=product.image_url,
+        created_at=product.created_at,
+        updated_at=product.updated_at,
+    )
 
 
 async def get_product(product_id: UUID) -> ProductResponse:
@@ -134,13 +231,66 @@ async def get_product(product_id: UUID) -> ProductResponse:
     return product
 
 
+def _unique_ids(ids: list[UUID]) -> list[UUID]:
+    """중복 제거 (요청 순서 유지) 및 개수 제한 확인"""
+    unique = list(dict.fromkeys(ids))
+    if len(unique) > settings.batch_lookup_max_ids:
+        raise ProductServiceError(
+            "TOO_MANY_IDS",
+            f"한 번에 최대 {settings.batch_lookup_max_ids}개까지 조회할 수 있습니다.",
+            400,
+        )
+    return unique
+
+
+async def get_products(product_ids: list[UUID]) -> list[ProductResponse]:
+    """상품 여러 건 조회 (요청 순서대로, 없는 상품은 제외)"""
+    product_ids = _unique_ids(product_ids)
+    if not product_ids:
+        return []
+
+    repository = await get_repository()
+    products = await repository.get_products(product_ids)
+    return [products[product_id] for product_id in product_ids if product_id in products]
+
+
 async def list_products(
     page: int = 1, size: int = 20, category: str | None = None
-) -> tuple[list[ProductResponse], int]:
+) -> tuple[list[ProductResponse], Total]:
     repository = await get_repository()
     return await repository.list_products(page, size, category)
 
 
+async def list_products_after(
+    cursor: str, size: int = 20, category: str | None = None
+) -> list[ProductResponse]:
+    """커서(이전 응답의 next_cursor) 이후 상품 목록 (OFFSET 없이 keyset 조회)"""
+    try:
+        position = decode_cursor(cursor)
+    except ValueError:
+        raise ProductServiceError("INVALID_CURSOR", "유효하지 않은 커서입니다.", 400)
+
+    repository = await get_repository()
+    return await repository.list_products_after(position, size, category)
+
+
+async def get_product_json(product_id: UUID) -> bytes:
+    """상품 단건 응답 본문 (캐시 적중 시 저장된 bytes를 그대로 사용)"""
+    repository = await get_repository()
+    body = await repository.get_product_json(product_id)
+
+    if body is None:
+        raise ProductServiceError("NOT_FOUND", "상품을 찾을 수 없습니다.", 404)
+
+    return body
+
+
+async def list_products_json(page: int = 1, size: int = 20, category: str | None = None) -> bytes:
+    """상품 목록 응답 본문 (캐시 적중 시 저장된 bytes를 그대로 사용)"""
+    repository = await get_repository()
+    return await repository.list_products_json(page, size, category)
+
+
 async def update_product(
     product_id: UUID,
     name: str | None = None,
@@ -172,17 +322,22 @@ async def update_product(
         if product is None:
             raise ProductServiceError("UPDATE_FAILED", "상품 수정에 실패했습니다.", 500)
 
-        return ProductResponse(
-            id=product.id,
-            name=product.name,
-            description=product.description,
-            price=product.price,
-            stock=product.stock,
-            category=product.category,
-            image_url=product.image_url,
-            created_at=product.created_at,
-            updated_at=product.updated_at,
-        )
+    # 커밋 이후 무효화 (카테고리가 바뀐 경우 이전 카테고리 목록도 폐기)
+    repository = await get_repository()
+    await repository.invalidate_product(product_id)
+    await repository.invalidate_product_list(existing.category, product.category)
+
+    return ProductResponse(
+        id=product.id,
+        name=product.name,
+        description=product.description,
+        price=product.price,
+        stock=product.stock,
+        category=product.category,
+        image_url=product.image_url,
+        created_at=product.created_at,
+        updated_at=product.updated_at,
+    )
 
 
 # Stock operations
@@ -202,31 +357,287 @@ async def get_stock(product_id: UUID) -> StockResponse:
 
 
 async def update_stock(product_id: UUID, delta: int) -> StockResponse:
+    result = await _update_stock(product_id, delta)
+    if isinstance(result, StockResponse):
+        return result
+    return StockResponse(product_id=result.id, stock=result.stock, updated_at=result.updated_at)
+
+
+async def update_stock_product(product_id: UUID, delta: int) -> ProductResponse:
+    """재고 증감 후 상품 정보 (DB 경로는 UPDATE ... RETURNING 행을 그대로 사용, 재조회 없음)"""
+    result = await _update_stock(product_id, delta)
+    if isinstance(result, ProductResponse):
+        return result
+
+    # 핫딜 재고는 Redis(또는 분할 카운터)에만 있으므로 상품 정보에 재고만 반영
+    product = await get_product(product_id)
+    return product.model_copy(update={"stock": result.stock})
+
+
+async def _update_stock(product_id: UUID, delta: int) -> StockResponse | ProductResponse:
+    """핫딜 재고면 StockResponse, DB 재고면 갱신된 상품 행 반환"""
+    # 진행 중인 핫딜 상품은 Redis(또는 DB 분할 카운터)에서 원자적으로 증감
+    hotdeal_stock = await get_hotdeal_stock()
+    if hotdeal_stock is not None:
+        try:
+            stock = await hotdeal_stock.update(product_id, delta)
+        except InsufficientStockError:
+            raise ProductServiceError("INSUFFICIENT_STOCK", "재고가 부족합니다.", 400)
+        if stock is not None:
+            return StockResponse(
+                product_id=product_id, stock=stock, updated_at=datetime.now(timezone.utc)
+            )
+
+    # 같은 상품의 동시 요청을 배치로 모아 반영 (stock_combine_enabled)
+    stock_combiner = get_stock_combiner()
+    if stock_combiner is not None:
+        return await stock_combiner.submit(product_id, delta)
+
+    result = (await _apply_stock_deltas(product_id, [delta]))[0]
+    if isinstance(result, ProductServiceError):
+        raise result
+    return result
+
+
+async def _apply_stock_deltas(
+    product_id: UUID, deltas: list[int]
+) -> list[ProductResponse | ProductServiceError]:
+    """재고 증감 목록을 요청 순서대로 한 트랜잭션에 반영 (요청별 반영 직후 상품 또는 오류 반환)"""
+    now = datetime.now(timezone.utc)
+
     async with get_connection() as conn:
         querier = AsyncQuerier(conn)
 
-        # Check current stock with lock
-        stock_row = await querier.get_stock_for_update(id=product_id)
-        if stock_row is None:
+        applied = None
+        if len(deltas) > 1:
+            applied = await _adjust_stock_combined(conn, querier, product_id, deltas, now)
+        if applied is None:
+            applied = await _adjust_stock_in_order(conn, querier, product_id, deltas, now)
+        results, last_row = applied
+        await conn.commit()
+
+    if last_row is not None:
+        await stock_adjusted(last_row)
+    return results
+
+
+async def adjust_stock_in_transaction(
+    querier: AsyncQuerier, product_id: UUID, delta: int
+) -> AdjustStockRow:
+    """진행 중인 트랜잭션에서 products.stock 증감 (커밋 후 stock_adjusted 호출)
+
+    예약 기록 등 다른 변경과 한 트랜잭션으로 반영할 때 사용하며,
+    재고(또는 진행 중인 핫딜 수량)가 부족하면 예외 (호출자는 커밋하지 않고 롤백)
+    """
+    row = await querier.adjust_stock(delta=delta, id=product_id, now=datetime.now(timezone.utc))
+    if row is not None and (row.deal_id is None or row.deal_remaining_stock is not None):
+        return row
+    if row is None and await querier.get_product_by_id(id=product_id) is None:
+        raise ProductServiceError("NOT_FOUND", "상품을 찾을 수 없습니다.", 404)
+    raise ProductServiceError("INSUFFICIENT_STOCK", "재고가 부족합니다.", 400)
+
+
+async def stock_adjusted(row: AdjustStockRow) -> None:
+    """재고 증감 커밋 후 캐시/핫딜 인덱스 반영"""
+    # 재고만 바뀌므로 목록은 그대로 (목록 캐시는 상품 본문을 단건 키에서 조회)
+    # 무효화하면 주문이 계속 들어오는 상품은 다시 캐시되지 않으므로 커밋된 행으로 갱신
+    repository = await get_repository()
+    await repository.store_product(_adjusted_product(row))
+
+    if row.deal_id is not None:
+        await _publish_deal_stock(row.deal_id, row.deal_remaining_stock)
+
+
+def _adjusted_product(row: AdjustStockRow) -> ProductResponse:
+    return ProductResponse(
+        id=row.id,
+        name=row.name,
+        description=row.description,
+        price=row.price,
+        stock=row.stock,
+        category=row.category,
+        image_url=row.image_url,
+        created_at=row.created_at,
+        updated_at=row.updated_at,
+    )
+
+
+async def _adjust_stock_combined(
+    conn: AsyncConnection,
+    querier: AsyncQuerier,
+    product_id: UUID,
+    deltas: list[int],
+    now: datetime,
+) -> tuple[list[ProductResponse | ProductServiceError], AdjustStockRow] | None:
+    """증감 합계를 조건부 UPDATE 한 번으로 반영
+
+    반영 전 값을 역산해 요청 순서대로 중간 재고가 음수가 되지 않는지 확인하고,
+    한 건이라도 실패해야 하면 롤백 후 None 반환 (요청별 반영으로 전환)
+    """
+    total = sum(deltas)
+    row = await querier.adjust_stock(delta=total, id=product_id, now=now)
+    if row is None or (row.deal_id is not None and row.deal_remaining_stock is None):
+        await conn.rollback()
+        return None
+
+    stock = row.stock - total
+    # 핫딜 수량은 deal_stock 상한으로 잘릴 수 있어 역산 값이 실제보다 작거나 같음 (보수적으로 판정)
+    remaining = row.deal_remaining_stock - total if row.deal_id is not None else None
+    product = _adjusted_product(row)
+    results: list[ProductResponse | ProductServiceError] = []
+    for delta in deltas:
+        stock += delta
+        if remaining is not None:
+            remaining += delta
+        if stock < 0 or (remaining is not None and remaining < 0):
+            await conn.rollback()
+            return None
+        results.append(product.model_copy(update={"stock": stock}))
+    return results, row
+
+
+async def _adjust_stock_in_order(
+    conn: AsyncConnection,
+    querier: AsyncQuerier,
+    product_id: UUID,
+    deltas: list[int],
+    now: datetime,
+) -> tuple[list[ProductResponse | ProductServiceError], AdjustStockRow | None]:
+    """요청마다 조건부 UPDATE (배치일 때만 SAVEPOINT로 실패한 요청을 개별 취소)"""
+    results: list[ProductResponse | ProductServiceError] = []
+    last_row = None
+    exists = None
+    for delta in deltas:
+        savepoint = await conn.begin_nested() if len(deltas) > 1 else None
+        row = await querier.adjust_stock(delta=delta, id=product_id, now=now)
+        if row is not None and (row.deal_id is None or row.deal_remaining_stock is not None):
+            if savepoint is not None:
+                await savepoint.commit()
+            last_row = row
+            results.append(_adjusted_product(row))
+            continue
+
+        # 0행: 재고 부족 또는 상품 없음 (실패 경로에서만 구분)
+        # 상품 재고는 충분하지만 진행 중인 핫딜 수량이 부족하면 상품 재고 증감도 취소
+        if savepoint is not None:
+            await savepoint.rollback()
+        elif row is not None:
+            await conn.rollback()
+        if row is None and last_row is None and exists is None:
+            exists = await querier.get_product_by_id(id=product_id) is not None
+        if exists is False:
+            results.append(ProductServiceError("NOT_FOUND", "상품을 찾을 수 없습니다.", 404))
+        else:
+            results.append(ProductServiceError("INSUFFICIENT_STOCK", "재고가 부족합니다.", 400))
+    return results, last_row
+
+
+# Hotdeal operations
+async def start_hotdeal(product_id: UUID) -> HotdealResponse:
+    hotdeal_stock = await get_hotdeal_stock()
+    if hotdeal_stock is None:
+        raise ProductServiceError(
+            "HOTDEAL_DISABLED", "핫딜 재고 저장소가 비활성화되어 있습니다.", 400
+        )
+
+    async with get_connection() as conn:
+        querier = AsyncQuerier(conn)
+        product = await querier.get_product_by_id(id=product_id)
+        if product is None:
             raise ProductServiceError("NOT_FOUND", "상품을 찾을 수 없습니다.", 404)
 
-        new_stock = stock_row.stock + delta
-        if new_stock < 0:
-            raise ProductServiceError("INSUFFICIENT_STOCK", "재고가 부족합니다.", 400)
+        # 종료되지 않은 핫딜이 있으면 핫딜 남은 재고까지만 판매
+        deal = await querier.get_current_deal_by_product(
+            product_id=product_id, ends_at=datetime.now(timezone.utc)
+        )
 
-        result = await querier.update_stock(id=product_id, stock=new_stock)
-        await conn.commit()
+    stock = min(product.stock, deal.remaining_stock) if deal else product.stock
+    deal_id = deal.id if deal else None
+    if not await hotdeal_stock.start(product_id, stock, deal_id):
+        raise ProductServiceError("HOTDEAL_ALREADY_STARTED", "이미 진행 중인 핫딜입니다.", 409)
 
-        if result is None:
-            raise ProductServiceError("UPDATE_FAILED", "재고 수정에 실패했습니다.", 500)
+    return HotdealResponse(
+        product_id=product_id, deal_id=deal_id, stock=stock, message="핫딜이 시작되었습니다."
+    )
 
-        return StockResponse(
-            product_id=result.id,
-            stock=result.stock,
-            updated_at=result.updated_at,
+
+async def _settle_hotdeal(querier: AsyncQuerier, snapshot: HotdealSnapshot) -> None:
+    """판매량만큼 상품 재고 차감 (종료 처리 트랜잭션 안에서 호출)"""
+    sold = snapshot.loaded - snapshot.remaining
+    stock_row = await querier.get_stock_for_update(id=snapshot.product_id)
+    if stock_row is not None and sold != 0:
+        # 진행 중 관리자 수정 등으로 재고가 판매량보다 적으면 맞추지 않고 종료를 중단
+        if stock_row.stock < sold:
+            raise ProductServiceError(
+                "HOTDEAL_STOCK_CONFLICT",
+                f"핫딜 판매량({sold})이 상품 재고({stock_row.stock})보다 많습니다.",
+                409,
+            )
+        await querier.update_stock(id=snapshot.product_id, stock=stock_row.stock - sold)
+    if snapshot.deal_id is not None:
+        await querier.set_deal_remaining_stock(
+            remaining_stock=snapshot.remaining, id=snapshot.deal_id
         )
 
 
+async def end_hotdeal(product_id: UUID) -> HotdealResponse:
+    hotdeal_stock = await get_hotdeal_stock()
+    if hotdeal_stock is None:
+        raise ProductServiceError(
+            "HOTDEAL_DISABLED", "핫딜 재고 저장소가 비활성화되어 있습니다.", 400
+        )
+
+    snapshot = await hotdeal_stock.end(product_id, _settle_hotdeal)
+    if snapshot is None:
+        raise ProductServiceError("HOTDEAL_NOT_STARTED", "진행 중인 핫딜이 아닙니다.", 404)
+
+    repository = await get_repository()
+    await repository.invalidate_product(product_id)
+    if snapshot.deal_id is not None:
+        await _publish_deal_stock(snapshot.deal_id, snapshot.remaining)
+
+    return HotdealResponse(
+        product_id=product_id,
+        deal_id=snapshot.deal_id,
+        stock=snapshot.remaining,
+        message="핫딜이 종료되었습니다.",
+    )
+
+
+async def reconcile_hotdeal_stock() -> int:
+    """진행 중인 핫딜의 남은 재고를 deals.remaining_stock에 반영 (반영한 핫딜 수)"""
+    hotdeal_stock = await get_hotdeal_stock()
+    if hotdeal_stock is None:
+        return 0
+
+    snapshots = [s for s in await hotdeal_stock.snapshot() if s.deal_id is not None]
+    if not snapshots:
+        return 0
+
+    async with get_connection() as conn:
+        querier = AsyncQuerier(conn)
+        for snapshot in snapshots:
+            await querier.set_deal_remaining_stock(
+                remaining_stock=snapshot.remaining, id=snapshot.deal_id
+            )
+        await conn.commit()
+
+    # 핫딜 재고는 주문마다 인덱스를 거치지 않으므로 반영 주기마다 인덱스에도 반영
+    for snapshot in snapshots:
+        await _publish_deal_stock(snapshot.deal_id, snapshot.remaining)
+    return len(snapshots)
+
+
+async def run_hotdeal_reconciler() -> None:
+    """lifespan 백그라운드 태스크"""
+    while True:
+        await asyncio.sleep(settings.hotdeal_reconcile_interval)
+        try:
+            await reconcile_hotdeal_stock()
+        except Exception as e:
+            logger.warning(f"Hotdeal stock reconciliation failed: {e}")
+
+
 # Deal operations
 async def create_deal(
     product_id: UUID,
@@ -258,22 +669,35 @@ async def create_deal(
         if deal is None:
             raise ProductServiceError("CREATE_FAILED", "핫딜 생성에 실패했습니다.", 500)
 
-        return DealResponse(
-            id=deal.id,
-            product_id=deal.product_id,
-            product=product,
-            deal_price=deal.deal_price,
-            original_price=product.price,
-            deal_stock=deal.deal_stock,
-            remaining_stock=deal.remaining_stock,
-            starts_at=deal.starts_at,
-            ends_at=deal.ends_at,
-            status=_get_deal_status(deal.starts_at, deal.ends_at, deal.remaining_stock),
-            created_at=deal.created_at,
-        )
+    response = DealResponse(
+        id=deal.id,
+        product_id=deal.product_id,
+        product=product,
+        deal_price=deal.deal_price,
+        original_price=product.price,
+        deal_stock=deal.deal_stock,
+        remaining_stock=deal.remaining_stock,
+        starts_at=deal.starts_at,
+        ends_at=deal.ends_at,
+        status=_get_deal_status(deal.starts_at, deal.ends_at, deal.remaining_stock),
+        created_at=deal.created_at,
+    )
+
+    deal_index = get_deal_index()
+    if deal_index is not None:
+        await deal_index.publish(response)
+
+    return response
 
 
 async def get_deal(deal_id: UUID) -> DealResponse:
+    # 예정/진행 중 핫딜은 메모리 인덱스에서 (종료된 핫딜은 DB 조회)
+    deal_index = get_deal_index()
+    if deal_index is not None:
+        deal = deal_index.get(deal_id)
+        if deal is not None:
+            return deal
+
     async with get_connection() as conn:
         querier = AsyncQuerier(conn)
         row = await querier.get_deal_by_id(id=deal_id)
@@ -284,16 +708,42 @@ async def get_deal(deal_id: UUID) -> DealResponse:
         return _deal_row_to_response(row)
 
 
-async def list_active_deals(page: int = 1, size: int = 20) -> tuple[list[DealResponse], int]:
+async def get_deals(deal_ids: list[UUID]) -> list[DealResponse]:
+    """핫딜 여러 건 조회 (요청 순서대로, 없는 핫딜은 제외)"""
+    deal_ids = _unique_ids(deal_ids)
+
+    deals: dict[UUID, DealResponse] = {}
+    deal_index = get_deal_index()
+    if deal_index is not None:
+        for deal_id in deal_ids:
+            deal = deal_index.get(deal_id)
+            if deal is not None:
+                deals[deal_id] = deal
+
+    missing = [deal_id for deal_id in deal_ids if deal_id not in deals]
+    if missing:
+        async with get_connection() as conn:
+            querier = AsyncQuerier(conn)
+            async for row in querier.get_deals_by_ids(ids=missing):
+                deals[row.id] = _deal_row_to_response(row)
+
+    return [deals[deal_id] for deal_id in deal_ids if deal_id in deals]
+
+
+async def list_active_deals(page: int = 1, size: int = 20) -> tuple[list[DealResponse], Total]:
+    deal_index = get_deal_index()
+    if deal_index is not None:
+        items, total = deal_index.list_active(page, size)
+        return items, Total(total)
+
     offset = (page - 1) * size
     now = datetime.now(timezone.utc)
 
     async with get_connection() as conn:
         querier = AsyncQuerier(conn)
 
-        # Count active deals
-        total = await querier.count_active_deals(starts_at=now)
-        total = total or 0
+        # Count active deals (DEAL_TOTAL_MODE에 따라 COUNT/캐시)
+        total = await deal_totals.count(querier)
 
         # List active deals
         items = []
@@ -301,3 +751,14 @@ async def list_active_deals(page: int = 1, size: int = 20) -> tuple[list[DealRes
             items.append(_deal_row_to_response(row))
 
         return items, total
+
+
+async def _load_upcoming_deals() -> list[DealResponse]:
+    """종료되지 않은 핫딜 전체 (핫딜 인덱스 적재용)"""
+    now = datetime.now(timezone.utc)
+
+    async with get_connection() as conn:
+        querier = AsyncQuerier(conn)
+        return [
+            _deal_row_to_response(row) async for row in querier.list_upcoming_deals(ends_at=now)
+        ]
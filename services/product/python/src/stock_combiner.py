@@ -0,0 +1,87 @@
+import asyncio
+from typing import Any, Awaitable, Callable
+from uuid import UUID
+
+
+class StockWriteCombiner:
+    """상품별 재고 증감 요청을 모아 한 번에 반영 (group commit)
+
+    - 첫 요청 후 window초 또는 max_batch건이 모이면 배치를 반영
+    - 같은 상품은 한 번에 하나의 배치만 반영하고, 반영 중 들어온 요청은 다음 배치로 모음
+      (행 잠금 보유 횟수가 요청 수가 아닌 배치 수에 비례)
+    - apply는 배치의 증감 목록을 받아 요청 순서대로 결과(또는 예외 객체) 목록을 반환
+    """
+
+    def __init__(
+        self,
+        apply: Callable[[UUID, list[int]], Awaitable[list[Any]]],
+        window: float = 0.002,
+        max_batch: int = 100,
+    ):
+        self._apply = apply
+        self.window = window
+        self.max_batch = max_batch
+        self._pending: dict[UUID, list[tuple[int, asyncio.Future]]] = {}
+        self._timers: dict[UUID, asyncio.TimerHandle] = {}
+        self._running: dict[UUID, asyncio.Task] = {}
+
+    async def submit(self, product_id: UUID, delta: int) -> Any:
+        future = asyncio.get_running_loop().create_future()
+        batch = self._pending.setdefault(product_id, [])
+        batch.append((delta, future))
+        if len(batch) >= self.max_batch:
+            self._flush(product_id)
+        elif len(batch) == 1:
+            self._timers[product_id] = asyncio.get_running_loop().call_later(
+                self.window, self._on_timer, product_id
+            )
+        return await future
+
+    def _on_timer(self, product_id: UUID) -> None:
+        self._timers.pop(product_id, None)
+        self._flush(product_id)
+
+    def _flush(self, product_id: UUID) -> None:
+        if product_id in self._running:
+            return  # 반영 중인 배치가 끝나면 이어서 반영
+        timer = self._timers.pop(product_id, None)
+        if timer is not None:
+            timer.cancel()
+        # 반영 전에 취소된 요청은 재고를 바꾸지 않도록 제외
+        pending = [
+            (delta, future)
+            for delta, future in self._pending.pop(product_id, [])
+            if not future.cancelled()
+        ]
+        batch, rest = pending[: self.max_batch], pending[self.max_batch :]
+        if rest:
+            self._pending[product_id] = rest
+        if batch:
+            self._running[product_id] = asyncio.create_task(self._run(product_id, batch))
+
+    async def _run(self, product_id: UUID, batch: list[tuple[int, asyncio.Future]]) -> None:
+        try:
+            try:
+                results = await self._apply(product_id, [delta for delta, _ in batch])
+            except Exception as e:
+                results = [e] * len(batch)
+
+            for (_, future), result in zip(batch, results):
+                if future.done():
+                    continue  # 호출자가 취소됨 (증감은 이미 반영)
+                if isinstance(result, Exception):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
+        except BaseException:
+            # 반영 중 취소(종료 등)되면 반영 여부를 알 수 없으므로 대기 중인 요청도 취소
+            for _, future in batch:
+                if not future.done():
+                    future.cancel()
+            raise
+        finally:
+            del self._running[product_id]
+            pending = self._pending.get(product_id)
+            # 대기 시간이 이미 지났거나 가득 찬 다음 배치는 바로 반영
+            if pending and (product_id not in self._timers or len(pending) >= self.max_batch):
+                self._flush(product_id)
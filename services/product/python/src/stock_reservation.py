@@ -0,0 +1,224 @@
+import asyncio
+import logging
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from uuid import UUID, uuid4
+
+from src.config import settings
+from src.database import get_connection
+from src.generated.query import AdjustStockRow, AsyncQuerier
+from src.hotdeal import HotdealEndingError, HotdealStock, InsufficientStockError
+from src.hotdeal_shards import ShardedHotdealStock
+from src.schemas import StockReservationItem, StockReservationResponse
+from src.service import (
+    ProductServiceError,
+    adjust_stock_in_transaction,
+    get_hotdeal_stock,
+    stock_adjusted,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _merge_items(items: list[StockReservationItem]) -> list[StockReservationItem]:
+    """같은 상품은 수량을 합침 (예약 행은 상품별 1행)"""
+    quantities: defaultdict[UUID, int] = defaultdict(int)
+    for item in items:
+        quantities[item.product_id] += item.quantity
+    return [
+        StockReservationItem(product_id=product_id, quantity=quantity)
+        for product_id, quantity in quantities.items()
+    ]
+
+
+# Redis 예약 토큰 보관 시간 여유 (만료된 예약을 sweeper가 늦게 처리해도 토큰이 남아 있도록)
+_TOKEN_TTL_MARGIN = 86400
+
+
+async def _take(reservation_id: UUID, item: StockReservationItem) -> None:
+    """예약 항목 차감 (차감한 곳을 차감과 같은 트랜잭션에서 예약 행에 기록)
+
+    Redis 핫딜 재고는 예약 토큰을 같은 Lua Script에서 기록하므로 예약 행은 갱신하지 않음
+    """
+    hotdeal_stock = await get_hotdeal_stock()
+    try:
+        if isinstance(hotdeal_stock, HotdealStock):
+            ttl = settings.stock_reservation_max_ttl + _TOKEN_TTL_MARGIN
+            if await hotdeal_stock.reserve(reservation_id, item.product_id, item.quantity, ttl):
+                return
+
+        async with get_connection() as conn:
+            querier = AsyncQuerier(conn)
+            row = None
+            source = "db"
+            if isinstance(hotdeal_stock, ShardedHotdealStock) and (
+                await hotdeal_stock.adjust(querier, item.product_id, -item.quantity) is not None
+            ):
+                source = "shards"
+            else:
+                row = await adjust_stock_in_transaction(querier, item.product_id, -item.quantity)
+
+            recorded = await querier.set_stock_reservation_source(
+                reservation_id=reservation_id, product_id=item.product_id, source=source
+            )
+            if not recorded:
+                raise ProductServiceError(
+                    "RESERVATION_NOT_FOUND", "예약을 찾을 수 없거나 만료되었습니다.", 404
+                )
+            await conn.commit()
+    except InsufficientStockError:
+        raise ProductServiceError("INSUFFICIENT_STOCK", "재고가 부족합니다.", 400)
+
+    if row is not None:
+        await stock_adjusted(row)
+
+
+async def _restore(
+    querier: AsyncQuerier, reservation_id: UUID, product_id: UUID, quantity: int, source: str | None
+) -> AdjustStockRow | None:
+    """삭제한 예약 항목의 재고를 같은 트랜잭션에서 반환 (products.stock으로 반환했으면 갱신된 행)
+
+    Redis 핫딜 재고는 예약 토큰으로 한 번만 반환되므로, 커밋 전에 실패해 재시도해도 중복 반환 없음
+    """
+    hotdeal_stock = await get_hotdeal_stock()
+    if source is None:
+        if not isinstance(hotdeal_stock, HotdealStock):
+            return None  # 차감 전에 중단된 항목
+        try:
+            released = await hotdeal_stock.release(reservation_id, product_id)
+        except HotdealEndingError:
+            raise ProductServiceError(
+                "HOTDEAL_ENDING", "핫딜 종료 처리 중입니다. 잠시 후 다시 시도해주세요.", 409
+            )
+        if released is not None:
+            return None  # Redis로 반환했거나 차감 전에 중단된 항목
+    elif source == "shards" and isinstance(hotdeal_stock, ShardedHotdealStock):
+        if await hotdeal_stock.adjust(querier, product_id, quantity) is not None:
+            return None
+
+    # products.stock에서 차감했거나, 핫딜이 끝나 판매량으로 이미 반영된 수량
+    return await adjust_stock_in_transaction(querier, product_id, quantity)
+
+
+async def reserve_stock(
+    items: list[StockReservationItem], ttl_seconds: int | None = None
+) -> StockReservationResponse:
+    """재고를 차감하고 예약으로 보관 (ttl 안에 확정/취소되지 않으면 sweeper가 반환)
+
+    - 차감 전에 예약을 먼저 저장하여, 어느 단계에서 중단되어도 sweeper가 차감한 만큼만 반환
+    - 한 상품이라도 부족하면 예약을 취소하여 이미 차감한 상품을 되돌린 뒤 실패
+    """
+    ttl = min(ttl_seconds or settings.stock_reservation_ttl, settings.stock_reservation_max_ttl)
+    items = _merge_items(items)
+
+    reservation_id = uuid4()
+    expires_at = datetime.now(timezone.utc) + timedelta(seconds=ttl)
+    async with get_connection() as conn:
+        querier = AsyncQuerier(conn)
+        await querier.create_stock_reservation(
+            reservation_id=reservation_id,
+            product_ids=[item.product_id for item in items],
+            quantities=[item.quantity for item in items],
+            expires_at=expires_at,
+        )
+        await conn.commit()
+
+    try:
+        for item in items:
+            await _take(reservation_id, item)
+    except BaseException:
+        try:
+            await release_reservation(reservation_id)
+        except Exception as e:
+            # 예약 행이 남아 있으므로 만료 후 sweeper가 반환
+            logger.error(f"Stock reservation {reservation_id} rollback failed: {e}")
+        raise
+
+    return StockReservationResponse(
+        reservation_id=reservation_id, items=items, expires_at=expires_at
+    )
+
+
+async def commit_reservation(reservation_id: UUID) -> StockReservationResponse:
+    """예약 확정 (차감된 재고를 그대로 유지하고 예약만 삭제)"""
+    async with get_connection() as conn:
+        querier = AsyncQuerier(conn)
+        items = [
+            StockReservationItem(product_id=row.product_id, quantity=row.quantity)
+            async for row in querier.commit_stock_reservation(reservation_id=reservation_id)
+        ]
+        await conn.commit()
+
+    if not items:
+        raise ProductServiceError(
+            "RESERVATION_NOT_FOUND", "예약을 찾을 수 없거나 만료되었습니다.", 404
+        )
+    return StockReservationResponse(reservation_id=reservation_id, items=items)
+
+
+async def release_reservation(reservation_id: UUID) -> StockReservationResponse:
+    """예약 취소 (삭제와 재고 반환을 한 트랜잭션으로, 이미 확정/만료 처리되었으면 404)"""
+    async with get_connection() as conn:
+        querier = AsyncQuerier(conn)
+        rows = [
+            row async for row in querier.release_stock_reservation(reservation_id=reservation_id)
+        ]
+        adjusted = [
+            await _restore(querier, reservation_id, row.product_id, row.quantity, row.source)
+            for row in rows
+        ]
+        await conn.commit()
+
+    if not rows:
+        raise ProductServiceError(
+            "RESERVATION_NOT_FOUND", "예약을 찾을 수 없거나 만료되었습니다.", 404
+        )
+    for row in adjusted:
+        if row is not None:
+            await stock_adjusted(row)
+    return StockReservationResponse(
+        reservation_id=reservation_id,
+        items=[
+            StockReservationItem(product_id=row.product_id, quantity=row.quantity) for row in rows
+        ],
+    )
+
+
+async def sweep_expired_reservations() -> int:
+    """만료된 예약을 batch 단위로 삭제하고 같은 트랜잭션에서 재고 반환 (반환한 예약 항목 수)"""
+    swept = 0
+    while True:
+        async with get_connection() as conn:
+            querier = AsyncQuerier(conn)
+            rows = [
+                row
+                async for row in querier.delete_expired_stock_reservations(
+                    limit=settings.stock_reservation_sweep_batch
+                )
+            ]
+            adjusted = [
+                await _restore(
+                    querier, row.reservation_id, row.product_id, row.quantity, row.source
+                )
+                for row in rows
+            ]
+            await conn.commit()
+
+        for row in adjusted:
+            if row is not None:
+                await stock_adjusted(row)
+        swept += len(rows)
+        if len(rows) < settings.stock_reservation_sweep_batch:
+            return swept
+
+
+async def run_reservation_sweeper() -> None:
+    """lifespan 백그라운드 태스크"""
+    while True:
+        await asyncio.sleep(settings.stock_reservation_sweep_interval)
+        try:
+            swept = await sweep_expired_reservations()
+            if swept:
+                logger.info(f"Released {swept} expired stock reservation items")
+        except Exception as e:
+            logger.warning(f"Stock reservation sweep failed: {e}")
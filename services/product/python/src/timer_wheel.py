@@ -0,0 +1,63 @@
+import math
+from typing import Callable
+
+
+class TimerHandle:
+    """TimerWheel.schedule 반환값 (cancel로 실행 취소)"""
+
+    __slots__ = ("due", "callback", "cancelled")
+
+    def __init__(self, due: int, callback: Callable[[], None]):
+        self.due = due  # 만기 tick 번호
+        self.callback = callback
+        self.cancelled = False
+
+    def cancel(self) -> None:
+        self.cancelled = True
+
+
+class TimerWheel:
+    """해시 타이머 휠 (벽시계 기준)
+
+    - 시각을 tick 단위 번호로 바꿔 slots개의 슬롯에 나눠 담음 (due % slots)
+    - advance가 지난 tick의 슬롯만 확인하므로 등록/만기 처리가 전체 타이머 수와 무관
+    - 한 바퀴보다 먼 타이머는 슬롯에 남아 있다가 해당 바퀴에서 실행
+    - 실행 정밀도는 tick (만기 시각 이후 최대 tick 초 뒤에 실행)
+    """
+
+    def __init__(self, now: float, tick: float = 1.0, slots: int = 3600):
+        self.tick = tick
+        self._slots: list[list[TimerHandle]] = [[] for _ in range(slots)]
+        self._current = math.floor(now / tick)  # 처리 완료한 마지막 tick 번호
+
+    def schedule(self, at: float, callback: Callable[[], None]) -> TimerHandle | None:
+        """at(epoch 초)에 callback 실행 예약 (이미 지난 시각이면 즉시 실행하고 None 반환)"""
+        due = math.ceil(at / self.tick)
+        if due <= self._current:
+            callback()
+            return None
+        handle = TimerHandle(due, callback)
+        self._slots[due % len(self._slots)].append(handle)
+        return handle
+
+    def advance(self, now: float) -> int:
+        """now까지의 tick을 처리하고 실행한 타이머 수 반환"""
+        target = math.floor(now / self.tick)
+        # 오래 멈춰 있었다면 한 바퀴만 돌면 모든 슬롯을 확인하게 됨
+        start = max(self._current + 1, target - len(self._slots) + 1)
+        fired = 0
+        for tick in range(start, target + 1):
+            # 콜백 안에서 예약한 타이머가 이미 지나간 슬롯에 들어가지 않도록 먼저 갱신
+            self._current = tick
+            slot = self._slots[tick % len(self._slots)]
+            if not slot:
+                continue
+            due = [h for h in slot if h.due <= target]
+            if not due:
+                continue
+            slot[:] = [h for h in slot if h.due > target]
+            for handle in due:
+                if not handle.cancelled:
+                    handle.callback()
+                    fired += 1
+        return fired
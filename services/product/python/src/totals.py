@@ -0,0 +1,141 @@
+import asyncio
+import logging
+import time
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, NamedTuple
+
+from src.config import settings
+from src.database import get_connection
+from src.generated.query import AsyncQuerier
+
+logger = logging.getLogger(__name__)
+
+# cached 모드에서 보관하는 최대 범위(카테고리) 수
+_MAX_CACHED_SCOPES = 1_000
+
+
+class Total(NamedTuple):
+    """목록 total (approximate=True면 캐시/통계 기반 근사치)"""
+
+    count: int
+    approximate: bool = False
+
+
+# (querier, 범위) -> 개수 (범위는 카테고리, 전체는 None)
+CountQuery = Callable[[AsyncQuerier, str | None], Awaitable[int | None]]
+
+
+class TotalCounter:
+    """목록 total 계산 (모드별)
+
+    - exact: 매 요청 COUNT(*)
+    - cached: 프로세스 메모리에 저장한 COUNT(*) 결과를 반환
+      (cache_ttl이 지나면 이전 값을 반환하며 백그라운드 갱신)
+    - counter: 트리거로 유지되는 카운터 테이블 조회
+    - estimate: 플래너 통계 추정치 (통계가 없거나 최빈값에 없는 범위는 exact로 대체)
+    """
+
+    def __init__(
+        self,
+        mode: str,
+        exact: CountQuery,
+        counter: CountQuery | None = None,
+        estimate: CountQuery | None = None,
+        cache_ttl: float = 30.0,
+    ):
+        if (mode == "counter" and counter is None) or (mode == "estimate" and estimate is None):
+            raise ValueError(f"Unsupported total mode: {mode}")
+        self.mode = mode
+        self.cache_ttl = cache_ttl
+        self._exact = exact
+        self._counter = counter
+        self._estimate = estimate
+        self._cache: dict[str | None, tuple[float, int]] = {}
+        self._refresh_tasks: dict[str | None, asyncio.Task] = {}
+
+    async def count(self, querier: AsyncQuerier, scope: str | None = None) -> Total:
+        if self.mode == "counter":
+            return Total(await self._counter(querier, scope) or 0)
+        if self.mode == "cached":
+            return await self._cached(querier, scope)
+        if self.mode == "estimate":
+            estimate = await self._estimate(querier, scope)
+            if estimate is not None and estimate >= 0:
+                return Total(estimate, approximate=True)
+        return Total(await self._exact(querier, scope) or 0)
+
+    async def _cached(self, querier: AsyncQuerier, scope: str | None) -> Total:
+        cached = self._cache.get(scope)
+        if cached is None:
+            count = await self._exact(querier, scope) or 0
+            self._store(scope, count)
+            return Total(count)
+
+        loaded_at, count = cached
+        if time.monotonic() - loaded_at >= self.cache_ttl:
+            self._refresh_in_background(scope)
+        return Total(count, approximate=True)
+
+    def _store(self, scope: str | None, count: int) -> None:
+        if scope not in self._cache and len(self._cache) >= _MAX_CACHED_SCOPES:
+            self._cache.clear()
+        self._cache[scope] = (time.monotonic(), count)
+
+    def _refresh_in_background(self, scope: str | None) -> None:
+        if scope in self._refresh_tasks:
+            return
+
+        async def refresh():
+            try:
+                async with get_connection() as conn:
+                    count = await self._exact(AsyncQuerier(conn), scope)
+                self._store(scope, count or 0)
+            except Exception as e:
+                logger.warning(f"Background total refresh failed ({scope}): {e}")
+            finally:
+                del self._refresh_tasks[scope]
+
+        self._refresh_tasks[scope] = asyncio.create_task(refresh())
+
+
+# Product totals
+
+
+async def _count_products(querier: AsyncQuerier, category: str | None) -> int | None:
+    if category:
+        return await querier.count_products_by_category(category=category)
+    return await querier.count_products()
+
+
+async def _counted_products(querier: AsyncQuerier, category: str | None) -> int | None:
+    if category:
+        return await querier.get_product_count_by_category(category=category)
+    return await querier.get_product_count()
+
+
+async def _estimate_products(querier: AsyncQuerier, category: str | None) -> int | None:
+    if category:
+        return await querier.estimate_products_by_category(category=category)
+    return await querier.estimate_products()
+
+
+# Deal totals
+
+
+async def _count_active_deals(querier: AsyncQuerier, scope: str | None) -> int | None:
+    return await querier.count_active_deals(starts_at=datetime.now(timezone.utc))
+
+
+product_totals = TotalCounter(
+    settings.product_total_mode,
+    exact=_count_products,
+    counter=_counted_products,
+    estimate=_estimate_products,
+    cache_ttl=settings.total_cache_ttl,
+)
+
+deal_totals = TotalCounter(
+    settings.deal_total_mode,
+    exact=_count_active_deals,
+    cache_ttl=settings.total_cache_ttl,
+)
@@ -28,3 +28,12 @@ def auth_token(base_url):
     )
 
     return login_response.json()["access_token"]
+
+
+@pytest.fixture(scope="session")
+def admin_key():
+    """관리자 API 키 (Product Service의 ADMIN_API_KEY와 같은 값, 없으면 관리자 테스트 생략)"""
+    key = os.environ.get("ADMIN_API_KEY")
+    if not key:
+        pytest.skip("ADMIN_API_KEY가 설정되지 않아 관리자 API 테스트를 건너뜁니다.")
+    return key
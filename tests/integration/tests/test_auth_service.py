@@ -146,14 +146,47 @@ class TestLogin:
         self, playwright: Playwright, base_url: str
     ):
         api = playwright.request.new_context(base_url=base_url)
+        # 고정 이메일은 반복 실행 시 로그인 시도 제한에 걸리므로 매번 새 이메일 사용
+        unique_email = f"nonexistent_{uuid.uuid4().hex[:8]}@example.com"
 
         response = api.post(
             "/auth/login",
-            data={"email": "nonexistent@example.com", "password": "password123"},
+            data={"email": unique_email, "password": "password123"},
         )
 
         assert response.status == 401
 
+    def test_login_repeated_failures_returns_429(
+        self, playwright: Playwright, base_url: str
+    ):
+        api = playwright.request.new_context(base_url=base_url)
+        unique_email = f"test_{uuid.uuid4().hex[:8]}@example.com"
+
+        # 회원가입
+        api.post(
+            "/auth/register",
+            data={"email": unique_email, "password": "password123", "name": "user"},
+        )
+
+        # 이메일별 실패 한도(기본 5회)까지 잘못된 비밀번호로 로그인
+        for _ in range(5):
+            response = api.post(
+                "/auth/login",
+                data={"email": unique_email, "password": "wrongpassword"},
+            )
+            assert response.status == 401
+
+        # 한도 도달 후에는 올바른 비밀번호도 backoff(기본 30초) 동안 거부
+        response = api.post(
+            "/auth/login",
+            data={"email": unique_email, "password": "password123"},
+        )
+
+        assert response.status == 429
+        assert "retry-after" in response.headers
+        data = response.json()
+        assert data["error"] == "TOO_MANY_ATTEMPTS"
+
 
 class TestVerify:
     """GET /auth/verify"""
@@ -246,6 +279,54 @@ class TestRefresh:
         assert response.status == 401
 
 
+class TestLogout:
+    """POST /auth/logout"""
+
+    def test_logout_revokes_tokens(self, playwright: Playwright, base_url: str):
+        api = playwright.request.new_context(base_url=base_url)
+        unique_email = f"test_{uuid.uuid4().hex[:8]}@example.com"
+
+        # 회원가입 + 로그인
+        api.post(
+            "/auth/register",
+            data={"email": unique_email, "password": "password123", "name": "user"},
+        )
+        login_response = api.post(
+            "/auth/login",
+            data={"email": unique_email, "password": "password123"},
+        )
+        tokens = login_response.json()
+
+        # 로그아웃
+        response = api.post(
+            "/auth/logout",
+            headers={"Authorization": f"Bearer {tokens['access_token']}"},
+            data={"refresh_token": tokens["refresh_token"]},
+        )
+        assert response.status == 204
+
+        # 폐기된 액세스 토큰 검증 실패
+        response = api.get(
+            "/auth/verify",
+            headers={"Authorization": f"Bearer {tokens['access_token']}"},
+        )
+        assert response.status == 401
+
+        # 폐기된 리프레시 토큰으로 갱신 실패
+        response = api.post(
+            "/auth/refresh",
+            data={"refresh_token": tokens["refresh_token"]},
+        )
+        assert response.status == 401
+
+    def test_logout_no_token_returns_401(self, playwright: Playwright, base_url: str):
+        api = playwright.request.new_context(base_url=base_url)
+
+        response = api.post("/auth/logout")
+
+        assert response.status == 401
+
+
 class TestGetMe:
     """GET /auth/users/me"""
 
@@ -277,6 +358,31 @@ class TestGetMe:
         assert "id" in data
         assert "created_at" in data
 
+    def test_update_me_reflected_in_get_me(self, playwright: Playwright, base_url: str):
+        api = playwright.request.new_context(base_url=base_url)
+        unique_email = f"test_{uuid.uuid4().hex[:8]}@example.com"
+
+        # 회원가입 + 로그인
+        api.post(
+            "/auth/register",
+            data={"email": unique_email, "password": "password123", "name": "before"},
+        )
+        login_response = api.post(
+            "/auth/login",
+            data={"email": unique_email, "password": "password123"},
+        )
+        headers = {"Authorization": f"Bearer {login_response.json()['access_token']}"}
+
+        # 이름 변경 (사용자 캐시 무효화)
+        response = api.patch("/auth/users/me", headers=headers, data={"name": "after"})
+        assert response.status == 200
+        assert response.json()["name"] == "after"
+
+        # 변경된 정보 조회
+        response = api.get("/auth/users/me", headers=headers)
+        assert response.status == 200
+        assert response.json()["name"] == "after"
+
     def test_get_me_no_token_returns_401(self, playwright: Playwright, base_url: str):
         api = playwright.request.new_context(base_url=base_url)
 
@@ -5,10 +5,27 @@ API Spec 기반 테스트 - Gateway를 통해 서비스에 접근
 참조: api-spec/product-service.v1.yaml
 """
 
+import time
 import uuid
 from datetime import datetime, timedelta, timezone
 
-from playwright.sync_api import Playwright
+import pytest
+from playwright.sync_api import APIRequestContext, Playwright
+
+
+def create_product(api: APIRequestContext, auth_token: str, name: str, stock: int) -> str:
+    """테스트용 상품 생성 후 ID 반환"""
+    response = api.post(
+        "/products",
+        data={"name": name, "price": 1000, "stock": stock},
+        headers={"Authorization": f"Bearer {auth_token}"},
+    )
+    assert response.status == 201
+    return response.json()["id"]
+
+
+def get_stock(api: APIRequestContext, product_id: str) -> int:
+    return api.get(f"/products/{product_id}/stock").json()["stock"]
 
 
 class TestHealthCheck:
@@ -145,6 +162,32 @@ class TestProductCRUD:
         for item in data["items"]:
             assert item["category"] == unique_category
 
+    def test_list_products_by_ids(self, playwright: Playwright, base_url: str, auth_token: str):
+        """ID 목록으로 상품 조회 (요청 순서대로, 없는 ID는 제외)"""
+        api = playwright.request.new_context(base_url=base_url)
+        first_id = create_product(api, auth_token, "ID 조회 1", 10)
+        second_id = create_product(api, auth_token, "ID 조회 2", 20)
+        missing_id = str(uuid.uuid4())
+
+        response = api.get(f"/products?ids={second_id},{missing_id},{first_id}")
+
+        assert response.status == 200
+        data = response.json()
+        assert [item["id"] for item in data["items"]] == [second_id, first_id]
+        assert data["total"] == 2
+        assert data["items"][0]["stock"] == 20
+
+    def test_list_products_by_invalid_ids_returns_400(
+        self, playwright: Playwright, base_url: str
+    ):
+        """유효하지 않은 ID가 포함되면 400"""
+        api = playwright.request.new_context(base_url=base_url)
+
+        response = api.get(f"/products?ids={uuid.uuid4()},not-a-uuid")
+
+        assert response.status == 400
+        assert response.json()["error"] == "INVALID_ID"
+
     def test_update_product_success(
         self, playwright: Playwright, base_url: str, auth_token: str
     ):
@@ -271,6 +314,93 @@ class TestStock:
         assert data["error"] == "INSUFFICIENT_STOCK"
 
 
+class TestStockReservation:
+    """재고 예약 테스트"""
+
+    def test_reserve_and_commit(self, playwright: Playwright, base_url: str, auth_token: str):
+        """예약 시 재고 차감, 확정 후에도 유지"""
+        api = playwright.request.new_context(base_url=base_url)
+        product_id = create_product(api, auth_token, "예약 확정 테스트", 100)
+
+        response = api.post(
+            "/products/reservations",
+            data={"items": [{"product_id": product_id, "quantity": 10}]},
+        )
+
+        assert response.status == 201
+        data = response.json()
+        assert data["items"] == [{"product_id": product_id, "quantity": 10}]
+        assert data["expires_at"] is not None
+        assert get_stock(api, product_id) == 90
+
+        reservation_id = data["reservation_id"]
+        response = api.post(f"/products/reservations/{reservation_id}/commit")
+
+        assert response.status == 200
+        assert response.json()["reservation_id"] == reservation_id
+        assert get_stock(api, product_id) == 90
+
+        # 확정된 예약은 다시 확정/취소할 수 없음
+        response = api.post(f"/products/reservations/{reservation_id}/release")
+
+        assert response.status == 404
+        assert response.json()["error"] == "RESERVATION_NOT_FOUND"
+        assert get_stock(api, product_id) == 90
+
+    def test_reserve_and_release(self, playwright: Playwright, base_url: str, auth_token: str):
+        """예약 취소 시 재고 반환 (한 번만)"""
+        api = playwright.request.new_context(base_url=base_url)
+        product_id = create_product(api, auth_token, "예약 취소 테스트", 100)
+
+        reservation_id = api.post(
+            "/products/reservations",
+            data={"items": [{"product_id": product_id, "quantity": 30}]},
+        ).json()["reservation_id"]
+        assert get_stock(api, product_id) == 70
+
+        response = api.post(f"/products/reservations/{reservation_id}/release")
+
+        assert response.status == 200
+        assert get_stock(api, product_id) == 100
+
+        response = api.post(f"/products/reservations/{reservation_id}/release")
+
+        assert response.status == 404
+        assert get_stock(api, product_id) == 100
+
+    def test_reserve_insufficient_restores_other_items(
+        self, playwright: Playwright, base_url: str, auth_token: str
+    ):
+        """한 항목이라도 재고가 부족하면 400, 이미 차감한 항목도 되돌림"""
+        api = playwright.request.new_context(base_url=base_url)
+        enough_id = create_product(api, auth_token, "예약 충분 테스트", 100)
+        short_id = create_product(api, auth_token, "예약 부족 테스트", 5)
+
+        response = api.post(
+            "/products/reservations",
+            data={
+                "items": [
+                    {"product_id": enough_id, "quantity": 10},
+                    {"product_id": short_id, "quantity": 10},
+                ]
+            },
+        )
+
+        assert response.status == 400
+        assert response.json()["error"] == "INSUFFICIENT_STOCK"
+        assert get_stock(api, enough_id) == 100
+        assert get_stock(api, short_id) == 5
+
+    def test_commit_unknown_reservation_returns_404(self, playwright: Playwright, base_url: str):
+        """존재하지 않는 예약 확정 시 404"""
+        api = playwright.request.new_context(base_url=base_url)
+
+        response = api.post(f"/products/reservations/{uuid.uuid4()}/commit")
+
+        assert response.status == 404
+        assert response.json()["error"] == "RESERVATION_NOT_FOUND"
+
+
 class TestDeals:
     """핫딜 테스트"""
 
@@ -395,3 +525,255 @@ class TestDeals:
         assert response.status == 404
         data = response.json()
         assert data["error"] == "NOT_FOUND"
+
+    def test_list_deals_by_ids(self, playwright: Playwright, base_url: str, auth_token: str):
+        """ID 목록으로 핫딜 조회 (없는 ID는 제외)"""
+        api = playwright.request.new_context(base_url=base_url)
+        product_id = create_product(api, auth_token, "핫딜 ID 조회 상품", 100)
+
+        now = datetime.now(timezone.utc)
+        deal_id = api.post(
+            "/products/deals",
+            data={
+                "product_id": product_id,
+                "deal_price": 500,
+                "deal_stock": 10,
+                "starts_at": (now - timedelta(minutes=5)).isoformat(),
+                "ends_at": (now + timedelta(hours=1)).isoformat(),
+            },
+            headers={"Authorization": f"Bearer {auth_token}"},
+        ).json()["id"]
+
+        response = api.get(f"/products/deals?ids={uuid.uuid4()},{deal_id}")
+
+        assert response.status == 200
+        data = response.json()
+        assert [item["id"] for item in data["items"]] == [deal_id]
+        assert data["total"] == 1
+
+
+class TestHotdeal:
+    """핫딜 시작/종료 테스트 (HOTDEAL_STOCK_REDIS 또는 HOTDEAL_STOCK_SHARDS 필요)"""
+
+    def start_hotdeal(self, api: APIRequestContext, product_id: str):
+        response = api.post(f"/products/{product_id}/hotdeal/start")
+        if response.status == 400 and response.json()["error"] == "HOTDEAL_DISABLED":
+            pytest.skip("핫딜 재고 저장소가 비활성화되어 있습니다.")
+        return response
+
+    def test_start_and_end_hotdeal(self, playwright: Playwright, base_url: str, auth_token: str):
+        """진행 중 재고 증감은 핫딜 재고에 반영되고, 종료 시 판매량이 상품 재고에 반영"""
+        api = playwright.request.new_context(base_url=base_url)
+        product_id = create_product(api, auth_token, "핫딜 시작 테스트", 100)
+
+        response = self.start_hotdeal(api, product_id)
+
+        assert response.status == 200
+        data = response.json()
+        assert data["product_id"] == product_id
+        assert data["stock"] == 100
+
+        response = api.patch(
+            f"/products/{product_id}/stock",
+            data={"delta": -30},
+            headers={"Authorization": f"Bearer {auth_token}"},
+        )
+        assert response.status == 200
+        assert response.json()["stock"] == 70
+
+        response = api.post(f"/products/{product_id}/hotdeal/end")
+
+        assert response.status == 200
+        assert response.json()["stock"] == 70
+        assert get_stock(api, product_id) == 70
+
+    def test_start_twice_returns_409(self, playwright: Playwright, base_url: str, auth_token: str):
+        """이미 진행 중인 핫딜을 다시 시작하면 409"""
+        api = playwright.request.new_context(base_url=base_url)
+        product_id = create_product(api, auth_token, "핫딜 중복 시작 테스트", 10)
+        assert self.start_hotdeal(api, product_id).status == 200
+
+        response = api.post(f"/products/{product_id}/hotdeal/start")
+
+        assert response.status == 409
+        assert response.json()["error"] == "HOTDEAL_ALREADY_STARTED"
+        api.post(f"/products/{product_id}/hotdeal/end")
+
+    def test_end_twice_settles_once(
+        self, playwright: Playwright, base_url: str, auth_token: str
+    ):
+        """종료를 반복해도 판매량은 한 번만 반영되고, 두 번째 종료는 404"""
+        api = playwright.request.new_context(base_url=base_url)
+        product_id = create_product(api, auth_token, "핫딜 중복 종료 테스트", 50)
+        assert self.start_hotdeal(api, product_id).status == 200
+        api.patch(
+            f"/products/{product_id}/stock",
+            data={"delta": -20},
+            headers={"Authorization": f"Bearer {auth_token}"},
+        )
+
+        assert api.post(f"/products/{product_id}/hotdeal/end").status == 200
+        response = api.post(f"/products/{product_id}/hotdeal/end")
+
+        assert response.status == 404
+        assert get_stock(api, product_id) == 30
+
+    def test_hotdeal_limited_to_deal_remaining_stock(
+        self, playwright: Playwright, base_url: str, auth_token: str
+    ):
+        """진행 중인 핫딜이 있으면 핫딜 남은 재고까지만 판매하고, 종료 시 남은 재고 반영"""
+        api = playwright.request.new_context(base_url=base_url)
+        product_id = create_product(api, auth_token, "핫딜 한도 테스트", 100)
+
+        now = datetime.now(timezone.utc)
+        deal_id = api.post(
+            "/products/deals",
+            data={
+                "product_id": product_id,
+                "deal_price": 500,
+                "deal_stock": 10,
+                "starts_at": (now - timedelta(minutes=5)).isoformat(),
+                "ends_at": (now + timedelta(hours=1)).isoformat(),
+            },
+            headers={"Authorization": f"Bearer {auth_token}"},
+        ).json()["id"]
+
+        response = self.start_hotdeal(api, product_id)
+        assert response.status == 200
+        assert response.json()["deal_id"] == deal_id
+        assert response.json()["stock"] == 10
+
+        response = api.patch(
+            f"/products/{product_id}/stock",
+            data={"delta": -11},
+            headers={"Authorization": f"Bearer {auth_token}"},
+        )
+        assert response.status == 400
+        assert response.json()["error"] == "INSUFFICIENT_STOCK"
+
+        api.patch(
+            f"/products/{product_id}/stock",
+            data={"delta": -4},
+            headers={"Authorization": f"Bearer {auth_token}"},
+        )
+        assert api.post(f"/products/{product_id}/hotdeal/end").status == 200
+
+        assert get_stock(api, product_id) == 96
+        assert api.get(f"/products/deals/{deal_id}").json()["remaining_stock"] == 6
+
+    def test_end_without_hotdeal_returns_404(
+        self, playwright: Playwright, base_url: str, auth_token: str
+    ):
+        """진행 중인 핫딜이 없으면 404"""
+        api = playwright.request.new_context(base_url=base_url)
+        product_id = create_product(api, auth_token, "핫딜 없음 테스트", 10)
+
+        response = api.post(f"/products/{product_id}/hotdeal/end")
+
+        if response.status == 400 and response.json()["error"] == "HOTDEAL_DISABLED":
+            pytest.skip("핫딜 재고 저장소가 비활성화되어 있습니다.")
+        assert response.status == 404
+
+
+class TestProductImport:
+    """상품 대량 등록 테스트 (ADMIN_API_KEY 필요)"""
+
+    def wait_for_job(self, api: APIRequestContext, job_id: str, admin_key: str) -> dict:
+        for _ in range(50):
+            job = api.get(
+                f"/products/admin/imports/{job_id}", headers={"X-Admin-Key": admin_key}
+            ).json()
+            if job["status"] != "running":
+                return job
+            time.sleep(0.2)
+        raise AssertionError(f"작업이 끝나지 않았습니다: {job}")
+
+    def test_import_ndjson(self, playwright: Playwright, base_url: str, admin_key: str):
+        """NDJSON 대량 등록, 잘못된 행은 행 번호와 함께 오류로 보고"""
+        api = playwright.request.new_context(base_url=base_url)
+        category = f"import_{uuid.uuid4().hex[:8]}"
+        body = "\n".join(
+            [
+                f'{{"name": "대량 등록 1", "price": 1000, "stock": 10, "category": "{category}"}}',
+                '{"name": "가격 없음", "stock": 10}',
+                f'{{"name": "대량 등록 2", "price": 2000, "stock": 20, "category": "{category}"}}',
+            ]
+        )
+
+        response = api.post(
+            "/products/admin/imports",
+            data=body,
+            headers={"X-Admin-Key": admin_key, "Content-Type": "application/x-ndjson"},
+        )
+
+        assert response.status == 202
+        data = response.json()
+        assert data["format"] == "ndjson"
+
+        job = self.wait_for_job(api, data["id"], admin_key)
+        assert job["status"] == "completed"
+        assert job["processed"] == 3
+        assert job["created"] == 2
+        assert job["failed"] == 1
+        assert job["errors"][0]["line"] == 2
+        assert job["finished_at"] is not None
+
+        products = api.get(f"/products?category={category}").json()
+        assert products["total"] == 2
+
+    def test_import_csv(self, playwright: Playwright, base_url: str, admin_key: str):
+        """CSV 대량 등록"""
+        api = playwright.request.new_context(base_url=base_url)
+        category = f"import_{uuid.uuid4().hex[:8]}"
+
+        response = api.post(
+            "/products/admin/imports",
+            data=f"name,price,stock,category\nCSV 상품,3000,30,{category}\n",
+            headers={"X-Admin-Key": admin_key, "Content-Type": "text/csv"},
+        )
+
+        assert response.status == 202
+        job = self.wait_for_job(api, response.json()["id"], admin_key)
+        assert job["status"] == "completed"
+        assert job["created"] == 1
+
+    def test_import_with_wrong_key_returns_403(
+        self, playwright: Playwright, base_url: str, admin_key: str
+    ):
+        """관리자 키가 다르면 403"""
+        api = playwright.request.new_context(base_url=base_url)
+
+        response = api.post(
+            "/products/admin/imports",
+            data='{"name": "권한 없음", "price": 1000, "stock": 1}',
+            headers={"X-Admin-Key": f"{admin_key}-wrong", "Content-Type": "application/x-ndjson"},
+        )
+
+        assert response.status == 403
+        assert response.json()["error"] == "FORBIDDEN"
+
+    def test_import_unsupported_format_returns_415(
+        self, playwright: Playwright, base_url: str, admin_key: str
+    ):
+        """지원하지 않는 본문 형식이면 415"""
+        api = playwright.request.new_context(base_url=base_url)
+
+        response = api.post(
+            "/products/admin/imports",
+            data="<products/>",
+            headers={"X-Admin-Key": admin_key, "Content-Type": "application/xml"},
+        )
+
+        assert response.status == 415
+
+    def test_get_unknown_import_job_returns_404(
+        self, playwright: Playwright, base_url: str, admin_key: str
+    ):
+        """존재하지 않는 작업 조회 시 404"""
+        api = playwright.request.new_context(base_url=base_url)
+
+        response = api.get(
+            f"/products/admin/imports/{uuid.uuid4()}", headers={"X-Admin-Key": admin_key}
+        )
+
+        assert response.status == 404
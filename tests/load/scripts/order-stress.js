@@ -28,6 +28,8 @@ const MAX_VUS = parseInt(__ENV.MAX_VUS) || 50;
 const RAMP_DURATION = __ENV.RAMP_DURATION || '30s';
 const HOLD_DURATION = __ENV.HOLD_DURATION || '60s';
 const NUM_USERS = parseInt(__ENV.NUM_USERS) || 50;
+// 설정 시 사용자를 /auth/admin/users/bulk로 한 번에 등록 (Auth 서비스의 ADMIN_API_KEY와 동일해야 함)
+const ADMIN_API_KEY = __ENV.ADMIN_API_KEY || '';
 
 export const options = {
   scenarios: {
@@ -59,24 +61,45 @@ export function setup() {
 
   // 테스트용 사용자 생성
   console.log(`${NUM_USERS}명의 테스트 사용자 생성 중...`);
-  for (let i = 0; i < NUM_USERS; i++) {
-    const email = `ordertest_${timestamp}_${i}@test.com`;
-    const password = 'test1234!';
-
-    // 회원가입
-    const registerRes = http.post(
-      `${BASE_URL}/auth/register`,
-      JSON.stringify({
-        email: email,
-        password: password,
-        name: `Order Test User ${i}`,
-      }),
-      { headers: { 'Content-Type': 'application/json' } }
-    );
+  const password = 'test1234!';
+  const emailOf = (i) => `ordertest_${timestamp}_${i}@test.com`;
+
+  if (ADMIN_API_KEY) {
+    // 일괄 등록 (NDJSON, 한 줄에 사용자 한 명)
+    const lines = [];
+    for (let i = 0; i < NUM_USERS; i++) {
+      lines.push(JSON.stringify({ email: emailOf(i), password, name: `Order Test User ${i}` }));
+    }
+    const bulkRes = http.post(`${BASE_URL}/auth/admin/users/bulk`, lines.join('\n'), {
+      headers: { 'Content-Type': 'application/x-ndjson', 'X-Admin-Key': ADMIN_API_KEY },
+      timeout: '300s',
+    });
+    if (bulkRes.status !== 200) {
+      console.error(`일괄 회원가입 실패: ${bulkRes.status}`);
+    } else {
+      console.log(`일괄 회원가입 완료: ${JSON.parse(bulkRes.body).created}명`);
+    }
+  }
 
-    if (registerRes.status !== 201 && registerRes.status !== 200) {
-      console.error(`사용자 ${i} 회원가입 실패: ${registerRes.status}`);
-      continue;
+  for (let i = 0; i < NUM_USERS; i++) {
+    const email = emailOf(i);
+
+    if (!ADMIN_API_KEY) {
+      // 회원가입
+      const registerRes = http.post(
+        `${BASE_URL}/auth/register`,
+        JSON.stringify({
+          email: email,
+          password: password,
+          name: `Order Test User ${i}`,
+        }),
+        { headers: { 'Content-Type': 'application/json' } }
+      );
+
+      if (registerRes.status !== 201 && registerRes.status !== 200) {
+        console.error(`사용자 ${i} 회원가입 실패: ${registerRes.status}`);
+        continue;
+      }
     }
 
     // 로그인